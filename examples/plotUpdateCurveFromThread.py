@@ -30,13 +30,16 @@ asynchronously in the main thread.
 In this example, this is achieved with
 :func:`~silx.gui.utils.concurrent.submitToQtMainThread`.
 
-In this example a thread calls submitToQtMainThread to update the curve
-of a plot.
+In this example a thread calls submitToQtMainThread to append points to
+the curve of a plot.
+The curve only keeps the last 1000 points (see
+:meth:`~silx.gui.plot.items.Curve.setAppendBufferCapacity`), so that the
+cost of an update only depends on the number of appended points.
 """
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "05/09/2017"
+__date__ = "16/10/2026"
 
 
 import threading
@@ -47,7 +50,7 @@ import numpy
 from silx.gui import qt
 from silx.gui.utils import concurrent
 
-from silx.gui.plot import Plot1D
+from silx.gui.plot import Plot1D, items
 
 
 class UpdateThread(threading.Thread):
@@ -57,6 +60,9 @@ class UpdateThread(threading.Thread):
 
     def __init__(self, plot1d):
         self.plot1d = plot1d
+        self.curve = items.Curve()
+        self.curve.setAppendBufferCapacity(1000, rolling=True)
+        plot1d.addItem(self.curve)
         self.running = False
         super(UpdateThread, self).__init__()
 
@@ -67,14 +73,13 @@ class UpdateThread(threading.Thread):
 
     def run(self):
         """Method implementing thread loop that updates the plot"""
+        index = 0
         while self.running:
-            time.sleep(1)
+            time.sleep(0.1)
             # Run plot update asynchronously
             concurrent.submitToQtMainThread(
-                self.plot1d.addCurve,
-                numpy.arange(1000),
-                numpy.random.random(1000),
-                resetzoom=False)
+                self.curve.appendData, index, numpy.random.random())
+            index += 1
 
     def stop(self):
         """Stop the update thread"""
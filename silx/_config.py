@@ -146,3 +146,61 @@ class Config(object):
 
     .. versionadded:: 0.10
     """
+
+    DEFAULT_SPECFILE_INDEX_CACHE = False
+    """Default location of the scan index cache of SPEC files.
+
+    It will have an influence on :class:`silx.io.specfile.SpecFile` and
+    :class:`silx.io.spech5.SpecH5`.
+
+    This attribute can be set with:
+
+    - False (default) to disable the index cache.
+    - True to store the index in a file next to the SPEC file.
+    - The path of a directory where to store index files.
+
+    .. versionadded:: 0.15
+    """
+
+    DEFAULT_OPENCL_PROGRAM_CACHE_DIR = None
+    """Default directory where the binaries of OpenCL programs are stored.
+
+    It will have an influence on :class:`silx.opencl.processing.OpenclProcessing`
+    and all the OpenCL processing classes, which then load the binaries of
+    their programs from this directory instead of compiling them.
+
+    This attribute can be set with:
+
+    - None (default) to only keep compiled programs in memory.
+    - The path of a directory where to store binaries.
+
+    .. versionadded:: 0.15
+    """
+
+    DEFAULT_OPENCL_MEMORY_POOL = False
+    """Whether OpenCL processing allocates device memory from a shared pool.
+
+    When True, buffers and textures of
+    :class:`silx.opencl.processing.OpenclProcessing` instances and arrays of
+    the OpenCL FFT backend are taken from the
+    :class:`silx.opencl.processing.MemoryPool` of their context, and given
+    back to it when released, to be reused by the next allocations.
+
+    .. versionadded:: 0.15
+    """
+
+    DEFAULT_FFTW_WISDOM_FILE = None
+    """Default file where FFTW wisdom is stored.
+
+    It will have an influence on :class:`silx.math.fft.fftw.FFTW`: the wisdom
+    is loaded from this file before creating the first plan and the file is
+    updated each time new transforms are measured, so that the next
+    processes create their plans without measuring them again.
+
+    This attribute can be set with:
+
+    - None (default) to only keep wisdom in memory.
+    - The path of a file where to store the wisdom.
+
+    .. versionadded:: 0.15
+    """
@@ -281,6 +281,14 @@ def main(argv):
         '--fletcher32',
         action="store_true",
         help='Adds a checksum to each chunk to detect data corruption.')
+    parser.add_argument(
+        '--workers',
+        type=int,
+        nargs="?",
+        const=0,
+        help='Parse SPEC files with multiple processes, or read the headers '
+             'of image file series with multiple threads. If this option is '
+             'specified without argument, one process per CPU is used.')
     parser.add_argument(
         '--debug',
         action="store_true",
@@ -462,7 +470,8 @@ def main(argv):
             not contains_specfile(options.input_files) and
             not options.add_root_group) or options.file_pattern is not None:
         # File series -> stack of images
-        input_group = fabioh5.File(file_series=options.input_files)
+        input_group = fabioh5.File(file_series=options.input_files,
+                                   workers=options.workers)
         if hdf5_path != "/":
             # we want to append only data and headers to an existing file
             input_group = input_group["/scan_0/instrument/detector_0"]
@@ -482,6 +491,10 @@ def main(argv):
             hdf5_path_for_file = hdf5_path
             if options.add_root_group:
                 hdf5_path_for_file = hdf5_path.rstrip("/") + "/" + os.path.basename(input_name)
+            if options.workers is not None and is_specfile(input_name):
+                # Parsed by worker processes in write_to_h5
+                h5paths_and_groups.append((hdf5_path_for_file, input_name))
+                continue
             try:
                 h5paths_and_groups.append((hdf5_path_for_file,
                                            silx.io.open(input_name)))
@@ -499,7 +512,8 @@ def main(argv):
                             h5path=hdf5_path_for_file,
                             overwrite_data=options.overwrite_data,
                             create_dataset_args=create_dataset_args,
-                            min_size=options.min_size)
+                            min_size=options.min_size,
+                            workers=options.workers)
 
     else:
         # multiple file, SPEC and fabio images mixed
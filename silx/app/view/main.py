@@ -68,6 +68,12 @@ def createParser():
         action="store_true",
         default=False,
         help='Start the application with HDF5 file locking enabled (it is disabled by default)')
+    parser.add_argument(
+        '--specfile-index-cache',
+        dest="specfile_index_cache",
+        default=None,
+        metavar="DIRECTORY",
+        help='Directory where to cache the scan index of SPEC files to speed-up reopening them')
     return parser
 
 
@@ -101,6 +107,9 @@ def mainQt(options):
 
     import silx
     import silx.utils.files
+
+    if options.specfile_index_cache is not None:
+        silx.config.DEFAULT_SPECFILE_INDEX_CACHE = options.specfile_index_cache
     from silx.gui import qt
     # Make sure matplotlib is configured
     # Needed for Debian 8: compatibility between Qt4/Qt5 and old matplotlib
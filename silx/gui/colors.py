@@ -34,11 +34,11 @@ __date__ = "29/01/2019"
 import numpy
 import logging
 import collections
-import warnings
 
 from silx.gui import qt
 from silx.gui.utils import blockSignals
-from silx.math.combo import min_max
+from silx.math.combo import min_max, statistics
+from silx.math.histogram import Histogramnd
 from silx.math import colormap as _colormap
 from silx.utils.exceptions import NotEditableError
 from silx.utils import deprecation
@@ -332,6 +332,66 @@ def _getColormap(name):
     return _COLORMAP_CACHE[name]
 
 
+class _DataSummary:
+    """Statistics and histogram of data used by percentile autoscale.
+
+    Values are taken in the space returned by
+    :meth:`_NormalizationMixIn._getHistogramValues`, infinite values are
+    ignored and the histogram edges are converted back to data values.
+
+    :param numpy.ndarray data:
+    :param _NormalizationMixIn normalization:
+    :param int nbins: Number of bins of the histogram
+    """
+
+    def __init__(self, data, normalization, nbins):
+        values, revert = normalization._getHistogramValues(data)
+        values = numpy.ravel(values)
+        if values.dtype not in (numpy.float32, numpy.float64):
+            values = values.astype(numpy.float64)
+        values = values[numpy.isfinite(values)]
+
+        self.statistics = statistics(values) if values.size > 0 else None
+        """Result of :func:`silx.math.combo.statistics` or None if empty"""
+
+        self.histogram = None
+        """(counts, edges) or None if data is empty or constant"""
+        if (self.statistics is not None and
+                self.statistics.minimum < self.statistics.maximum):
+            counts, _, edges = Histogramnd(
+                values,
+                histo_range=(self.statistics.minimum, self.statistics.maximum),
+                n_bins=nbins,
+                last_bin_closed=True)
+            self.histogram = counts, revert(edges[0])
+
+    def getPercentiles(self, percentiles):
+        """Returns percentiles estimated from the histogram.
+
+        :param List[float] percentiles: Percentiles in [0, 100]
+        :rtype: Union[List[float],None]
+        """
+        if self.histogram is None:
+            return None
+        return _histogramPercentiles(*self.histogram, percentiles)
+
+
+def _histogramPercentiles(counts, edges, percentiles):
+    """Returns percentiles estimated from an histogram.
+
+    Values are linearly interpolated within bins.
+
+    :param numpy.ndarray counts: The histogram
+    :param numpy.ndarray edges: The N+1 bin edges
+    :param List[float] percentiles: Percentiles in [0, 100]
+    :rtype: List[float]
+    """
+    cumsum = numpy.zeros(len(counts) + 1, dtype=numpy.float64)
+    numpy.cumsum(counts, out=cumsum[1:])
+    targets = numpy.array(percentiles, dtype=numpy.float64) / 100. * cumsum[-1]
+    return numpy.interp(targets, cumsum, edges).tolist()
+
+
 # Normalizations
 
 class _NormalizationMixIn:
@@ -353,11 +413,14 @@ class _NormalizationMixIn:
         else:
             return True
 
-    def autoscale(self, data, mode):
+    def autoscale(self, data, mode, summaries=None):
         """Returns range for given data and autoscale mode.
 
         :param Union[None,numpy.ndarray] data:
         :param str mode: Autoscale mode, see :class:`Colormap`
+        :param Union[None,dict] summaries:
+            Cache of data summaries to use and fill-up
+            (See :meth:`autoscalePercentiles`).
         :returns: Range as (min, max)
         :rtype: Tuple[float,float]
         """
@@ -384,6 +447,10 @@ class _NormalizationMixIn:
             else:
                 vmax = min(dmax, stdmax)
 
+        elif mode in Colormap._PERCENTILES:
+            vmin, vmax = self.autoscalePercentiles(
+                data, Colormap._PERCENTILES[mode], summaries)
+
         else:
             raise ValueError('Unsupported mode: %s' % mode)
 
@@ -427,14 +494,51 @@ class _NormalizationMixIn:
         if normdata.size == 0:  # Fallback
             return None, None
 
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore', category=RuntimeWarning)
-            # Ignore nanmean "Mean of empty slice" warning and
-            # nanstd "Degrees of freedom <= 0 for slice" warning
-            mean, std = numpy.nanmean(normdata), numpy.nanstd(normdata)
+        stats = statistics(normdata)
+        mean, std = stats.mean, stats.std
 
         return self.revert(mean - 3 * std, 0., 1.), self.revert(mean + 3 * std, 0., 1.)
 
+    HISTOGRAM_NBINS = 1024
+    """Number of bins of the histogram used for percentile autoscale"""
+
+    def _getHistogramValues(self, data):
+        """Returns the values from which to compute the histogram.
+
+        This implementation only works for normalization that do NOT
+        use the data range.
+
+        :param numpy.ndarray data:
+        :returns: (values, revert) with revert a callable converting
+            histogram values back to data values.
+        """
+        values = data[self.isValid(data)]
+        return self.apply(values, 0., 1.), lambda v: self.revert(v, 0., 1.)
+
+    def autoscalePercentiles(self, data, percentiles, summaries=None):
+        """Autoscale using percentiles estimated from an histogram
+
+        :param numpy.ndarray data:
+        :param Tuple[float,float] percentiles: (lower, upper) in [0, 100]
+        :param Union[None,dict] summaries:
+            Cache of data summaries per normalization, which must be
+            cleared when data changes. Default: None, no cache.
+        :returns: (vmin, vmax)
+        :rtype: Tuple[float,float]
+        """
+        key = type(self)
+        summary = None if summaries is None else summaries.get(key)
+        if summary is None:
+            summary = _DataSummary(data, self, self.HISTOGRAM_NBINS)
+            if summaries is not None:
+                summaries[key] = summary
+
+        result = summary.getPercentiles(percentiles)
+        if result is None:  # Empty or constant data: use min/max
+            return self.autoscaleMinMax(data)
+        vmin, vmax = result
+        return vmin, vmax
+
 
 class _LinearNormalizationMixIn(_NormalizationMixIn):
     """Colormap normalization mix-in class specific to autoscale taken from initial range"""
@@ -453,13 +557,18 @@ class _LinearNormalizationMixIn(_NormalizationMixIn):
             data[numpy.isfinite(data) == False] = numpy.nan
         if data.size == 0:  # Fallback
             return None, None
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore', category=RuntimeWarning)
-            # Ignore nanmean "Mean of empty slice" warning and
-            # nanstd "Degrees of freedom <= 0 for slice" warning
-            mean, std = numpy.nanmean(data), numpy.nanstd(data)
+        stats = statistics(data)
+        mean, std = stats.mean, stats.std
         return mean - 3 * std, mean + 3 * std
 
+    def _getHistogramValues(self, data):
+        """Histogram is computed on the data itself, not the normalized data.
+
+        :param numpy.ndarray data:
+        :returns: (values, revert)
+        """
+        return data[self.isValid(data)], lambda v: v
+
 
 class _LinearNormalization(_colormap.LinearNormalization, _LinearNormalizationMixIn):
     """Linear normalization"""
@@ -568,7 +677,16 @@ class Colormap(qt.QObject):
     """constant for autoscale using mean +/- 3*std(data)
     with a clamp on min/max of the data"""
 
-    AUTOSCALE_MODES = (MINMAX, STDDEV3)
+    PERCENTILE_1_99 = 'percentile_1_99'
+    """constant for autoscale using 1st and 99th percentiles of the data"""
+
+    PERCENTILE_5_95 = 'percentile_5_95'
+    """constant for autoscale using 5th and 95th percentiles of the data"""
+
+    _PERCENTILES = {PERCENTILE_1_99: (1., 99.), PERCENTILE_5_95: (5., 95.)}
+    """Mapping of percentile autoscale modes to percentiles"""
+
+    AUTOSCALE_MODES = (MINMAX, STDDEV3, PERCENTILE_1_99, PERCENTILE_5_95)
     """Tuple of managed auto scale algorithms"""
 
     sigChanged = qt.Signal()
@@ -891,14 +1009,16 @@ class Colormap(qt.QObject):
         else:
             return self._BASIC_NORMALIZATIONS[normalization]
 
-    def _computeAutoscaleRange(self, data):
+    def _computeAutoscaleRange(self, data, summaries=None):
         """Compute the data range which will be used in autoscale mode.
 
         :param numpy.ndarray data: The data for which to compute the range
+        :param Union[None,dict] summaries:
+            Cache of summaries of data, which must be cleared when data changes
         :return: (vmin, vmax) range
         """
         return self._getNormalizer().autoscale(
-            data, mode=self.getAutoscaleMode())
+            data, mode=self.getAutoscaleMode(), summaries=summaries)
 
     def getColormapRange(self, data=None):
         """Return (vmin, vmax) the range of the colormap for the given data or item.
@@ -207,6 +207,8 @@ class _AutoscaleModeComboBox(qt.QComboBox):
     DATA = {
         Colormap.MINMAX: ("Min/max", "Use the data min/max"),
         Colormap.STDDEV3: ("Mean ± 3 × stddev", "Use the data mean ± 3 × standard deviation"),
+        Colormap.PERCENTILE_1_99: ("1st-99th percentiles", "Use the data 1st and 99th percentiles"),
+        Colormap.PERCENTILE_5_95: ("5th-95th percentiles", "Use the data 5th and 95th percentiles"),
     }
 
     def __init__(self, parent: qt.QWidget):
@@ -38,6 +38,7 @@ from .Hdf5Item import Hdf5Item
 from .Hdf5LoadingItem import Hdf5LoadingItem
 from . import _utils
 from ... import io as silx_io
+from ...io.spech5 import SpecH5
 
 _logger = logging.getLogger(__name__)
 
@@ -580,6 +581,7 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         Synchronize a file a given its index.
 
         Basically close it and load it again.
+        SPEC files are updated in place with the appended scans.
 
         :param qt.QModelIndex index: Index of the item to update
         """
@@ -587,9 +589,52 @@ class Hdf5TreeModel(qt.QAbstractItemModel):
         if node.parent is not self.__root:
             return
 
+        if isinstance(node.obj, SpecH5) and self.__updateSpecH5(index, node):
+            return
+
         filename = node.obj.filename
         self.insertFileAsync(filename, index.row(), synchronizingNode=node)
 
+    def __updateSpecH5(self, index, node):
+        """Update in place a SPEC file with the scans appended to it.
+
+        :param qt.QModelIndex index: Index of the item to update
+        :param Hdf5Item node: Node of the SPEC file
+        :return: False if the file can not be updated in place
+        :rtype: bool
+        """
+        # Populate children with the content before the update
+        for row in range(node.childCount()):
+            node.child(row)
+
+        try:
+            names = node.obj.update()
+        except IOError:
+            _logger.debug("Backtrace", exc_info=True)
+            return False
+
+        for name in names:
+            item = Hdf5Item(text=name,
+                            obj=None,
+                            parent=node,
+                            key=name,
+                            h5Class=silx_io.utils.H5Type.GROUP,
+                            linkClass=silx_io.utils.H5Type.HARD_LINK)
+
+            for row in range(node.childCount()):
+                if node.child(row).basename == name:
+                    self.beginRemoveRows(index, row, row)
+                    node.removeChildAtIndex(row)
+                    self.endRemoveRows()
+                    break
+            else:
+                row = node.childCount()
+
+            self.beginInsertRows(index, row, row)
+            node.insertChild(row, item)
+            self.endInsertRows()
+        return True
+
     def h5pyObjectRow(self, h5pyObject):
         for row in range(self.__root.childCount()):
             item = self.__root.child(row)
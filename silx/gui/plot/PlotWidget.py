@@ -42,6 +42,7 @@ from collections import OrderedDict, namedtuple
 from contextlib import contextmanager
 import datetime as dt
 import itertools
+import time
 import warnings
 
 import numpy
@@ -63,6 +64,7 @@ from . import PlotInteraction
 from . import PlotEvents
 from .LimitsHistory import LimitsHistory
 from . import _utils
+from ._utils.rangetracker import RangeTracker
 
 from . import items
 from .items.curve import CurveStyle
@@ -237,6 +239,12 @@ class PlotWidget(qt.QMainWindow):
         self._contentToUpdate = []  # Used as an OrderedSet
 
         self._dataRange = None
+        self._dataRangeTrackers = {'x': RangeTracker(),
+                                   'left': RangeTracker(),
+                                   'right': RangeTracker()}
+        """Per axis ranges of the items"""
+        self._dataRangeItemsToUpdate = set()
+        self._dataRangeFullUpdate = True
 
         # line types
         self._styleList = ['-', '--', '-.', ':']
@@ -665,53 +673,71 @@ class PlotWidget(qt.QMainWindow):
         super(PlotWidget, self).hideEvent(event)
         self.sigVisibilityChanged.emit(False)
 
-    def _invalidateDataRange(self):
+    def _invalidateDataRange(self, item=None):
         """
         Notifies this PlotWidget instance that the range has changed
         and will have to be recomputed.
+
+        :param Union[~silx.gui.plot.items.Item,None] item:
+            The item which bounds have changed, or None (default) to
+            recompute the bounds of all items.
         """
+        if item is None:
+            self._dataRangeFullUpdate = True
+            self._dataRangeItemsToUpdate.clear()
+        elif not self._dataRangeFullUpdate:
+            self._dataRangeItemsToUpdate.add(item)
         self._dataRange = None
 
     def _updateDataRange(self):
         """
         Recomputes the range of the data displayed on this PlotWidget.
+
+        Only the bounds of the items notified through
+        :meth:`_invalidateDataRange` are retrieved.
+        The time spent is logged at debug level.
         """
-        xMin = yMinLeft = yMinRight = float('nan')
-        xMax = yMaxLeft = yMaxRight = float('nan')
+        startTime = time.time()
 
-        for item in self.getItems():
-            if item.isVisible():
-                bounds = item.getBounds()
-                if bounds is not None:
-                    with warnings.catch_warnings():
-                        warnings.simplefilter('ignore', category=RuntimeWarning)
-                        # Ignore All-NaN slice encountered
-                        xMin = numpy.nanmin([xMin, bounds[0]])
-                        xMax = numpy.nanmax([xMax, bounds[1]])
-                    # Take care of right axis
-                    if (isinstance(item, items.YAxisMixIn) and
-                            item.getYAxis() == 'right'):
-                        with warnings.catch_warnings():
-                            warnings.simplefilter('ignore', category=RuntimeWarning)
-                            # Ignore All-NaN slice encountered
-                            yMinRight = numpy.nanmin([yMinRight, bounds[2]])
-                            yMaxRight = numpy.nanmax([yMaxRight, bounds[3]])
-                    else:
-                        with warnings.catch_warnings():
-                            warnings.simplefilter('ignore', category=RuntimeWarning)
-                            # Ignore All-NaN slice encountered
-                            yMinLeft = numpy.nanmin([yMinLeft, bounds[2]])
-                            yMaxLeft = numpy.nanmax([yMaxLeft, bounds[3]])
-
-        def lGetRange(x, y):
+        trackers = self._dataRangeTrackers
+        if self._dataRangeFullUpdate:
+            for tracker in trackers.values():
+                tracker.clear()
+            itemsToUpdate = self.getItems()
+        else:
+            itemsToUpdate = self._dataRangeItemsToUpdate
+        nbItems = len(itemsToUpdate)
+
+        for item in itemsToUpdate:
+            for tracker in trackers.values():
+                tracker.removeRange(item)
+
+            if item.getPlot() is not self or not item.isVisible():
+                continue
+            bounds = item.getBounds()
+            if bounds is None:
+                continue
+            if (isinstance(item, items.YAxisMixIn) and
+                    item.getYAxis() == 'right'):
+                yaxis = 'right'
+            else:
+                yaxis = 'left'
+            trackers['x'].setRange(item, *bounds[:2])
+            trackers[yaxis].setRange(item, *bounds[2:])
+
+        self._dataRangeFullUpdate = False
+        self._dataRangeItemsToUpdate = set()
+
+        def lGetRange(tracker):
+            x, y = tracker.getMin(), tracker.getMax()
             return None if numpy.isnan(x) and numpy.isnan(y) else (x, y)
-        xRange = lGetRange(xMin, xMax)
-        yLeftRange = lGetRange(yMinLeft, yMaxLeft)
-        yRightRange = lGetRange(yMinRight, yMaxRight)
 
-        self._dataRange = _PlotDataRange(x=xRange,
-                                         y=yLeftRange,
-                                         yright=yRightRange)
+        self._dataRange = _PlotDataRange(x=lGetRange(trackers['x']),
+                                         y=lGetRange(trackers['left']),
+                                         yright=lGetRange(trackers['right']))
+
+        _logger.debug("Data range updated from %d item(s) in %f s",
+                      nbItems, time.time() - startTime)
 
     def getDataRange(self):
         """
@@ -734,6 +760,7 @@ class PlotWidget(qt.QMainWindow):
         'scatter': (items.Scatter,),
         'marker': (items.MarkerBase,),
         'item': (items.Shape,
+                 items.CurveCollection,
                  items.BoundingRect,
                  items.XAxisExtent,
                  items.YAxisExtent),
@@ -795,7 +822,7 @@ class PlotWidget(qt.QMainWindow):
         item._setPlot(self)
         self._itemRequiresUpdate(item)
         if isinstance(item, items.DATA_ITEMS):
-            self._invalidateDataRange()  # TODO handle this automatically
+            self._invalidateDataRange(item)  # TODO handle this automatically
 
         self._notifyContentChanged(item)
         self.sigItemAdded.emit(item)
@@ -836,7 +863,7 @@ class PlotWidget(qt.QMainWindow):
         if item.isVisible():
             self._setDirtyPlot(overlayOnly=item.isOverlay())
         if item.getBounds() is not None:
-            self._invalidateDataRange()
+            self._invalidateDataRange(item)
         item._removeBackendRenderer(self._backend)
         item._setPlot(None)
 
@@ -0,0 +1,140 @@
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ###########################################################################*/
+"""This module provides a class to maintain the range of a set of values."""
+
+__authors__ = ["T. Vincent"]
+__license__ = "MIT"
+__date__ = "16/10/2026"
+
+
+import heapq
+import itertools
+import math
+
+
+class RangeTracker(object):
+    """Maintain the min and max of the ranges associated to keys.
+
+    Ranges can be added, updated and removed in logarithmic time
+    (amortized), and the overall min and max are available in constant
+    time (amortized).
+
+    This is implemented with 2 heaps (for min and max) and lazy removal
+    of outdated entries.
+    NaN values are ignored.
+    """
+
+    def __init__(self):
+        self._counter = itertools.count()
+        self._ranges = {}
+        """Mapping key -> (id of the entries in heaps, min, max)"""
+        self._minHeap = []
+        self._maxHeap = []
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def __contains__(self, key):
+        return key in self._ranges
+
+    def clear(self):
+        """Remove all ranges"""
+        self._ranges = {}
+        self._minHeap = []
+        self._maxHeap = []
+
+    def setRange(self, key, vmin, vmax):
+        """Add or update the range associated to a key.
+
+        :param key: Hashable identifier of the range
+        :param float vmin: Min of the range, ignored if NaN
+        :param float vmax: Max of the range, ignored if NaN
+        """
+        id_ = next(self._counter)
+        self._ranges[key] = id_, vmin, vmax
+        if not math.isnan(vmin):
+            heapq.heappush(self._minHeap, (vmin, id_, key))
+        if not math.isnan(vmax):
+            heapq.heappush(self._maxHeap, (-vmax, id_, key))
+        self._compact()
+
+    def removeRange(self, key):
+        """Remove the range associated to key if any.
+
+        :param key: Identifier of the range
+        """
+        if self._ranges.pop(key, None) is not None:
+            self._compact()
+
+    def getRange(self, key):
+        """Returns the range associated to the key.
+
+        :param key: Identifier of the range
+        :rtype: Union[List[float],None]
+        """
+        entry = self._ranges.get(key)
+        return None if entry is None else entry[1:]
+
+    def getMin(self):
+        """Returns the minimum of all ranges or NaN if there is none.
+
+        :rtype: float
+        """
+        heap = self._minHeap
+        self._discardOutdated(heap)
+        return heap[0][0] if heap else float('nan')
+
+    def getMax(self):
+        """Returns the maximum of all ranges or NaN if there is none.
+
+        :rtype: float
+        """
+        heap = self._maxHeap
+        self._discardOutdated(heap)
+        return -heap[0][0] if heap else float('nan')
+
+    def _discardOutdated(self, heap):
+        """Remove outdated entries from the top of the heap"""
+        ranges = self._ranges
+        while heap:
+            id_, key = heap[0][1:]
+            entry = ranges.get(key)
+            if entry is not None and entry[0] == id_:
+                break
+            heapq.heappop(heap)
+
+    def _compact(self):
+        """Rebuild heaps when they contain too many outdated entries"""
+        threshold = 2 * len(self._ranges) + 16
+        if len(self._minHeap) > threshold or len(self._maxHeap) > threshold:
+            self._minHeap = []
+            self._maxHeap = []
+            for key, (id_, vmin, vmax) in self._ranges.items():
+                if not math.isnan(vmin):
+                    self._minHeap.append((vmin, id_, key))
+                if not math.isnan(vmax):
+                    self._maxHeap.append((-vmax, id_, key))
+            heapq.heapify(self._minHeap)
+            heapq.heapify(self._maxHeap)
@@ -34,10 +34,12 @@ import unittest
 
 from .test_dtime_ticklayout import suite as test_dtime_ticklayout_suite
 from .test_ticklayout import suite as test_ticklayout_suite
+from .test_rangetracker import suite as test_rangetracker_suite
 
 
 def suite():
     testsuite = unittest.TestSuite()
     testsuite.addTest(test_dtime_ticklayout_suite())
     testsuite.addTest(test_ticklayout_suite())
+    testsuite.addTest(test_rangetracker_suite())
     return testsuite
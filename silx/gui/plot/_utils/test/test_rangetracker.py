@@ -0,0 +1,90 @@
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ###########################################################################*/
+"""Tests of the rangetracker module"""
+
+__authors__ = ["T. Vincent"]
+__license__ = "MIT"
+__date__ = "16/10/2026"
+
+
+import unittest
+import numpy
+
+from silx.gui.plot._utils.rangetracker import RangeTracker
+
+
+class TestRangeTracker(unittest.TestCase):
+    """Test RangeTracker"""
+
+    def testEmpty(self):
+        """Test empty tracker"""
+        tracker = RangeTracker()
+        self.assertEqual(len(tracker), 0)
+        self.assertTrue(numpy.isnan(tracker.getMin()))
+        self.assertTrue(numpy.isnan(tracker.getMax()))
+
+    def testSetRemoveRange(self):
+        """Test add, update and remove of ranges"""
+        tracker = RangeTracker()
+        tracker.setRange('a', 0., 10.)
+        tracker.setRange('b', -5., 5.)
+        tracker.setRange('c', float('nan'), 20.)
+        self.assertEqual(len(tracker), 3)
+        self.assertIn('b', tracker)
+        self.assertEqual(tracker.getRange('b'), (-5., 5.))
+        self.assertEqual((tracker.getMin(), tracker.getMax()), (-5., 20.))
+
+        tracker.setRange('b', 1., 2.)
+        self.assertEqual((tracker.getMin(), tracker.getMax()), (0., 20.))
+
+        tracker.removeRange('c')
+        tracker.removeRange('unknown')
+        self.assertEqual((tracker.getMin(), tracker.getMax()), (0., 10.))
+
+        tracker.removeRange('a')
+        self.assertEqual((tracker.getMin(), tracker.getMax()), (1., 2.))
+
+        tracker.clear()
+        self.assertEqual(len(tracker), 0)
+        self.assertTrue(numpy.isnan(tracker.getMin()))
+
+    def testManyUpdates(self):
+        """Test that outdated entries do not accumulate"""
+        tracker = RangeTracker()
+        for index in range(1000):
+            tracker.setRange(index % 10, index, index + 1)
+        self.assertEqual((tracker.getMin(), tracker.getMax()), (990, 1000))
+        self.assertLess(len(tracker._minHeap), 100)
+
+
+def suite():
+    test_suite = unittest.TestSuite()
+    test_suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestRangeTracker))
+    return test_suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest='suite')
@@ -148,6 +148,16 @@ class BackendBase(object):
         """
         return object()
 
+    def isColormapAccelerated(self, colormap):
+        """Returns True if :meth:`addImage` applies colormap on the GPU.
+
+        When False, the colormap is applied on the CPU when adding the image.
+
+        :param ~silx.gui.colors.Colormap colormap: The colormap to check
+        :rtype: bool
+        """
+        return False
+
     def addTriangles(self, x, y, triangles,
                      color, alpha):
         """Add a set of triangles.
@@ -162,6 +172,22 @@ class BackendBase(object):
         """
         return object()
 
+    def addCurveCollection(self, x, y, color, linewidth, linestyle,
+                           yaxis, alpha):
+        """Add a set of curves sharing the same style to the graph.
+
+        :param numpy.ndarray x: X coordinates as a (ncurves, npoints) array
+        :param numpy.ndarray y: Y coordinates as a (ncurves, npoints) array
+        :param numpy.ndarray color: RGBA colors as a (ncurves, 4) float array
+        :param float linewidth: The width of the curves' lines in pixels
+        :param str linestyle: Type of line (See :meth:`addCurve`)
+        :param str yaxis: The Y axis this curve belongs to in: 'left', 'right'
+        :param float alpha: Opacity as a float in [0., 1.]
+        :returns: The curves' unique identifier used by the backend.
+            Picking this item returns the indices of the picked curves.
+        """
+        return object()
+
     def addShape(self, x, y, shape, color, fill, overlay,
                  linestyle, linewidth, linebgcolor):
         """Add an item (i.e. a shape) to the plot.
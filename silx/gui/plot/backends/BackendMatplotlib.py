@@ -760,6 +760,37 @@ class BackendMatplotlib(BackendBase.BackendBase):
 
         return collection
 
+    def addCurveCollection(self, x, y, color, linewidth, linestyle,
+                           yaxis, alpha):
+        for parameter in (x, y, color, linewidth, yaxis, alpha):
+            assert parameter is not None
+        assert yaxis in ('left', 'right')
+
+        if yaxis == "right":
+            axes = self.ax2
+            self._enableAxis("right", True)
+        else:
+            axes = self.ax
+
+        color = numpy.array(color, dtype=numpy.float32)
+        if alpha < 1:  # Combine item alpha with colors' alpha
+            color[:, 3] *= alpha
+
+        if linestyle in ('', ' ', None):
+            linestyle = 'None'
+            linewidth = 0.
+
+        collection = LineCollection(
+            numpy.stack((x, y), axis=-1),
+            colors=color,
+            linewidths=linewidth,
+            linestyles=linestyle,
+            picker=True,
+            pickradius=3)
+        axes.add_collection(collection, autolim=False)
+
+        return collection
+
     def addShape(self, x, y, shape, color, fill, overlay,
                  linestyle, linewidth, linebgcolor):
         if (linebgcolor is not None and
@@ -946,6 +946,10 @@ class BackendOpenGL(BackendBase.BackendBase, glu.OpenGLWidget):
 
         return image
 
+    def isColormapAccelerated(self, colormap):
+        return (colormap.getNormalization() in
+                glutils.GLPlotColormap.SUPPORTED_NORMALIZATIONS)
+
     def addTriangles(self, x, y, triangles,
                      color, alpha):
         # Handle axes log scale: convert data
@@ -958,6 +962,45 @@ class BackendOpenGL(BackendBase.BackendBase, glu.OpenGLWidget):
 
         return triangles
 
+    def addCurveCollection(self, x, y, color, linewidth, linestyle,
+                           yaxis, alpha):
+        for parameter in (x, y, color, linewidth, yaxis, alpha):
+            assert parameter is not None
+        assert yaxis in ('left', 'right')
+
+        x = numpy.array(x, copy=False)
+        y = numpy.array(y, copy=False)
+
+        # Check if float32 is enough
+        if (self._castArrayTo(x) is numpy.float32 and
+                self._castArrayTo(y) is numpy.float32):
+            dtype = numpy.float32
+        else:
+            dtype = numpy.float64
+
+        # Handle axes log scale: convert data
+        if self._plotFrame.xAxis.isLog:
+            x = numpy.log10(x)
+        if (yaxis == 'left' and self._plotFrame.yAxis.isLog) or (
+                yaxis == 'right' and self._plotFrame.y2Axis.isLog):
+            y = numpy.log10(y)
+
+        x = numpy.array(x, dtype=dtype, copy=False, order='C')
+        y = numpy.array(y, dtype=dtype, copy=False, order='C')
+
+        color = numpy.array(color, dtype=numpy.float32)
+        if alpha < 1.:  # Apply transparency
+            color[:, 3] *= alpha
+
+        curves = glutils.GLPlotCurveCollection2D(
+            x, y, color, lineStyle=linestyle, lineWidth=linewidth)
+        curves.yaxis = yaxis
+
+        if yaxis == "right":
+            self._plotFrame.isY2Axis = True
+
+        return curves
+
     def addShape(self, x, y, shape, color, fill, overlay,
                  linestyle, linewidth, linebgcolor):
         x = numpy.array(x, copy=False)
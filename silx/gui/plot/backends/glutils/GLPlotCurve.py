@@ -1362,3 +1362,54 @@ class GLPlotCurve2D(GLPlotItem):
                                         (self.yData <= yPickMax))[0].tolist()
 
         return tuple(indices) if len(indices) > 0 else None
+
+
+class GLPlotCurveCollection2D(GLPlotCurve2D):
+    """Set of curves with the same number of points rendered at once.
+
+    Curves are concatenated with a NaN point between each of them,
+    so that they are rendered with a single draw call.
+
+    :param numpy.ndarray xData: X coordinates as a (ncurves, npoints) array
+    :param numpy.ndarray yData: Y coordinates as a (ncurves, npoints) array
+    :param numpy.ndarray colorData: RGBA colors as a (ncurves, 4) array
+    :param lineStyle: Line style of the curves
+    :param float lineWidth: Line width of the curves
+    """
+
+    def __init__(self, xData, yData, colorData,
+                 lineStyle=SOLID, lineWidth=1):
+        assert xData.shape == yData.shape and xData.ndim == 2
+        ncurves, npoints = yData.shape
+        self._pointsPerCurve = npoints + 1
+
+        # Add a NaN point after each curve to split lines
+        shape = ncurves, self._pointsPerCurve
+        x = numpy.full(shape, numpy.nan, dtype=xData.dtype)
+        x[:, :-1] = xData
+        y = numpy.full(shape, numpy.nan, dtype=yData.dtype)
+        y[:, :-1] = yData
+        colors = numpy.repeat(numpy.array(colorData, dtype=numpy.float32),
+                              self._pointsPerCurve, axis=0)
+
+        super(GLPlotCurveCollection2D, self).__init__(
+            x.ravel(), y.ravel(), colors,
+            lineStyle=lineStyle,
+            lineWidth=lineWidth,
+            marker=None)
+
+    def pick(self, xPickMin, yPickMin, xPickMax, yPickMax):
+        """Perform picking on the curves according to their rendering.
+
+        The picking area is [xPickMin, xPickMax], [yPickMin, yPickMax].
+
+        :return: The indices of the picked curves
+        :rtype: Union[List[int],None]
+        """
+        indices = super(GLPlotCurveCollection2D, self).pick(
+            xPickMin, yPickMin, xPickMax, yPickMax)
+        if indices is None:
+            return None
+        curves = numpy.unique(
+            numpy.array(indices) // self._pointsPerCurve)
+        return tuple(curves.tolist())
@@ -39,6 +39,7 @@ from .core import (Item, DataItem,  # noqa
                    ComplexMixIn, ItemChangedType, PointsBase)  # noqa
 from .complex import ImageComplexData  # noqa
 from .curve import Curve, CurveStyle  # noqa
+from .curvecollection import CurveCollection  # noqa
 from .histogram import Histogram  # noqa
 from .image import ImageBase, ImageData, ImageRgba, ImageStack, MaskImageData  # noqa
 from .shape import Shape, BoundingRect, XAxisExtent, YAxisExtent  # noqa
@@ -46,7 +47,7 @@ from .scatter import Scatter  # noqa
 from .marker import MarkerBase, Marker, XMarker, YMarker  # noqa
 from .axis import Axis, XAxis, YAxis, YRightAxis
 
-DATA_ITEMS = (ImageComplexData, Curve, Histogram, ImageBase, Scatter,
-              BoundingRect, XAxisExtent, YAxisExtent)
+DATA_ITEMS = (ImageComplexData, Curve, CurveCollection, Histogram, ImageBase,
+              Scatter, BoundingRect, XAxisExtent, YAxisExtent)
 """Classes of items representing data and to consider to compute data bounds.
 """
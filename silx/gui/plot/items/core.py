@@ -495,7 +495,7 @@ class DataItem(Item):
             # TODO hackish data range implementation
             plot = self.getPlot()
             if plot is not None:
-                plot._invalidateDataRange()
+                plot._invalidateDataRange(self)
 
     @docstring(Item)
     def setVisible(self, visible: bool):
@@ -602,6 +602,7 @@ class ColormapMixIn(ItemMixInBase):
         self._colormap.sigChanged.connect(self._colormapChanged)
         self.__data = None
         self.__cacheColormapRange = {}  # Store {normalization: range}
+        self.__cacheDataSummaries = {}  # Store data summaries for autoscale
 
     def getColormap(self):
         """Return the used colormap"""
@@ -632,7 +633,7 @@ class ColormapMixIn(ItemMixInBase):
                             min_=None, minPositive=None, max_=None):
         """Set the data used to compute the colormapped display.
 
-        It also resets the cache of data ranges.
+        It also resets the cache of data ranges and summaries.
 
         This method MUST be called by inheriting classes when data is updated.
 
@@ -644,6 +645,7 @@ class ColormapMixIn(ItemMixInBase):
         """
         self.__data = None if data is None else numpy.array(data, copy=copy)
         self.__cacheColormapRange = {}  # Reset cache
+        self.__cacheDataSummaries = {}
 
         # Fill-up colormap range cache if values are provided
         if max_ is not None and numpy.isfinite(max_):
@@ -688,7 +690,8 @@ class ColormapMixIn(ItemMixInBase):
         key = normalization, autoscaleMode
         vRange = self.__cacheColormapRange.get(key, None)
         if vRange is None:
-            vRange = colormap._computeAutoscaleRange(data)
+            vRange = colormap._computeAutoscaleRange(
+                data, self.__cacheDataSummaries)
             self.__cacheColormapRange[key] = vRange
         return vRange
 
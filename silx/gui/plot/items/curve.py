@@ -27,24 +27,170 @@
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "24/04/2018"
+__date__ = "16/10/2026"
 
 
+try:
+    from collections import abc
+except ImportError:  # Python2 support
+    import collections as abc
 import logging
+import math
 
 import numpy
 import six
 
 from ....utils.deprecation import deprecated
+from ....utils.proxy import docstring
+from ....math.combo import min_max
 from ... import colors
 from .core import (PointsBase, LabelsMixIn, ColorMixIn, YAxisMixIn,
                    FillMixIn, LineMixIn, SymbolMixIn, ItemChangedType,
                    BaselineMixIn, HighlightedMixIn, _Style)
+from ._pick import PickingResult
 
 
 _logger = logging.getLogger(__name__)
 
 
+def _envelopeDecimation(x, y, displayedX, nbins, log=False):
+    """Decimate a curve as the min/max envelope of its points in bins.
+
+    For each non-empty bin along X, it keeps the first and last points
+    and the min and max of Y which are placed at the X of the first point.
+
+    :param numpy.ndarray x: X coordinates sorted in ascending order
+    :param numpy.ndarray y: Y coordinates
+    :param numpy.ndarray displayedX: X coordinates to use for the output
+    :param int nbins: Number of bins over the X range of the data
+    :param bool log: True to use bins of constant width in log scale
+    :returns: (x, y, binStarts) of the decimated curve,
+        with binStarts the index of the first point of each non-empty bin
+    """
+    if log:
+        positive = x[numpy.searchsorted(x, 0., side='right'):]
+        if len(positive) == 0:
+            return x[:0], y[:0], numpy.zeros((0,), dtype=numpy.int64)
+        edges = numpy.logspace(numpy.log10(positive[0]),
+                               numpy.log10(positive[-1]),
+                               nbins + 1)
+    else:
+        edges = numpy.linspace(x[0], x[-1], nbins + 1)
+
+    starts = numpy.unique(numpy.searchsorted(x, edges[:-1]))
+    starts = starts[starts < len(x)]
+    ends = numpy.append(starts[1:], len(x)) - 1
+
+    with numpy.errstate(invalid='ignore'):
+        ymin = numpy.fmin.reduceat(y, starts)
+        ymax = numpy.fmax.reduceat(y, starts)
+
+    decimatedX = numpy.empty((len(starts), 4), dtype=numpy.float64)
+    decimatedX[:, :3] = displayedX[starts, numpy.newaxis]
+    decimatedX[:, 3] = displayedX[ends]
+    decimatedY = numpy.empty((len(starts), 4), dtype=numpy.float64)
+    decimatedY[:, 0] = y[starts]
+    decimatedY[:, 1] = ymin
+    decimatedY[:, 2] = ymax
+    decimatedY[:, 3] = y[ends]
+    return decimatedX.ravel(), decimatedY.ravel(), starts
+
+
+class _AppendBuffer(object):
+    """Preallocated storage of curve points supporting fast append.
+
+    Points are stored in arrays twice the capacity, so that the stored
+    points are always available as contiguous array views.
+    Stored points are moved back to the beginning of the arrays only
+    when the end of the arrays is reached.
+
+    :param int capacity: Number of points to preallocate
+    :param bool rolling: True to keep only the last *capacity* points,
+        False to grow the storage when full.
+    """
+
+    def __init__(self, capacity, rolling=True):
+        self._capacity = max(1, int(capacity))
+        self._rolling = bool(rolling)
+        self._x = numpy.empty((2 * self._capacity,), dtype=numpy.float64)
+        self._y = numpy.empty((2 * self._capacity,), dtype=numpy.float64)
+        self._start = 0
+        self._end = 0
+
+    def getCapacity(self):
+        """Returns the number of points the storage can hold.
+
+        :rtype: int
+        """
+        return self._capacity
+
+    def isRolling(self):
+        """Returns True if oldest points are dropped when full.
+
+        :rtype: bool
+        """
+        return self._rolling
+
+    def getData(self):
+        """Returns views of the stored x and y coordinates.
+
+        :rtype: List[numpy.ndarray]
+        """
+        return self._x[self._start:self._end], self._y[self._start:self._end]
+
+    def clear(self):
+        """Remove all stored points"""
+        self._start = 0
+        self._end = 0
+
+    def append(self, x, y):
+        """Append points at the end of the storage.
+
+        :param numpy.ndarray x: 1D array of x coordinates
+        :param numpy.ndarray y: 1D array of y coordinates
+        :returns: Copies of (x, y) of the points dropped from the storage or
+            None if all previously stored points were dropped.
+        """
+        count = self._end - self._start
+        length = len(x)
+        dropped = numpy.zeros((0,)), numpy.zeros((0,))
+
+        if length > self._capacity - count:
+            if self._rolling:
+                if length >= self._capacity:
+                    # New points replace everything
+                    self.clear()
+                    x, y = x[-self._capacity:], y[-self._capacity:]
+                    dropped = None
+                else:
+                    dropCount = count + length - self._capacity
+                    end = self._start + dropCount
+                    dropped = (self._x[self._start:end].copy(),
+                               self._y[self._start:end].copy())
+                    self._start = end
+            else:  # Grow storage
+                self._capacity = max(2 * self._capacity, count + length)
+                for name in ('_x', '_y'):
+                    array = numpy.empty((2 * self._capacity,),
+                                        dtype=numpy.float64)
+                    array[:count] = getattr(self, name)[self._start:self._end]
+                    setattr(self, name, array)
+                self._start, self._end = 0, count
+
+        if self._end + len(x) > len(self._x):
+            # Move stored points to the beginning of the arrays
+            count = self._end - self._start
+            self._x[:count] = self._x[self._start:self._end]
+            self._y[:count] = self._y[self._start:self._end]
+            self._start, self._end = 0, count
+
+        end = self._end + len(x)
+        self._x[self._end:end] = x
+        self._y[self._end:end] = y
+        self._end = end
+        return dropped
+
+
 class CurveStyle(_Style):
     """Object storing the style of a curve.
 
@@ -173,6 +319,9 @@ class Curve(PointsBase, ColorMixIn, YAxisMixIn, FillMixIn, LabelsMixIn,
 
     _DEFAULT_BASELINE = None
 
+    _DECIMATION_POINTS_PER_BIN = 4
+    """Number of points generated per bin by the envelope decimation"""
+
     def __init__(self):
         PointsBase.__init__(self)
         ColorMixIn.__init__(self)
@@ -185,6 +334,14 @@ class Curve(PointsBase, ColorMixIn, YAxisMixIn, FillMixIn, LabelsMixIn,
 
         self._setBaseline(Curve._DEFAULT_BASELINE)
 
+        self.__envelopeDecimation = False
+        self.__decimationCache = {}
+        """Decimated data per number of bins, axes scales and Y axis"""
+        self.__isXSorted = None
+        self.__decimationKey = None
+        """Key in decimation cache of the displayed curve or None"""
+        self.__appendBuffer = None
+
     def _addBackendRenderer(self, backend):
         """Update backend renderer"""
         # Filter-out values <= 0
@@ -194,6 +351,11 @@ class Curve(PointsBase, ColorMixIn, YAxisMixIn, FillMixIn, LabelsMixIn,
         if len(xFiltered) == 0 or not numpy.any(numpy.isfinite(xFiltered)):
             return None  # No data to display, do not add renderer to backend
 
+        self.__decimationKey = self.__getDecimationKey()
+        if self.__decimationKey is not None:
+            xFiltered, yFiltered, _ = self.__getDecimatedData(
+                self.__decimationKey)
+
         style = self.getCurrentStyle()
 
         return backend.addCurve(xFiltered, yFiltered,
@@ -209,6 +371,259 @@ class Curve(PointsBase, ColorMixIn, YAxisMixIn, FillMixIn, LabelsMixIn,
                                 symbolsize=style.getSymbolSize(),
                                 baseline=self.getBaseline(copy=False))
 
+    def isEnvelopeDecimation(self):
+        """Returns True if the displayed curve is decimated.
+
+        :rtype: bool
+        """
+        return self.__envelopeDecimation
+
+    def setEnvelopeDecimation(self, enabled):
+        """Enable/disable the decimation of the displayed curve.
+
+        When enabled, the curve sent to the backend is reduced to the
+        min/max envelope of its points for each pixel column of the plot
+        (see :func:`_envelopeDecimation`).
+        Decimated curves are cached per zoom level and computed again
+        when the plot limits change.
+        Bounds, statistics and picking use the full data.
+
+        This is only applied when X values are sorted in ascending order,
+        and when the curve has no error bars and no baseline array.
+
+        :param bool enabled:
+        """
+        enabled = bool(enabled)
+        if enabled != self.__envelopeDecimation:
+            self.__envelopeDecimation = enabled
+            self.__decimationCache = {}
+            self.__decimationKey = None
+            self._setVisibleBoundsTracking(enabled)
+            self._updated()
+
+    def _visibleBoundsChanged(self, *args) -> None:
+        super()._visibleBoundsChanged(*args)
+        if (self.__envelopeDecimation and
+                self.__getDecimationKey() != self.__decimationKey):
+            self._updated()
+
+    def __getDecimationKey(self):
+        """Returns the key of the decimation to use in the current plot state
+
+        :returns: (number of bins, X axis log scale, Y axis log scale, Y axis)
+            or None if the curve is not decimated
+        :rtype: Union[List,None]
+        """
+        plot = self.getPlot()
+        if not self.__envelopeDecimation or plot is None:
+            return None
+
+        x = self.getXData(copy=False)
+        bounds = self.getBounds()
+        if (len(x) == 0 or bounds is None or
+                self.getXErrorData(copy=False) is not None or
+                self.getYErrorData(copy=False) is not None or
+                isinstance(self.getBaseline(copy=False), numpy.ndarray)):
+            return None
+
+        if self.__isXSorted is None:
+            self.__isXSorted = bool(numpy.all(x[1:] >= x[:-1]))
+        if not self.__isXSorted:
+            return None
+
+        xaxis = plot.getXAxis()
+        isLog = xaxis._isLogarithmic()
+        xmin, xmax = bounds[:2]
+        vmin, vmax = xaxis.getLimits()
+        if isLog:
+            if xmin <= 0. or vmin <= 0.:
+                return None
+            xmin, xmax = numpy.log10((xmin, xmax))
+            vmin, vmax = numpy.log10((vmin, vmax))
+        if not xmax > xmin or not vmax > vmin:
+            return None
+
+        # Width of the whole curve in pixels at the current zoom level
+        width = plot.getPlotBoundsInPixels()[2]
+        curveWidth = max(1, width * (xmax - xmin) / (vmax - vmin))
+        if self._DECIMATION_POINTS_PER_BIN * curveWidth >= len(x):
+            return None  # Decimation would not reduce the number of points
+
+        # Use power of 2 number of bins to share it between close zoom levels
+        nbins = 2 ** int(math.ceil(math.log2(curveWidth)))
+        if self._DECIMATION_POINTS_PER_BIN * nbins >= len(x):
+            return None
+        yaxis = self.getYAxis()
+        isYLog = plot.getYAxis(axis=yaxis)._isLogarithmic()
+        return nbins, isLog, isYLog, yaxis
+
+    def __getDecimatedData(self, key):
+        """Returns decimated data from cache or compute it
+
+        :param key: The key returned by :meth:`__getDecimationKey`
+        :returns: (x, y, binStarts)
+        """
+        if key not in self.__decimationCache:
+            nbins, isLog = key[:2]
+            displayedX, displayedY, _, _ = self.getData(
+                copy=False, displayed=True)
+            self.__decimationCache[key] = _envelopeDecimation(
+                self.getXData(copy=False),
+                displayedY,
+                displayedX,
+                nbins,
+                log=isLog)
+        return self.__decimationCache[key]
+
+    @docstring(PointsBase)
+    def pick(self, x, y):
+        result = super().pick(x, y)
+        if result is None or self.__decimationKey is None:
+            return result
+
+        # Convert picked decimated points to the closest full data points
+        plot = self.getPlot()
+        dataPos = plot.pixelToData(x, y, axis=self.getYAxis(), check=False)
+        if dataPos is None:
+            return None
+
+        yData = self.getYData(copy=False)
+        binStarts = self.__getDecimatedData(self.__decimationKey)[2]
+        binEnds = numpy.append(binStarts[1:], len(yData))
+        indices = []
+        for index in numpy.unique(
+                result.getIndices(copy=False) // self._DECIMATION_POINTS_PER_BIN):
+            start, end = binStarts[index], binEnds[index]
+            with numpy.errstate(invalid='ignore'):
+                distances = numpy.abs(yData[start:end] - dataPos[1])
+            if numpy.all(numpy.isnan(distances)):
+                continue
+            indices.append(start + numpy.nanargmin(distances))
+        return PickingResult(self, indices) if indices else None
+
+    def getAppendBufferCapacity(self):
+        """Returns the capacity of the preallocated storage of the points.
+
+        :returns: The capacity or None if no storage is preallocated.
+        :rtype: Union[int,None]
+        """
+        if self.__appendBuffer is None:
+            return None
+        return self.__appendBuffer.getCapacity()
+
+    def setAppendBufferCapacity(self, capacity, rolling=True):
+        """Preallocate the storage of the points to speed-up :meth:`appendData`.
+
+        :param Union[int,None] capacity:
+            Number of points to preallocate or None to disable preallocation.
+        :param bool rolling:
+            True (default) to only keep the last *capacity* points
+            (i.e., a rolling window),
+            False to grow the storage when more points are appended.
+        """
+        if capacity is None:
+            if self.__appendBuffer is not None:
+                self.__appendBuffer = None
+                self._x = numpy.array(self._x)
+                self._y = numpy.array(self._y)
+            return
+
+        self.__appendBuffer = _AppendBuffer(capacity, rolling)
+        dropped = self.__appendBuffer.append(self._x, self._y)
+        self._x, self._y = self.__appendBuffer.getData()
+        if dropped is None:  # Points might have been dropped
+            self.__resetCaches()
+            self._boundsChanged()
+            self._updated(ItemChangedType.DATA)
+
+    def appendData(self, x, y):
+        """Append points at the end of the curve.
+
+        The computation cost depends on the number of appended points
+        rather than on the number of points of the curve.
+        Use :meth:`setAppendBufferCapacity` to preallocate the storage
+        and to only keep the last points of the curve.
+
+        :param numpy.ndarray x: The x coordinates of the points to append
+        :param numpy.ndarray y: The y coordinates of the points to append
+        :raises ValueError: If the curve has error bars or a baseline array
+        """
+        x = numpy.atleast_1d(numpy.array(x, copy=False))
+        y = numpy.atleast_1d(numpy.array(y, copy=False))
+        assert len(x) == len(y)
+        assert x.ndim == y.ndim == 1
+
+        if (self.getXErrorData(copy=False) is not None or
+                self.getYErrorData(copy=False) is not None or
+                isinstance(self.getBaseline(copy=False), numpy.ndarray)):
+            raise ValueError(
+                "Cannot append data to a curve with errors or baseline array")
+        if len(x) == 0:
+            return
+
+        if self.__appendBuffer is None:
+            self.__appendBuffer = _AppendBuffer(
+                max(1024, 2 * (len(self._x) + len(x))), rolling=False)
+            self.__appendBuffer.append(self._x, self._y)
+
+        # Keep sorted state if appended points keep X sorted,
+        # else it is computed again when needed
+        isXSorted = (self.__isXSorted is True and
+                     (len(self._x) == 0 or x[0] >= self._x[-1]) and
+                     bool(numpy.all(x[1:] >= x[:-1])))
+
+        dropped = self.__appendBuffer.append(x, y)
+        self._x, self._y = self.__appendBuffer.getData()
+
+        # Update bounds of linear axes and reset other caches
+        key = False, False
+        previousBounds = self._boundsCache.get(key)
+        bounds = None
+        if previousBounds is not None and dropped is not None:
+            bounds = self.__updateBounds(previousBounds, x, y, *dropped)
+        self.__resetCaches()
+        self.__isXSorted = True if isXSorted else None
+        if bounds is not None:
+            self._boundsCache[key] = bounds
+
+        if bounds is None or bounds != previousBounds:
+            self._boundsChanged()
+        self._updated(ItemChangedType.DATA)
+
+    def __resetCaches(self):
+        """Reset cached information computed from the data"""
+        self._boundsCache = {}
+        self._filteredCache = {}
+        self._clippedCache = {}
+        self.__decimationCache = {}
+        self.__isXSorted = None
+        self.__decimationKey = None
+
+    @staticmethod
+    def __updateBounds(bounds, x, y, droppedX, droppedY):
+        """Update bounds with appended and dropped points.
+
+        :param List[float] bounds: (xmin, xmax, ymin, ymax) before update
+        :returns: Updated bounds or None if it needs to be computed again
+        """
+        if numpy.any(numpy.isnan(bounds)):
+            return None
+
+        bounds = list(bounds)
+        for index, added, removed in ((0, x, droppedX), (2, y, droppedY)):
+            if len(removed) > 0:
+                result = min_max(removed, finite=True)
+                if (result.minimum is not None and
+                        (result.minimum <= bounds[index] or
+                         result.maximum >= bounds[index + 1])):
+                    return None  # An extremum was dropped
+
+            result = min_max(added, finite=True)
+            if result.minimum is not None:
+                bounds[index] = min(bounds[index], result.minimum)
+                bounds[index + 1] = max(bounds[index + 1], result.maximum)
+        return tuple(bounds)
+
     def __getitem__(self, item):
         """Compatibility with PyMca and silx <= 0.4.0"""
         if isinstance(item, slice):
@@ -321,6 +736,19 @@ class Curve(PointsBase, ColorMixIn, YAxisMixIn, FillMixIn, LabelsMixIn,
         :param bool copy: True make a copy of the data (default),
                           False to use provided arrays.
         """
+        self.__resetCaches()
+        if self.__appendBuffer is not None:
+            if (xerror is not None or yerror is not None or
+                    isinstance(baseline, abc.Iterable)):
+                # Not supported by appendData: disable preallocated storage
+                self.__appendBuffer = None
+            else:
+                self.__appendBuffer.clear()
+                self.__appendBuffer.append(numpy.array(x, copy=False),
+                                           numpy.array(y, copy=False))
+                x, y = self.__appendBuffer.getData()
+                copy = False
+
         PointsBase.setData(self, x=x, y=y, xerror=xerror, yerror=yerror,
                            copy=copy)
         self._setBaseline(baseline=baseline)
@@ -0,0 +1,262 @@
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ###########################################################################*/
+"""This module provides the :class:`CurveCollection` item of the :class:`Plot`.
+
+A :class:`CurveCollection` displays many curves sharing the same style
+as a single item, so that backends can render them with a single draw call.
+"""
+
+__authors__ = ["T. Vincent"]
+__license__ = "MIT"
+__date__ = "16/10/2026"
+
+
+import logging
+
+import numpy
+
+from ....utils.proxy import docstring
+from ....math.combo import min_max
+from ... import colors
+from .core import (DataItem, AlphaMixIn, ColorMixIn, LabelsMixIn,
+                   LineMixIn, YAxisMixIn, ItemChangedType)
+from ._pick import PickingResult
+
+
+_logger = logging.getLogger(__name__)
+
+
+class CurveCollection(DataItem, AlphaMixIn, ColorMixIn, LabelsMixIn,
+                      LineMixIn, YAxisMixIn):
+    """Description of a set of curves sharing the same style.
+
+    Data is stored as a 2D array of shape (ncurves, npoints) for y,
+    with either a 1D x array of npoints values shared by all curves
+    or a 2D x array with the same shape as y.
+
+    Color is either a single color or an array with one color per curve.
+    Picking returns the indices of the picked curves.
+    """
+
+    _DEFAULT_Z_LAYER = 1
+    """Default overlay layer for curve collections"""
+
+    _DEFAULT_SELECTABLE = False
+    """Default selectable state for curve collections"""
+
+    _DEFAULT_LINEWIDTH = 1.
+    """Default line width of the curves"""
+
+    _DEFAULT_LINESTYLE = '-'
+    """Default line style of the curves"""
+
+    def __init__(self):
+        DataItem.__init__(self)
+        AlphaMixIn.__init__(self)
+        ColorMixIn.__init__(self)
+        LabelsMixIn.__init__(self)
+        LineMixIn.__init__(self)
+        YAxisMixIn.__init__(self)
+
+        self._x = numpy.empty((0,), dtype=numpy.float32)
+        self._y = numpy.empty((0, 0), dtype=numpy.float32)
+
+    def _getRGBAColors(self):
+        """Returns colors as a (ncurves, 4) array of float RGBA in [0, 1]
+
+        :rtype: numpy.ndarray
+        """
+        ncurves = len(self._y)
+        color = self.getColor()
+        if isinstance(color, numpy.ndarray) and color.ndim == 2:
+            if len(color) != ncurves:
+                _logger.warning(
+                    "Number of colors (%d) does not match number of curves "
+                    "(%d), using first color", len(color), ncurves)
+                color = color[:1]
+            rgba = numpy.ones((len(color), 4), dtype=numpy.float32)
+            if color.dtype.kind in 'fc':
+                rgba[:, :color.shape[1]] = color[:, :4]
+            else:
+                rgba[:, :color.shape[1]] = color[:, :4] / 255.
+        else:
+            rgba = numpy.array((colors.rgba(color),), dtype=numpy.float32)
+
+        if len(rgba) != ncurves:
+            rgba = numpy.repeat(rgba, ncurves, axis=0)
+        return rgba
+
+    def _addBackendRenderer(self, backend):
+        """Update backend renderer"""
+        x, y = self.getData(copy=False)
+        if y.size == 0:
+            return None  # No data to display, do not add renderer to backend
+
+        x = numpy.broadcast_to(x, y.shape)
+
+        # Filter-out values <= 0
+        plot = self.getPlot()
+        if plot is not None:
+            xPositive = plot.getXAxis()._isLogarithmic()
+            yPositive = plot.getYAxis()._isLogarithmic()
+        else:
+            xPositive = False
+            yPositive = False
+
+        if xPositive or yPositive:
+            with numpy.errstate(invalid='ignore'):  # Ignore NaN warnings
+                clipped = numpy.logical_or(
+                    (x <= 0) if xPositive else False,
+                    (y <= 0) if yPositive else False)
+            # Make a copy and replace negative points by NaN
+            x = numpy.array(x, dtype=numpy.float64)
+            y = numpy.array(y, dtype=numpy.float64)
+            x[clipped] = numpy.nan
+            y[clipped] = numpy.nan
+
+        return backend.addCurveCollection(x, y,
+                                          color=self._getRGBAColors(),
+                                          linewidth=self.getLineWidth(),
+                                          linestyle=self.getLineStyle(),
+                                          yaxis=self.getYAxis(),
+                                          alpha=self.getAlpha())
+
+    def _getBounds(self):
+        x, y = self.getData(copy=False)
+        if y.size == 0:
+            return None
+
+        plot = self.getPlot()
+        if plot is not None:
+            xPositive = plot.getXAxis()._isLogarithmic()
+            yPositive = plot.getYAxis()._isLogarithmic()
+        else:
+            xPositive = False
+            yPositive = False
+
+        if xPositive or yPositive:
+            x = numpy.broadcast_to(x, y.shape)
+            with numpy.errstate(invalid='ignore'):  # Ignore NaN warnings
+                clipped = numpy.logical_or(
+                    (x <= 0) if xPositive else False,
+                    (y <= 0) if yPositive else False)
+            if numpy.any(clipped):
+                x = numpy.array(x, dtype=numpy.float64)
+                y = numpy.array(y, dtype=numpy.float64)
+                x[clipped] = numpy.nan
+                y[clipped] = numpy.nan
+
+        xRange = min_max(x, finite=True)
+        yRange = min_max(y, finite=True)
+        if xRange.minimum is None or yRange.minimum is None:
+            return None
+        return (xRange.minimum, xRange.maximum,
+                yRange.minimum, yRange.maximum)
+
+    @docstring(DataItem)
+    def pick(self, x, y):
+        result = super(CurveCollection, self).pick(x, y)
+        if result is None:
+            return None
+        # Backends returns indices of picked curves
+        indices = numpy.unique(numpy.array(
+            result.getIndices(copy=False), dtype=numpy.int64))
+        if indices.size == 0:
+            return None
+        return PickingResult(self, indices)
+
+    def getNbCurves(self):
+        """Returns the number of curves in this collection
+
+        :rtype: int
+        """
+        return len(self._y)
+
+    def getXData(self, copy=True):
+        """Returns the x coordinates of the curves
+
+        Either a 1D array shared by all curves or a 2D array
+        with the same shape as y data.
+
+        :param copy: True (Default) to get a copy,
+                     False to use internal representation (do not modify!)
+        :rtype: numpy.ndarray
+        """
+        return numpy.array(self._x, copy=copy)
+
+    def getYData(self, copy=True):
+        """Returns the y coordinates of the curves as a 2D array
+
+        :param copy: True (Default) to get a copy,
+                     False to use internal representation (do not modify!)
+        :returns: Array of shape (ncurves, npoints)
+        :rtype: numpy.ndarray
+        """
+        return numpy.array(self._y, copy=copy)
+
+    def getData(self, copy=True):
+        """Returns the x and y coordinates of the curves
+
+        :param copy: True (Default) to get a copy,
+                     False to use internal representation (do not modify!)
+        :returns: (x, y)
+        :rtype: 2-tuple of numpy.ndarray
+        """
+        return self.getXData(copy), self.getYData(copy)
+
+    def setData(self, x, y, copy=True):
+        """Set the data of the curves.
+
+        :param numpy.ndarray x:
+            The x coordinates, either a 1D array of npoints values
+            shared by all curves or a 2D array of shape (ncurves, npoints).
+        :param numpy.ndarray y:
+            The y coordinates as a 2D array of shape (ncurves, npoints).
+        :param bool copy: True make a copy of the data (default),
+                          False to use provided arrays.
+        """
+        x = numpy.array(x, copy=copy)
+        y = numpy.array(y, copy=copy)
+
+        if y.ndim == 1:
+            y = numpy.atleast_2d(y)
+        if y.ndim != 2:
+            raise ValueError("y must be a 2D array: (ncurves, npoints)")
+
+        if x.ndim == 1:
+            if len(x) != y.shape[1]:
+                raise ValueError(
+                    "x and y number of points mismatch: %d != %d" %
+                    (len(x), y.shape[1]))
+        elif x.shape != y.shape:
+            raise ValueError(
+                "x and y shapes mismatch: %s != %s" %
+                (str(x.shape), str(y.shape)))
+
+        self._x = x
+        self._y = y
+
+        self._boundsChanged()
+        self._updated(ItemChangedType.DATA)
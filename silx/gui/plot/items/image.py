@@ -28,20 +28,25 @@ of the :class:`Plot`.
 
 __authors__ = ["T. Vincent"]
 __license__ = "MIT"
-__date__ = "20/10/2017"
+__date__ = "16/10/2026"
 
 
 try:
     from collections import abc
 except ImportError:  # Python2 support
     import collections as abc
+import functools
 import logging
+import math
 
 import numpy
 
 from ....utils.proxy import docstring
+from ...utils.concurrent import submitToQtMainThread
 from .core import (DataItem, LabelsMixIn, DraggableMixIn, ColormapMixIn,
                    AlphaMixIn, ItemChangedType)
+from .scatter import _GreedyThreadPoolExecutor
+from ._pick import PickingResult
 
 
 _logger = logging.getLogger(__name__)
@@ -87,6 +92,73 @@ def _convertImageToRgba32(image, copy=True):
         return numpy.array(image, copy=copy)
 
 
+def _downsampleRows(data, reduction):
+    """Reduce pairs of consecutive rows of an array.
+
+    If the number of rows is odd, the last row is reduced with itself.
+
+    :param numpy.ndarray data: Array to reduce along its first dimension
+    :param callable reduction: Function reducing 2 arrays into one
+    :rtype: numpy.ndarray
+    """
+    height = data.shape[0]
+    reduced = reduction(data[0:height - 1:2], data[1::2])
+    if height % 2:
+        reduced = numpy.concatenate(
+            (reduced, reduction(data[-1:], data[-1:])), axis=0)
+    return reduced
+
+
+def _mean2(a, b):
+    """Returns the mean of 2 arrays as float32"""
+    return numpy.add(a, b, dtype=numpy.float32) * numpy.float32(0.5)
+
+
+class _ImagePyramid(object):
+    """Lazily built multi-resolution pyramid of a 2D image.
+
+    Level 0 is the image itself and each level is half the size of the
+    previous one along both dimensions.
+
+    :param numpy.ndarray data: The 2D image
+    :param str reduction: The reduction to use: 'mean', 'min' or 'max'
+    """
+
+    _REDUCTIONS = {
+        'mean': _mean2,
+        'min': numpy.fmin,
+        'max': numpy.fmax,
+    }
+
+    def __init__(self, data, reduction):
+        assert data.ndim == 2
+        self._reduction = self._REDUCTIONS[reduction]
+        self._levels = [data]
+
+    def getMaxLevel(self):
+        """Returns the index of the coarsest level (with a 1x1 image).
+
+        :rtype: int
+        """
+        if self._levels[0].size == 0:
+            return 0
+        return max(0, int(math.ceil(math.log2(max(self._levels[0].shape)))))
+
+    def getLevel(self, level):
+        """Returns the image at the given level, building it if needed.
+
+        :param int level: Level of the pyramid in [0, :meth:`getMaxLevel`]
+        :rtype: numpy.ndarray
+        """
+        level = min(level, self.getMaxLevel())
+        while len(self._levels) <= level:
+            previous = self._levels[-1]
+            reduced = _downsampleRows(previous, self._reduction)
+            reduced = _downsampleRows(reduced.T, self._reduction).T
+            self._levels.append(numpy.ascontiguousarray(reduced))
+        return self._levels[level]
+
+
 class ImageBase(DataItem, LabelsMixIn, DraggableMixIn, AlphaMixIn):
     """Description of an image
 
@@ -246,12 +318,30 @@ class ImageBase(DataItem, LabelsMixIn, DraggableMixIn, AlphaMixIn):
 class ImageData(ImageBase, ColormapMixIn):
     """Description of a data image with a colormap"""
 
+    _LOD_TILE_SIZE = 256
+    """Size of the tiles (in pixels of a level) used to crop the displayed
+    region in level-of-detail mode"""
+
     def __init__(self):
         ImageBase.__init__(self, numpy.zeros((0, 0), dtype=numpy.float32))
         ColormapMixIn.__init__(self)
         self._alternativeImage = None
         self.__alpha = None
 
+        self.__lodReduction = None
+        self.__pyramid = None
+        self.__lodRegion = None
+        """(level, row start, row end, col start, col end) of the displayed
+        region in level-of-detail mode"""
+
+        self.__asyncColormap = False
+        self.__executor = None
+        self.__dataRevision = 0
+        self.__rgbaFuture = None
+        self.__rgbaFutureKey = None
+        self.__rgba = None
+        """(key, RGBA image, origin, scale) of the last colormapped image"""
+
     def _addBackendRenderer(self, backend):
         """Update backend renderer"""
         plot = self.getPlot()
@@ -260,9 +350,17 @@ class ImageData(ImageBase, ColormapMixIn):
             # Do not render with non linear scales
             return None
 
+        origin, scale = self.getOrigin(), self.getScale()
+
         if (self.getAlternativeImageData(copy=False) is not None or
                 self.getAlphaData(copy=False) is not None):
             dataToUse = self.getRgbaImageData(copy=False)
+        elif self.__lodReduction is not None:
+            self.__lodRegion = self.__computeLevelOfDetailRegion()
+            if self.__lodRegion is None:
+                return None  # Not visible
+            dataToUse, origin, scale = self.__getLevelOfDetailImage(
+                self.__lodRegion)
         else:
             dataToUse = self.getData(copy=False)
 
@@ -275,12 +373,237 @@ class ImageData(ImageBase, ColormapMixIn):
             colormap = colormap.copy()
             colormap.setVRange(*colormap.getColormapRange(self))
 
+        if (self.__asyncColormap and dataToUse.ndim == 2 and
+                not backend.isColormapAccelerated(colormap)):
+            # The worker thread uses a copy the GUI thread cannot modify
+            colormap = colormap.copy()
+            key = self.__dataRevision, self.__lodRegion, colormap
+            result = self.__getAsyncRgbaImage(
+                key, dataToUse, colormap, origin, scale)
+            if result is None:
+                return None  # Nothing to display yet
+            dataToUse, origin, scale = result
+            colormap = None
+
         return backend.addImage(dataToUse,
-                                origin=self.getOrigin(),
-                                scale=self.getScale(),
+                                origin=origin,
+                                scale=scale,
                                 colormap=colormap,
                                 alpha=self.getAlpha())
 
+    def isAsyncColormap(self):
+        """Returns whether the colormap is applied in a background thread.
+
+        :rtype: bool
+        """
+        return self.__asyncColormap
+
+    def setAsyncColormap(self, enabled):
+        """Enable/disable applying the colormap in a background thread.
+
+        When enabled and the backend does not apply the colormap on the GPU,
+        the RGBA image is computed asynchronously: the previously displayed
+        image is kept until the new one is available and pending
+        computations are cancelled when the data or colormap changes.
+
+        :param bool enabled: True to enable, False (the default) to disable
+        """
+        enabled = bool(enabled)
+        if enabled != self.__asyncColormap:
+            self.__asyncColormap = enabled
+            if not enabled:
+                self.__cancelAsyncRgbaImage()
+                self.__rgba = None
+            self._updated()
+
+    def __getExecutor(self):
+        """Returns async greedy executor
+
+        :rtype: _GreedyThreadPoolExecutor
+        """
+        if self.__executor is None:
+            self.__executor = _GreedyThreadPoolExecutor(max_workers=1)
+        return self.__executor
+
+    def __cancelAsyncRgbaImage(self):
+        """Cancel pending colormap computation"""
+        if self.__rgbaFuture is not None:
+            self.__rgbaFuture.cancel()
+        self.__rgbaFuture = None
+        self.__rgbaFutureKey = None
+
+    def __getAsyncRgbaImage(self, key, data, colormap, origin, scale):
+        """Returns the colormapped image if available, else the previous one.
+
+        If the image corresponding to key is not available,
+        its computation is started in a background thread.
+
+        :param key: Identifier of the data and colormap state
+        :param numpy.ndarray data: The data to apply colormap to
+        :param ~silx.gui.colors.Colormap colormap:
+            The colormap to apply with its range set.
+            It is used from another thread and must not be modified.
+        :param origin: Origin of the image to display
+        :param scale: Scale of the image to display
+        :returns: (RGBA image, origin, scale) or None if nothing is available
+        """
+        if self.__rgba is not None and self.__rgba[0] == key:
+            # The RGBA image does not depend on origin and scale:
+            # Display it with the current ones
+            self.__rgba = key, self.__rgba[1], origin, scale
+            return self.__rgba[1:]
+
+        if self.__rgbaFuture is None or self.__rgbaFutureKey != key:
+            future = self.__getExecutor().submit_greedy(
+                'colormap', colormap.applyToData, data)
+            self.__rgbaFuture = future
+            self.__rgbaFutureKey = key
+            future.add_done_callback(functools.partial(
+                self.__rgbaImageComputed, key, origin, scale))
+
+        # Display previous image while computing the new one
+        return None if self.__rgba is None else self.__rgba[1:]
+
+    def __rgbaImageComputed(self, key, origin, scale, future):
+        """Handle end of async colormap computation (from any thread)"""
+        if not future.cancelled():
+            submitToQtMainThread(
+                self.__setAsyncRgbaImage, key, origin, scale, future)
+
+    def __setAsyncRgbaImage(self, key, origin, scale, future):
+        """Store the result of async colormap computation (in main thread)"""
+        if future is not self.__rgbaFuture:
+            return  # Outdated result
+        self.__rgbaFuture = None
+        self.__rgbaFutureKey = None
+
+        exception = future.exception()
+        if exception is not None:
+            _logger.error("Error while applying colormap: %s", exception)
+            return
+
+        self.__rgba = key, future.result(), origin, scale
+        self._updated()
+
+    def getLevelOfDetailReduction(self):
+        """Returns the reduction used to build the multi-resolution pyramid.
+
+        :returns: 'mean', 'min', 'max' or None if level-of-detail is disabled
+        :rtype: Union[str,None]
+        """
+        return self.__lodReduction
+
+    def setLevelOfDetailReduction(self, reduction):
+        """Enable/disable level-of-detail rendering.
+
+        When enabled, a pyramid of downsampled images is lazily built and
+        only the part of the level matching the visible area and the
+        resolution of the plot is sent to the backend.
+        This only applies to images displayed through a colormap
+        (i.e., without alternative RGB(A) image nor alpha image).
+
+        :param Union[str,None] reduction:
+            The reduction to use to downsample the image:
+            'mean', 'min', 'max' or None (the default) to disable
+            level-of-detail and display the full resolution image.
+        """
+        if reduction is not None and \
+                reduction not in _ImagePyramid._REDUCTIONS:
+            raise ValueError("Unsupported reduction: %s" % reduction)
+        if reduction != self.__lodReduction:
+            self.__lodReduction = reduction
+            self.__pyramid = None
+            self.__lodRegion = None
+            self._setVisibleBoundsTracking(reduction is not None)
+            self._updated()
+
+    def _visibleBoundsChanged(self, *args) -> None:
+        super()._visibleBoundsChanged(*args)
+        if (self.__lodReduction is not None and
+                self.__computeLevelOfDetailRegion() != self.__lodRegion):
+            self._updated()
+
+    def __computeLevelOfDetailRegion(self):
+        """Returns the pyramid level and the region of it to display.
+
+        The region is extended to tiles boundaries, so that small
+        interactions do not require a new upload to the backend.
+
+        :returns: (level, row start, row end, col start, col end) or None
+        :rtype: Union[List[int],None]
+        """
+        plot = self.getPlot()
+        bounds = self.getVisibleBounds()
+        if plot is None or bounds is None:
+            return None
+        height, width = self.getData(copy=False).shape
+        xmin, xmax, ymin, ymax = bounds
+        ox, oy = self.getOrigin()
+        sx, sy = self.getScale()
+
+        # Visible data indices, taking care that scale might be < 0
+        cols = sorted(((xmin - ox) / sx, (xmax - ox) / sx))
+        rows = sorted(((ymin - oy) / sy, (ymax - oy) / sy))
+
+        # Select the coarsest level with at least one pixel per screen pixel
+        plotWidth, plotHeight = plot.getPlotBoundsInPixels()[2:]
+        density = min((cols[1] - cols[0]) / max(1, plotWidth),
+                      (rows[1] - rows[0]) / max(1, plotHeight))
+        level = 0 if density < 2 else int(math.log2(density))
+
+        if self.__pyramid is None:
+            self.__pyramid = _ImagePyramid(
+                self.getData(copy=False), self.__lodReduction)
+        level = min(level, self.__pyramid.getMaxLevel())
+        levelHeight, levelWidth = self.__pyramid.getLevel(level).shape
+
+        # Each pixel of the level covers 2**level pixels of the data
+        factor = 2 ** level
+        tile = self._LOD_TILE_SIZE
+        region = [level]
+        for (start, end), levelSize in ((rows, levelHeight), (cols, levelWidth)):
+            start = int(start / factor) // tile * tile
+            end = int(math.ceil(end / factor / tile)) * tile
+            region.extend((max(0, start), min(end, levelSize)))
+        return tuple(region)
+
+    def __getLevelOfDetailImage(self, region):
+        """Returns the image to display for a region of the pyramid.
+
+        :param List[int] region: (level, row start, row end, col start, col end)
+        :returns: (image, origin, scale)
+        """
+        level, row0, row1, col0, col1 = region
+        image = self.__pyramid.getLevel(level)
+        ox, oy = self.getOrigin()
+        sx, sy = self.getScale()
+        # Scale so that level pixels are aligned with data pixels
+        factor = 2 ** level
+        sx *= factor
+        sy *= factor
+        return (image[row0:row1, col0:col1],
+                (ox + col0 * sx, oy + row0 * sy),
+                (sx, sy))
+
+    @docstring(DataItem)
+    def pick(self, x, y):
+        result = super().pick(x, y)
+        if result is None or self.__lodRegion is None:
+            return result
+
+        # Convert indices in the displayed region to full resolution indices
+        dataPos = self.getPlot().pixelToData(x, y, axis='left', check=True)
+        if dataPos is None:
+            return None
+        ox, oy = self.getOrigin()
+        sx, sy = self.getScale()
+        height, width = self.getData(copy=False).shape
+        col = int(numpy.floor((dataPos[0] - ox) / sx))
+        row = int(numpy.floor((dataPos[1] - oy) / sy))
+        if not (0 <= row < height and 0 <= col < width):
+            return None
+        return PickingResult(self, ((row,), (col,)))
+
     def __getitem__(self, item):
         """Compatibility with PyMca and silx <= 0.4.0"""
         if item == 3:
@@ -376,6 +699,9 @@ class ImageData(ImageBase, ColormapMixIn):
                 alpha = numpy.clip(alpha, 0., 1.)
         self.__alpha = alpha
 
+        self.__pyramid = None
+        self.__lodRegion = None
+        self.__dataRevision += 1
         super().setData(data)
 
 
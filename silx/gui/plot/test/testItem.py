@@ -29,10 +29,12 @@ __license__ = "MIT"
 __date__ = "01/09/2017"
 
 
+import time
 import unittest
 
 import numpy
 
+from silx.gui.colors import Colormap
 from silx.gui.utils.testutils import SignalListener
 from silx.gui.plot.items import ItemChangedType
 from silx.gui.plot import items
@@ -328,10 +330,325 @@ class TestVisibleExtent(PlotWidgetTestCase):
         self.assertEqual(listener.callCount(), 5)
 
 
+class TestImageLevelOfDetail(PlotWidgetTestCase):
+    """Test ImageData level-of-detail rendering"""
+
+    def testPyramid(self):
+        """Test the multi-resolution pyramid of an image"""
+        data = numpy.arange(15, dtype=numpy.float32).reshape(3, 5)
+        pyramid = items.image._ImagePyramid(data, 'max')
+        self.assertEqual(pyramid.getMaxLevel(), 3)
+        self.assertIs(pyramid.getLevel(0), data)
+        numpy.testing.assert_array_equal(
+            pyramid.getLevel(1), [[6, 8, 9], [11, 13, 14]])
+        numpy.testing.assert_array_equal(pyramid.getLevel(2), [[13, 14]])
+        numpy.testing.assert_array_equal(pyramid.getLevel(3), [[14]])
+        numpy.testing.assert_array_equal(pyramid.getLevel(10), [[14]])
+
+        pyramid = items.image._ImagePyramid(data, 'mean')
+        numpy.testing.assert_array_equal(
+            pyramid.getLevel(1), [[3, 5, 6.5], [10.5, 12.5, 14]])
+
+        # Empty image
+        data = numpy.zeros((0, 0), dtype=numpy.float32)
+        pyramid = items.image._ImagePyramid(data, 'mean')
+        self.assertEqual(pyramid.getMaxLevel(), 0)
+        self.assertIs(pyramid.getLevel(2), data)
+
+    def testEmptyImage(self):
+        """Test level-of-detail rendering of the default empty image"""
+        image = items.ImageData()
+        image.setLevelOfDetailReduction('max')
+        self.plot.addItem(image)
+        self.plot.resetZoom()
+        self.qapp.processEvents()
+        self.assertIsNone(image._backendRenderer)
+
+    def testLevelOfDetail(self):
+        """Test displayed level and region depending on plot limits"""
+        image = items.ImageData()
+        image.setData(numpy.arange(2048 * 2048).reshape(2048, 2048))
+        self.assertIsNone(image.getLevelOfDetailReduction())
+        image.setLevelOfDetailReduction('mean')
+        self.assertEqual(image.getLevelOfDetailReduction(), 'mean')
+        with self.assertRaises(ValueError):
+            image.setLevelOfDetailReduction('median')
+
+        self.plot.addItem(image)
+        self.plot.resetZoom()
+        self.qapp.processEvents()
+
+        region = image._ImageData__lodRegion
+        self.assertIsNotNone(region)
+        level = region[0]
+        self.assertGreater(level, 0)
+        self.assertEqual(region[1:], (0, 2048 >> level, 0, 2048 >> level))
+
+        # Zoom in: full resolution and cropped to the visible area
+        self.plot.getXAxis().setLimits(1000, 1010)
+        self.plot.getYAxis().setLimits(1000, 1010)
+        self.qapp.processEvents()
+        self.assertEqual(image._ImageData__lodRegion, (0, 768, 1024, 768, 1024))
+
+        result = image.pick(*self.plot.dataToPixel(1005.5, 1002.5))
+        self.assertIsNotNone(result)
+        numpy.testing.assert_array_equal(result.getIndices(), [[1002], [1005]])
+
+        image.setLevelOfDetailReduction(None)
+        self.qapp.processEvents()
+        self.assertIsNone(image._ImageData__lodRegion)
+
+    def testOddSizeLevelOfDetail(self):
+        """Test that level pixels are aligned with data pixels"""
+        image = items.ImageData()
+        image.setData(numpy.arange(2047 * 2045).reshape(2047, 2045))
+        image.setLevelOfDetailReduction('max')
+        self.plot.addItem(image)
+        self.plot.resetZoom()
+        self.qapp.processEvents()
+
+        region = image._ImageData__lodRegion
+        level = region[0]
+        self.assertGreater(level, 0)
+        _, origin, scale = image._ImageData__getLevelOfDetailImage(region)
+        self.assertEqual(origin, (0, 0))
+        self.assertEqual(scale, (2 ** level, 2 ** level))
+
+    def testPickNegativeScale(self):
+        """Test picking a level-of-detail image with a negative scale"""
+        image = items.ImageData()
+        image.setData(numpy.arange(2048 * 2048).reshape(2048, 2048))
+        image.setScale((-1, -1))
+        image.setLevelOfDetailReduction('mean')
+        self.plot.addItem(image)
+        self.plot.getXAxis().setLimits(-1010, -1000)
+        self.plot.getYAxis().setLimits(-1010, -1000)
+        self.qapp.processEvents()
+        self.assertIsNotNone(image._ImageData__lodRegion)
+
+        result = image.pick(*self.plot.dataToPixel(-1005.5, -1002.5))
+        self.assertIsNotNone(result)
+        numpy.testing.assert_array_equal(result.getIndices(), [[1002], [1005]])
+
+
+class TestCurveEnvelopeDecimation(PlotWidgetTestCase):
+    """Test Curve envelope decimation"""
+
+    def testEnvelopeDecimation(self):
+        """Test the decimation function"""
+        x = numpy.arange(10.)
+        y = numpy.array((0., 5., -1., 2., 3., 3., 8., 1., numpy.nan, 2.))
+        decimatedX, decimatedY, starts = items.curve._envelopeDecimation(
+            x, y, x, 3)
+        numpy.testing.assert_array_equal(starts, (0, 3, 6))
+        numpy.testing.assert_array_equal(
+            decimatedX, (0, 0, 0, 2, 3, 3, 3, 5, 6, 6, 6, 9))
+        numpy.testing.assert_array_equal(
+            decimatedY, (0, -1, 5, -1, 2, 2, 3, 3, 8, 1, 8, 2))
+
+    def testDecimatedCurve(self):
+        """Test a decimated curve in a plot"""
+        x = numpy.arange(100000)
+        y = numpy.sin(x / 1000.)
+        curve = items.Curve()
+        curve.setData(x, y)
+        self.assertFalse(curve.isEnvelopeDecimation())
+        curve.setEnvelopeDecimation(True)
+        self.assertTrue(curve.isEnvelopeDecimation())
+
+        self.plot.addItem(curve)
+        self.plot.resetZoom()
+        self.qapp.processEvents()
+
+        key = curve._Curve__decimationKey
+        self.assertIsNotNone(key)
+        nbins = key[0]
+        self.assertLess(nbins * 4, len(x))
+        self.assertGreaterEqual(nbins, self.plot.getPlotBoundsInPixels()[2])
+
+        # Bounds are computed from the full data
+        self.assertEqual(curve.getBounds(), (0, 99999, y.min(), y.max()))
+
+        # Picking returns indices in the full data
+        xPick, yPick = self.plot.dataToPixel(50000, y[50000])
+        result = curve.pick(xPick, yPick)
+        self.assertIsNotNone(result)
+        for index in result.getIndices():
+            self.assertLess(abs(index - 50000), 1000)
+
+        # Panning does not change decimation
+        self.plot.getXAxis().setLimits(10000, 110000)
+        self.qapp.processEvents()
+        self.assertEqual(curve._Curve__decimationKey, key)
+
+        # Zooming in disables decimation
+        self.plot.getXAxis().setLimits(1000, 1100)
+        self.qapp.processEvents()
+        self.assertIsNone(curve._Curve__decimationKey)
+
+        # Y axis log scale filters out values <= 0 in the decimated curve
+        self.plot.getYAxis().setScale('log')
+        self.qapp.processEvents()
+        key = curve._Curve__decimationKey
+        self.assertIsNotNone(key)
+        decimatedY = curve._Curve__getDecimatedData(key)[1]
+        self.assertFalse(numpy.any(decimatedY <= 0))
+        self.plot.getYAxis().setScale('linear')
+
+        # Not sorted data is not decimated
+        curve.setData(x[::-1], y)
+        self.plot.resetZoom()
+        self.qapp.processEvents()
+        self.assertIsNone(curve._Curve__decimationKey)
+
+
+class TestCurveAppendData(PlotWidgetTestCase):
+    """Test Curve appendData"""
+
+    def testAppendBuffer(self):
+        """Test preallocated storage of points"""
+        buffer_ = items.curve._AppendBuffer(4, rolling=True)
+        dropped = buffer_.append(numpy.arange(3), numpy.arange(3))
+        self.assertEqual(len(dropped[0]), 0)
+        dropped = buffer_.append(numpy.arange(3, 6), numpy.arange(3, 6))
+        numpy.testing.assert_array_equal(dropped[0], (0, 1))
+        for _ in range(5):
+            x, y = buffer_.getData()
+            dropped = buffer_.append((x[-1] + 1,), (y[-1] + 1,))
+            self.assertEqual(len(dropped[0]), 1)
+        numpy.testing.assert_array_equal(buffer_.getData()[0], (7, 8, 9, 10))
+        self.assertIsNone(buffer_.append(numpy.arange(10), numpy.arange(10)))
+        numpy.testing.assert_array_equal(buffer_.getData()[1], (6, 7, 8, 9))
+
+        buffer_ = items.curve._AppendBuffer(2, rolling=False)
+        buffer_.append(numpy.arange(3), numpy.arange(3))
+        buffer_.append(numpy.arange(3, 10), numpy.arange(3, 10))
+        self.assertGreaterEqual(buffer_.getCapacity(), 10)
+        numpy.testing.assert_array_equal(buffer_.getData()[0], numpy.arange(10))
+
+    def testAppendData(self):
+        """Test appending points to a curve"""
+        curve = items.Curve()
+        self.plot.addItem(curve)
+        listener = SignalListener()
+        curve.sigItemChanged.connect(listener)
+
+        curve.appendData((0, 1, 2), (1, 2, 0))
+        curve.appendData(3, 3)
+        numpy.testing.assert_array_equal(curve.getXData(), (0, 1, 2, 3))
+        numpy.testing.assert_array_equal(curve.getYData(), (1, 2, 0, 3))
+        self.assertEqual(curve.getBounds(), (0, 3, 0, 3))
+        self.assertEqual(listener.arguments(argumentIndex=0),
+                         [ItemChangedType.DATA] * 2)
+
+        curve.setAppendBufferCapacity(3)
+        self.assertEqual(curve.getAppendBufferCapacity(), 3)
+        numpy.testing.assert_array_equal(curve.getXData(), (1, 2, 3))
+        self.assertEqual(curve.getBounds(), (1, 3, 0, 3))
+
+        curve.appendData(4, 1)  # Drops the min of X
+        self.assertEqual(curve.getBounds(), (2, 4, 0, 3))
+        curve.appendData(5, 5)  # Drops the min of Y
+        self.assertEqual(curve.getBounds(), (3, 5, 1, 5))
+        numpy.testing.assert_array_equal(curve.getYData(), (3, 1, 5))
+
+        curve.setData((0, 1, 2, 3, 4), (0, 1, 2, 3, 4))
+        numpy.testing.assert_array_equal(curve.getXData(), (2, 3, 4))
+
+        curve.setAppendBufferCapacity(None)
+        self.assertIsNone(curve.getAppendBufferCapacity())
+        numpy.testing.assert_array_equal(curve.getXData(), (2, 3, 4))
+
+        curve.setData((0, 1), (0, 1), yerror=0.1)
+        with self.assertRaises(ValueError):
+            curve.appendData(2, 2)
+
+
+class TestCurveCollection(PlotWidgetTestCase):
+    """Test CurveCollection item"""
+
+    def testCurveCollection(self):
+        """Test setting data, bounds and picking of a CurveCollection"""
+        collection = items.CurveCollection()
+        x = numpy.arange(10)
+        y = numpy.array((numpy.zeros(10), numpy.ones(10), 2 * numpy.ones(10)))
+        collection.setData(x, y)
+        collection.setColor(((1., 0., 0., 1.), (0., 1., 0., 1.), (0., 0., 1., 1.)))
+        self.assertEqual(collection.getNbCurves(), 3)
+        numpy.testing.assert_array_equal(collection.getXData(), x)
+        numpy.testing.assert_array_equal(collection.getYData(), y)
+
+        with self.assertRaises(ValueError):
+            collection.setData(numpy.arange(5), y)
+
+        self.plot.addItem(collection)
+        self.plot.resetZoom()
+        self.qapp.processEvents()
+        self.assertEqual(collection.getBounds(), (0, 9, 0, 2))
+        self.assertEqual(self.plot.getDataRange(), ((0, 9), (0, 2), None))
+
+        xPixel, yPixel = self.plot.dataToPixel(4.5, 1)
+        result = collection.pick(xPixel, yPixel)
+        self.assertIsNotNone(result)
+        numpy.testing.assert_array_equal(result.getIndices(), (1,))
+
+        self.plot.getYAxis()._setLogarithmic(True)
+        self.qapp.processEvents()
+        self.assertEqual(collection.getBounds(), (0, 9, 1, 2))
+
+
+class TestImageAsyncColormap(PlotWidgetTestCase):
+    """Test ImageData colormap applied in a background thread"""
+
+    def _waitRendered(self, item, expected, timeout=5.):
+        """Process events until item is rendered with expected RGBA image"""
+        end = time.time() + timeout
+        while time.time() < end:
+            self.qapp.processEvents()
+            renderer = item._backendRenderer
+            if (renderer is not None and
+                    numpy.array_equal(renderer.get_array(), expected)):
+                return
+            time.sleep(0.01)
+        self.fail("Image not rendered")
+
+    def testAsyncColormap(self):
+        """Test rendering and update of colormap"""
+        data = numpy.arange(100 * 100, dtype=numpy.float32).reshape(100, 100)
+        image = items.ImageData()
+        image.setData(data)
+        image.setColormap(Colormap(name='gray', vmin=0, vmax=data.max()))
+        image.setAsyncColormap(True)
+        self.assertTrue(image.isAsyncColormap())
+        self.plot.addItem(image)
+        self._waitRendered(image, image.getColormap().applyToData(data))
+
+        # Previous image is displayed until the new one is available
+        image.getColormap().setVRange(0, 1)
+        self.qapp.processEvents()
+        self.assertIsNotNone(image._backendRenderer)
+        self._waitRendered(image, image.getColormap().applyToData(data))
+
+        # Origin and scale changes are applied to the displayed image
+        image.setOrigin((10, 20))
+        image.setScale((2, 3))
+        self.qapp.processEvents()
+        self.assertEqual(tuple(image._backendRenderer.get_extent()),
+                         (10, 210, 20, 320))
+
+        image.setAsyncColormap(False)
+        self.assertFalse(image.isAsyncColormap())
+        self.qapp.processEvents()
+        self.assertEqual(image._backendRenderer.get_array().ndim, 3)
+
+
 def suite():
     test_suite = unittest.TestSuite()
     loadTests = unittest.defaultTestLoader.loadTestsFromTestCase
-    for klass in (TestSigItemChangedSignal, TestSymbol, TestVisibleExtent):
+    for klass in (TestSigItemChangedSignal, TestSymbol, TestVisibleExtent,
+                  TestImageLevelOfDetail, TestCurveEnvelopeDecimation,
+                  TestCurveAppendData, TestCurveCollection,
+                  TestImageAsyncColormap):
         test_suite.addTest(loadTests(klass))
     return test_suite
 
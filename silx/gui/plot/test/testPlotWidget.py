@@ -229,6 +229,27 @@ class TestPlotWidget(PlotWidgetTestCase, ParametricTestCase):
         self.assertFalse(color.isValid())
         self.qapp.processEvents()
 
+    def testDataRange(self):
+        """Test getDataRange update when items change"""
+        self.assertEqual(self.plot.getDataRange(), (None, None, None))
+
+        self.plot.addCurve((0, 1), (0, 1), legend='a')
+        self.plot.addCurve((-1, 2), (5, 6), legend='b', yaxis='right')
+        self.assertEqual(self.plot.getDataRange(), ((-1, 2), (0, 1), (5, 6)))
+
+        curve = self.plot.getCurve('a')
+        curve.setData((3, 4), (-2, -1))
+        self.assertEqual(self.plot.getDataRange(), ((-1, 4), (-2, -1), (5, 6)))
+
+        curve.setYAxis('right')
+        self.assertEqual(self.plot.getDataRange(), ((-1, 4), None, (-2, 6)))
+
+        self.plot.getCurve('b').setVisible(False)
+        self.assertEqual(self.plot.getDataRange(), ((3, 4), None, (-2, -1)))
+
+        self.plot.remove('a', kind='curve')
+        self.assertEqual(self.plot.getDataRange(), (None, None, None))
+
 
 class TestPlotImage(PlotWidgetTestCase, ParametricTestCase):
     """Basic tests for addImage"""
@@ -602,6 +602,64 @@ class TestAutoscaleRange(ParametricTestCase):
                     self.assertAlmostEqual(vRange[0], expectedRange[0])
                     self.assertAlmostEqual(vRange[1], expectedRange[1])
 
+    def testPercentiles(self):
+        """Test percentile autoscale modes"""
+        data = numpy.arange(1, 10001, dtype=numpy.float64)
+        data[0] = numpy.nan
+        for norm, mode, expectedRange in (
+                (Colormap.LINEAR, Colormap.PERCENTILE_1_99, (101, 9901)),
+                (Colormap.LINEAR, Colormap.PERCENTILE_5_95, (501, 9501)),
+                (Colormap.SQRT, Colormap.PERCENTILE_5_95, (501, 9501)),
+                (Colormap.LOGARITHM, Colormap.PERCENTILE_1_99, (101, 9901))):
+            with self.subTest(norm=norm, mode=mode):
+                colormap = Colormap(normalization=norm, autoscaleMode=mode)
+                vmin, vmax = colormap.getColormapRange(data)
+                self.assertAlmostEqual(vmin, expectedRange[0], delta=50)
+                self.assertAlmostEqual(vmax, expectedRange[1], delta=50)
+
+        constant = numpy.ones(10)
+        colormap = Colormap(autoscaleMode=Colormap.PERCENTILE_1_99)
+        self.assertEqual(colormap.getColormapRange(constant), (1, 1))
+
+    def testInPlaceUpdate(self):
+        """Test that autoscale range follows in place modification of data"""
+        data = numpy.arange(2 ** 16, dtype=numpy.float32)
+        colormap = Colormap()
+        self.assertEqual(colormap.getColormapRange(data), (0, 2 ** 16 - 1))
+        data *= 2
+        self.assertEqual(colormap.getColormapRange(data), (0, 2 ** 17 - 2))
+
+    def testDataSummaryCache(self):
+        """Test that percentile modes share a cached data summary"""
+        data = numpy.arange(1, 10001, dtype=numpy.float64)
+        summaries = {}
+        colormap = Colormap(autoscaleMode=Colormap.PERCENTILE_1_99)
+        colormap._computeAutoscaleRange(data, summaries)
+        self.assertEqual(len(summaries), 1)
+        summary = list(summaries.values())[0]
+        self.assertEqual(summary.statistics.count, 10000)
+
+        colormap.setAutoscaleMode(Colormap.PERCENTILE_5_95)
+        vmin, vmax = colormap._computeAutoscaleRange(data, summaries)
+        self.assertIs(list(summaries.values())[0], summary)
+        self.assertAlmostEqual(vmin, 501, delta=50)
+        self.assertAlmostEqual(vmax, 9501, delta=50)
+
+    def testItemDataSummaryReset(self):
+        """Test that the summary cache of an item is reset with its data"""
+        image = items.ImageData()
+        image.setData(numpy.arange(10000, dtype=numpy.float32).reshape(100, 100))
+        colormap = Colormap(autoscaleMode=Colormap.PERCENTILE_1_99)
+        image.setColormap(colormap)
+        vRange = colormap.getColormapRange(image)
+        self.assertEqual(len(image._ColormapMixIn__cacheDataSummaries), 1)
+
+        image.setData(numpy.arange(10000, dtype=numpy.float32).reshape(100, 100) * 2)
+        self.assertEqual(len(image._ColormapMixIn__cacheDataSummaries), 0)
+        vmin, vmax = colormap.getColormapRange(image)
+        self.assertAlmostEqual(vmax, 2 * vRange[1], delta=50)
+
+
 def suite():
     test_suite = unittest.TestSuite()
     loadTests = unittest.defaultTestLoader.loadTestsFromTestCase
@@ -549,6 +549,32 @@ class _LinkToDataset(Dataset):
         return self.__target.attrs
 
 
+class MemoryMappedDataset(Dataset):
+    """Dataset exposing data stored contiguously in a file through a
+    read-only memory map.
+
+    Only the pages of the file which are accessed by slicing are read.
+    """
+
+    def __init__(self, name, filename, dtype, shape, offset=0, order="C",
+                 parent=None, attrs=None):
+        """
+        Constructor
+
+        :param str name: Name of the dataset
+        :param str filename: Name of the file containing the data
+        :param numpy.dtype dtype: Type of the data, including its byte order
+        :param tuple shape: Shape of the data
+        :param int offset: Position of the data in the file in bytes
+        :param str order: Memory layout of the data: "C" or "F"
+        :param Node parent: Parent of the dataset
+        :param dict attrs: Attributes of the dataset
+        """
+        data = numpy.memmap(filename, dtype=dtype, mode="r",
+                            offset=offset, shape=tuple(shape), order=order)
+        Dataset.__init__(self, name, data, parent, attrs=attrs)
+
+
 class LazyLoadableDataset(Dataset):
     """Abstract dataset which provides a lazy loading of the data.
 
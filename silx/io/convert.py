@@ -56,7 +56,12 @@ __license__ = "MIT"
 __date__ = "17/07/2018"
 
 
+import collections
+from concurrent.futures import ProcessPoolExecutor
 import logging
+import multiprocessing
+import shutil
+import tempfile
 
 import h5py
 import numpy
@@ -64,11 +69,18 @@ import six
 
 import silx.io
 from silx.io import is_dataset, is_group, is_softlink
+from silx.io import commonh5
 from silx.io import fabioh5
+from silx.io import spech5
+from silx.io.specfile import SpecFile, is_specfile
 
 
 _logger = logging.getLogger(__name__)
 
+SPEC_SCANS_PER_TASK = 16
+"""Number of scans parsed by a worker process in a single task
+when converting a SPEC file with multiple processes"""
+
 
 def _create_link(h5f, link_name, target_name,
                  link_type="soft", overwrite_data=False):
@@ -120,6 +132,74 @@ def _attr_utf8(attr_value):
     return out_attr_value
 
 
+class _Text(object):
+    """Picklable container for text data of a commonh5 node"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def _to_picklable(value):
+    """Wrap text values, whose h5py dtype may not survive pickling
+
+    :param value: Value of a dataset or of an attribute
+    """
+    if isinstance(value, numpy.ndarray) and value.dtype.kind == "O":
+        return _Text(value.tolist())
+    return value
+
+
+def _from_picklable(value):
+    """Revert :func:`_to_picklable`"""
+    if isinstance(value, _Text):
+        return numpy.array(value.value,
+                           dtype=h5py.special_dtype(vlen=six.text_type))
+    return value
+
+
+_worker_specfiles = {}
+"""SPEC files opened by a worker process, by filename"""
+
+
+def _read_spec_scans(filename, index_cache, scan_keys):
+    """Read scans of a SPEC file in a worker process.
+
+    :param str filename: Path of the SPEC file
+    :param str index_cache: Directory of the scan index of the SPEC file
+    :param List[str] scan_keys: Keys of the scans to read (e.g. ``"1.1"``)
+    :return: List of ``(kind, name, value, attrs)`` records, with ``kind``
+        one of ``"group"``, ``"dataset"`` or ``"link"``, ``name`` the path
+        relative to the root and ``value`` the data or the link target.
+    :rtype: List[tuple]
+    """
+    if filename not in _worker_specfiles:
+        _worker_specfiles[filename] = (
+            SpecFile(filename, index_cache=index_cache),
+            commonh5.File(filename))
+    sf, root = _worker_specfiles[filename]
+
+    records = []
+
+    def append_record(name, obj):
+        if is_softlink(obj):
+            records.append(("link", name, obj.path.lstrip("/"), None))
+            return
+        attrs = dict((key, _to_picklable(obj.attrs[key])) for key in obj.attrs)
+        if is_dataset(obj):
+            records.append(("dataset", name, _to_picklable(obj.value), attrs))
+        elif is_group(obj):
+            records.append(("group", name, None, attrs))
+
+    for scan_key in scan_keys:
+        scan_group = spech5.ScanGroup(scan_key, parent=root, scan=sf[scan_key])
+        append_record(scan_key, scan_group)
+        scan_group.visititems(
+            lambda name, obj: append_record(scan_key + "/" + name, obj),
+            visit_links=True)
+    return records
+
+
 class Hdf5Writer(object):
     """Converter class to write the content of a data file to a HDF5 file.
     """
@@ -178,13 +258,76 @@ class Hdf5Writer(object):
         # Recurse through all groups and datasets to add them to the HDF5
         self._h5f = h5f
         infile.visititems(self.append_member_to_h5, visit_links=True)
+        self._write_root_attrs_and_links(infile.attrs)
+
+    def write_specfile(self, filename, h5f, workers=0):
+        """Do the conversion from a SPEC file to *h5f* (HDF5) using
+        a pool of processes.
+
+        Scans are parsed by worker processes, by batches of
+        :data:`SPEC_SCANS_PER_TASK`, and written in order by this process.
+        The output is the same as :meth:`write` with a :class:`SpecH5`.
+
+        :param str filename: Path of the SPEC file
+        :param h5f: :class:`h5py.File` instance
+        :param int workers: Number of worker processes,
+            0 (default) to use one per CPU.
+        """
+        self._h5f = h5f
+        if workers <= 0:
+            workers = multiprocessing.cpu_count()
+
+        # The file is indexed once and workers reuse this index
+        index_cache = silx.config.DEFAULT_SPECFILE_INDEX_CACHE
+        tmp_dir = None
+        if not isinstance(index_cache, six.string_types):
+            tmp_dir = tempfile.mkdtemp(prefix="silx_convert_")
+            index_cache = tmp_dir
+        try:
+            sf = SpecFile(filename, index_cache=index_cache)
+            scan_keys = sf.keys()
+            sf.close()
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Limit the number of parsed scans waiting to be written
+                pending = collections.deque()
+                for start in range(0, len(scan_keys), SPEC_SCANS_PER_TASK):
+                    stop = start + SPEC_SCANS_PER_TASK
+                    pending.append(executor.submit(
+                        _read_spec_scans, filename, index_cache,
+                        scan_keys[start:stop]))
+                    if len(pending) >= 2 * workers:
+                        self._write_records(pending.popleft().result())
+                while pending:
+                    self._write_records(pending.popleft().result())
+        finally:
+            if tmp_dir is not None:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        self._write_root_attrs_and_links(spech5._get_root_attrs(filename))
+
+    def _write_records(self, records):
+        """Write the groups, datasets and links read by
+        :func:`_read_spec_scans`"""
+        for kind, name, value, attrs in records:
+            h5_name = self.h5path + name
+            if kind == "link":
+                self._links.append((h5_name, self.h5path + value))
+            elif kind == "dataset":
+                attrs = dict((key, _from_picklable(attrs[key])) for key in attrs)
+                self._write_dataset(h5_name, _from_picklable(value), attrs)
+            else:
+                attrs = dict((key, _from_picklable(attrs[key])) for key in attrs)
+                self._write_group(h5_name, attrs)
 
+    def _write_root_attrs_and_links(self, attrs):
+        """Write the attributes of the root group and the links
+
+        :param dict attrs: Attributes of the root group of the input file
+        """
         # Handle the attributes of the root group
-        root_grp = h5f[self.h5path]
-        for key in infile.attrs:
-            if self.overwrite_data or key not in root_grp.attrs:
-                root_grp.attrs.create(key,
-                                      _attr_utf8(infile.attrs[key]))
+        root_grp = self._h5f[self.h5path]
+        self._write_attrs(root_grp, attrs)
 
         # Handle links at the end, when their targets are created
         for link_name, target_name in self._links:
@@ -193,6 +336,73 @@ class Hdf5Writer(object):
                          overwrite_data=self.overwrite_data)
         self._links = []
 
+    def _write_attrs(self, node, attrs, created=False):
+        """Write attributes to a HDF5 group or dataset
+
+        :param node: h5py group or dataset
+        :param attrs: Mapping of attributes to write
+        :param bool created: True if node was just created, so that
+            existing attributes do not need to be checked
+        """
+        for key in attrs:
+            if created or self.overwrite_data or key not in node.attrs:
+                node.attrs.create(key, _attr_utf8(attrs[key]))
+
+    def _write_dataset(self, h5_name, obj, attrs):
+        """Write a dataset to :attr:`h5f`
+
+        :param str h5_name: Path of the dataset in the output file
+        :param obj: h5py-like dataset or numpy array
+        :param attrs: Mapping of attributes of the dataset
+        """
+        _logger.debug("Saving dataset: " + h5_name)
+
+        member_initially_exists = h5_name in self._h5f
+
+        if self.overwrite_data and member_initially_exists:
+            _logger.warning("Overwriting dataset: " + h5_name)
+            del self._h5f[h5_name]
+
+        if self.overwrite_data or not member_initially_exists:
+            if isinstance(obj, fabioh5.FrameData) and len(obj.shape) > 2:
+                # special case of multiframe data
+                # write frame by frame to save memory usage low
+                ds = self._h5f.create_dataset(h5_name,
+                                              shape=obj.shape,
+                                              dtype=obj.dtype,
+                                              **self.create_dataset_args)
+                for i, frame in enumerate(obj):
+                    ds[i] = frame
+            else:
+                data = obj.value if is_dataset(obj) else obj
+                # fancy arguments don't apply to small dataset
+                if data.size < self.min_size:
+                    ds = self._h5f.create_dataset(h5_name, data=data)
+                else:
+                    ds = self._h5f.create_dataset(h5_name, data=data,
+                                                  **self.create_dataset_args)
+            self._write_attrs(ds, attrs, created=True)
+        else:
+            ds = self._h5f[h5_name]
+            self._write_attrs(ds, attrs)
+
+        if not self.overwrite_data and member_initially_exists:
+            _logger.warning("Not overwriting existing dataset: " + h5_name)
+
+    def _write_group(self, h5_name, attrs):
+        """Write a group to :attr:`h5f`
+
+        :param str h5_name: Path of the group in the output file
+        :param attrs: Mapping of attributes of the group
+        """
+        if h5_name not in self._h5f:
+            _logger.debug("Creating group: " + h5_name)
+            grp = self._h5f.create_group(h5_name)
+            self._write_attrs(grp, attrs, created=True)
+        else:
+            grp = self._h5f[h5_name]
+            self._write_attrs(grp, attrs)
+
     def append_member_to_h5(self, h5like_name, obj):
         """Add one group or one dataset to :attr:`h5f`"""
         h5_name = self.h5path + h5like_name.lstrip("/")
@@ -202,55 +412,10 @@ class Hdf5Writer(object):
             self._links.append((h5_name, h5_target))
 
         elif is_dataset(obj):
-            _logger.debug("Saving dataset: " + h5_name)
-
-            member_initially_exists = h5_name in self._h5f
-
-            if self.overwrite_data and member_initially_exists:
-                _logger.warning("Overwriting dataset: " + h5_name)
-                del self._h5f[h5_name]
-
-            if self.overwrite_data or not member_initially_exists:
-                if isinstance(obj, fabioh5.FrameData) and len(obj.shape) > 2:
-                    # special case of multiframe data
-                    # write frame by frame to save memory usage low
-                    ds = self._h5f.create_dataset(h5_name,
-                                                  shape=obj.shape,
-                                                  dtype=obj.dtype,
-                                                  **self.create_dataset_args)
-                    for i, frame in enumerate(obj):
-                        ds[i] = frame
-                else:
-                    # fancy arguments don't apply to small dataset
-                    if obj.size < self.min_size:
-                        ds = self._h5f.create_dataset(h5_name, data=obj.value)
-                    else:
-                        ds = self._h5f.create_dataset(h5_name, data=obj.value,
-                                                      **self.create_dataset_args)
-            else:
-                ds = self._h5f[h5_name]
-
-            # add HDF5 attributes
-            for key in obj.attrs:
-                if self.overwrite_data or key not in ds.attrs:
-                    ds.attrs.create(key,
-                                    _attr_utf8(obj.attrs[key]))
-
-            if not self.overwrite_data and member_initially_exists:
-                _logger.warning("Not overwriting existing dataset: " + h5_name)
+            self._write_dataset(h5_name, obj, obj.attrs)
 
         elif is_group(obj):
-            if h5_name not in self._h5f:
-                _logger.debug("Creating group: " + h5_name)
-                grp = self._h5f.create_group(h5_name)
-            else:
-                grp = self._h5f[h5_name]
-
-            # add HDF5 attributes
-            for key in obj.attrs:
-                if self.overwrite_data or key not in grp.attrs:
-                    grp.attrs.create(key,
-                                     _attr_utf8(obj.attrs[key]))
+            self._write_group(h5_name, obj.attrs)
 
 
 def _is_commonh5_group(grp):
@@ -261,7 +426,7 @@ def _is_commonh5_group(grp):
 
 def write_to_h5(infile, h5file, h5path='/', mode="a",
                 overwrite_data=False, link_type="soft",
-                create_dataset_args=None, min_size=500):
+                create_dataset_args=None, min_size=500, workers=None):
     """Write content of a h5py-like object into a HDF5 file.
 
     :param infile: Path of input file, or :class:`commonh5.File` object
@@ -284,6 +449,11 @@ def write_to_h5(infile, h5file, h5path='/', mode="a",
         These arguments are only applied to datasets larger than 1MB.
     :param int min_size: Minimum number of elements in a dataset to apply
         chunking and compression. Default is 500.
+    :param Union[int,None] workers: If not None and ``infile`` is a SPEC
+        file (path or :class:`SpecH5`), scans are parsed by this number of
+        worker processes (0 for one per CPU), see
+        :meth:`Hdf5Writer.write_specfile`. Default is None, to convert
+        in the current process.
 
     The structure of the spec data in an HDF5 file is described in the
     documentation of :mod:`silx.io.spech5`.
@@ -294,6 +464,22 @@ def write_to_h5(infile, h5file, h5path='/', mode="a",
                         create_dataset_args=create_dataset_args,
                         min_size=min_size)
 
+    if workers is not None:
+        specfile_name = None
+        if isinstance(infile, spech5.SpecH5):
+            specfile_name = infile.filename
+        elif isinstance(infile, six.string_types) and is_specfile(infile):
+            specfile_name = infile
+
+        if specfile_name is not None:
+            if isinstance(h5file, h5py.File):
+                writer.write_specfile(specfile_name, h5file, workers)
+            else:
+                with h5py.File(h5file, mode) as h5f:
+                    writer.write_specfile(specfile_name, h5f, workers)
+            return
+        _logger.debug("Input is not a SPEC file, workers is ignored")
+
     # both infile and h5file can be either file handle or a file name: 4 cases
     if not isinstance(h5file, h5py.File) and not is_group(infile):
         with silx.io.open(infile) as h5pylike:
@@ -317,7 +503,8 @@ def write_to_h5(infile, h5file, h5path='/', mode="a",
         writer.write(infile, h5file)
 
 
-def convert(infile, h5file, mode="w-", create_dataset_args=None):
+def convert(infile, h5file, mode="w-", create_dataset_args=None,
+            workers=None):
     """Convert a supported file into an HDF5 file, write scans into the
     root group (``/``).
 
@@ -335,9 +522,12 @@ def convert(infile, h5file, mode="w-", create_dataset_args=None):
     :param create_dataset_args: Dictionary of args you want to pass to
         ``h5py.File.create_dataset``. This allows you to specify filters and
         compression parameters. Don't specify ``name`` and ``data``.
+    :param Union[int,None] workers: Number of processes used to parse
+        SPEC files, see :func:`write_to_h5`.
     """
     if mode not in ["w", "w-"]:
         raise IOError("File mode must be 'w' or 'w-'. Use write_to_h5" +
                       " to append data to an existing HDF5 file.")
     write_to_h5(infile, h5file, h5path='/', mode=mode,
-                create_dataset_args=create_dataset_args)
+                create_dataset_args=create_dataset_args,
+                workers=workers)
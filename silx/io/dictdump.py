@@ -26,6 +26,8 @@ by text strings to following file formats: `HDF5, INI, JSON`
 """
 
 from collections import OrderedDict
+from collections.abc import ItemsView, Mapping, ValuesView
+import fnmatch
 import json
 import logging
 import numpy
@@ -49,6 +51,10 @@ logger = logging.getLogger(__name__)
 vlen_utf8 = h5py.special_dtype(vlen=str)
 vlen_bytes = h5py.special_dtype(vlen=bytes)
 
+LAZY_THRESHOLD = 1024 * 1024
+"""Size in bytes under which :func:`h5todict` reads datasets while browsing
+the file in lazy mode"""
+
 
 def _prepare_hdf5_write_value(array_like):
     """Cast a python object into a numpy array in a HDF5 friendly format.
@@ -136,6 +142,66 @@ class _SafeH5FileRead(object):
             self.h5file.close()
 
 
+class DatasetCreationPolicy(object):
+    """Chunking and compression policy of the datasets written by
+    :func:`dicttoh5`, to be used as its `create_dataset_args`.
+
+    Arrays smaller than `min_size` bytes are stored contiguous and without
+    filters, as chunking and compressing them costs more than it saves.
+    Bigger arrays are split in chunks of about `chunk_size` bytes, keeping
+    the last dimensions whole (e.g. chunks of full images for a stack of
+    images) and compressed with the provided filters.
+
+    :param int min_size: Size in bytes from which arrays are chunked
+    :param int chunk_size: Target size of the chunks in bytes
+    :param compression: Compression filter, see ``h5py.Group.create_dataset``
+    :param compression_opts: Options of the compression filter
+    :param bool shuffle: True to apply the shuffle filter
+    """
+
+    def __init__(self, min_size=64 * 1024, chunk_size=1024 * 1024,
+                 compression=None, compression_opts=None, shuffle=False):
+        self.min_size = min_size
+        self.chunk_size = chunk_size
+        self.compression = compression
+        self.compression_opts = compression_opts
+        self.shuffle = shuffle
+
+    def chunks(self, shape, itemsize):
+        """Returns the chunk shape to use for an array.
+
+        :param tuple shape: Shape of the array
+        :param int itemsize: Size of one element in bytes
+        :rtype: tuple
+        """
+        chunks = list(shape)
+        nitems = max(1, self.chunk_size // itemsize)
+        for axis in range(len(chunks)):
+            if numpy.prod(chunks, dtype=numpy.int64) <= nitems:
+                break
+            nitems_per_index = numpy.prod(chunks[axis + 1:], dtype=numpy.int64)
+            chunks[axis] = int(max(1, nitems // nitems_per_index))
+        return tuple(chunks)
+
+    def __call__(self, data):
+        """Returns the arguments of ``h5py.Group.create_dataset`` for an
+        array.
+
+        :param numpy.ndarray data: Array to write
+        :rtype: Union[dict,None]
+        """
+        if data.nbytes < self.min_size or data.size == 0:
+            return None
+        args = {"chunks": self.chunks(data.shape, data.dtype.itemsize)}
+        if self.compression is not None:
+            args["compression"] = self.compression
+            if self.compression_opts is not None:
+                args["compression_opts"] = self.compression_opts
+        if self.shuffle:
+            args["shuffle"] = True
+        return args
+
+
 def dicttoh5(treedict, h5file, h5path='/',
              mode="w", overwrite_data=False,
              create_dataset_args=None):
@@ -173,6 +239,8 @@ def dicttoh5(treedict, h5file, h5path='/',
     :param create_dataset_args: Dictionary of args you want to pass to
         ``h5f.create_dataset``. This allows you to specify filters and
         compression parameters. Don't specify ``name`` and ``data``.
+        It can also be a callable returning these args (or None) for the
+        array to write, e.g. a :class:`DatasetCreationPolicy`.
 
     Example::
 
@@ -199,80 +267,177 @@ def dicttoh5(treedict, h5file, h5path='/',
 
         dicttoh5(city_area, "cities.h5", h5path="/area",
                  create_dataset_args=create_ds_args)
+
+        # chunk and compress big arrays only
+        policy = DatasetCreationPolicy(compression="gzip", shuffle=True)
+        dicttoh5(city_area, "cities.h5", h5path="/area",
+                 create_dataset_args=policy)
     """
 
     if not h5path.endswith("/"):
         h5path += "/"
 
-    with _SafeH5FileWrite(h5file, mode=mode) as h5f:
-        if isinstance(treedict, dict) and h5path != "/":
-            if h5path not in h5f:
-                h5f.create_group(h5path)
+    safe_h5file = _SafeH5FileWrite(h5file, mode=mode)
+    with safe_h5file as h5f:
+        if h5path in h5f:
+            group = h5f[h5path]
+            # A file which was just created is empty
+            created = (h5path == "/" and safe_h5file.close_when_finished and
+                       mode in ("w", "w-", "x"))
+        else:
+            group = h5f.create_group(h5path)
+            created = True
+        _dicttoh5(treedict, group, created,
+                  overwrite_data=overwrite_data,
+                  create_dataset_args=create_dataset_args,
+                  scalar_writer=_ScalarDatasetWriter())
 
-        for key in filter(lambda k: not isinstance(k, tuple), treedict):
-            key_is_group = isinstance(treedict[key], dict)
-            h5name = h5path + key
 
-            if key_is_group and treedict[key]:
-                # non-empty group: recurse
-                dicttoh5(treedict[key], h5f, h5name,
-                         overwrite_data=overwrite_data,
-                         create_dataset_args=create_dataset_args)
-                continue
+def _h5name(group, name):
+    """Returns the full name of a group member, for logging"""
+    return group.name.rstrip("/") + "/" + name
 
-            if h5name in h5f:
-                # key already exists: delete or skip
-                if overwrite_data is True:
-                    del h5f[h5name]
-                else:
-                    logger.warning('key (%s) already exists. '
-                                    'Not overwriting.' % (h5name))
-                    continue
 
-            value = treedict[key]
+class _ScalarDatasetWriter(object):
+    """Writes scalar datasets sharing the same dataspace, creation property
+    list and datatypes.
 
-            if value is None or key_is_group:
-                # Create empty group
-                h5f.create_group(h5name)
-            elif is_link(value):
-                h5f[h5name] = value
-            else:
-                data = _prepare_hdf5_write_value(value)
-                # can't apply filters on scalars (datasets with shape == () )
-                if data.shape == () or create_dataset_args is None:
-                    h5f.create_dataset(h5name,
-                                       data=data)
-                else:
-                    h5f.create_dataset(h5name,
-                                       data=data,
-                                       **create_dataset_args)
+    Numerical scalars are created with the HDF5 low-level API, which is much
+    faster than h5py high-level API for dictionaries with many small values.
+    """
 
-        # deal with h5 attributes which have tuples as keys in treedict
-        for key in filter(lambda k: isinstance(k, tuple), treedict):
-            assert len(key) == 2, "attribute must be defined by 2 values"
-            h5name = h5path + key[0]
-            attr_name = key[1]
+    def __init__(self):
+        self._space = h5py.h5s.create(h5py.h5s.SCALAR)
+        self._dcpl = h5py.h5p.create(h5py.h5p.DATASET_CREATE)
+        self._dcpl.set_obj_track_times(False)
+        self._lcpl = h5py.h5p.create(h5py.h5p.LINK_CREATE)
+        self._lcpl.set_create_intermediate_group(True)
+        self._lcpl.set_char_encoding(h5py.h5t.CSET_UTF8)
+        self._types = {}
+
+    def write(self, group, name, data):
+        """Create a scalar dataset in a group.
+
+        :param group: h5py-like group
+        :param str name: Name of the dataset
+        :param numpy.ndarray data: 0-dimensional array
+        """
+        if data.dtype.kind not in "biufc" or not isinstance(group, h5py.Group):
+            group.create_dataset(name, data=data)
+            return
+        tid = self._types.get(data.dtype)
+        if tid is None:
+            tid = h5py.h5t.py_create(data.dtype, logical=True)
+            self._types[data.dtype] = tid
+        if not isinstance(name, bytes):
+            name = name.encode("utf-8")
+        dsid = h5py.h5d.create(group.id, name, tid, self._space,
+                               dcpl=self._dcpl, lcpl=self._lcpl)
+        dsid.write(h5py.h5s.ALL, h5py.h5s.ALL,
+                   numpy.ascontiguousarray(data))
+
+
+def _dicttoh5(treedict, group, created, overwrite_data, create_dataset_args,
+              scalar_writer):
+    """Recursive implementation of :func:`dicttoh5`.
+
+    Members are created from the group handle, so that paths are not
+    resolved from the root of the file for each key.
+
+    :param treedict: Nested dictionary to write
+    :param group: h5py group to write in
+    :param bool created: True if the group was just created, in which case
+        member names are not checked for existence until a key containing
+        "/" has created intermediate groups
+    :param _ScalarDatasetWriter scalar_writer: Writer of scalar datasets
+    """
+    for key in filter(lambda k: not isinstance(k, tuple), treedict):
+        value = treedict[key]
+        key_is_group = isinstance(value, dict)
 
-            if h5name not in h5f:
+        if created and "/" not in key:
+            exists = False
+        else:
+            # Intermediate groups of a path can clash with later keys
+            created = False
+            exists = key in group
+
+        if key_is_group and value:
+            # non-empty group: recurse
+            if exists:
+                _dicttoh5(value, group[key], False,
+                          overwrite_data=overwrite_data,
+                          create_dataset_args=create_dataset_args,
+                          scalar_writer=scalar_writer)
+            else:
+                _dicttoh5(value, group.create_group(key), True,
+                          overwrite_data=overwrite_data,
+                          create_dataset_args=create_dataset_args,
+                          scalar_writer=scalar_writer)
+            continue
+
+        if exists:
+            # key already exists: delete or skip
+            if overwrite_data is True:
+                del group[key]
+            else:
+                logger.warning('key (%s) already exists. '
+                                'Not overwriting.' % (_h5name(group, key)))
+                continue
+
+        if value is None or key_is_group:
+            # Create empty group
+            group.create_group(key)
+        elif is_link(value):
+            group[key] = value
+        else:
+            data = _prepare_hdf5_write_value(value)
+            if data.shape == ():
+                # can't apply filters on scalars (datasets with shape == () )
+                scalar_writer.write(group, key, data)
+                continue
+            if callable(create_dataset_args):
+                args = create_dataset_args(data)
+            else:
+                args = create_dataset_args
+            if args is None:
+                group.create_dataset(key, data=data)
+            else:
+                group.create_dataset(key, data=data, **args)
+
+    # deal with h5 attributes which have tuples as keys in treedict
+    nodes = {}
+    for key in filter(lambda k: isinstance(k, tuple), treedict):
+        assert len(key) == 2, "attribute must be defined by 2 values"
+        name, attr_name = key
+
+        node = nodes.get(name)
+        if node is None:
+            if not name:
+                node = group
+            elif name in group:
+                node = group[name]
+            else:
                 # Create empty group if key for attr does not exist
-                h5f.create_group(h5name)
+                node = group.create_group(name)
                 logger.warning(
                     "key (%s) does not exist. attr %s "
-                    "will be written to ." % (h5name, attr_name)
+                    "will be written to ." % (_h5name(group, name), attr_name)
                 )
+            nodes[name] = node
 
-            if attr_name in h5f[h5name].attrs:
-                if not overwrite_data:
-                    logger.warning(
-                        "attribute %s@%s already exists. Not overwriting."
-                        "" % (h5name, attr_name)
-                    )
-                    continue
+        if attr_name in node.attrs:
+            if not overwrite_data:
+                logger.warning(
+                    "attribute %s@%s already exists. Not overwriting."
+                    "" % (_h5name(group, name), attr_name)
+                )
+                continue
 
-            # Write attribute
-            value = treedict[key]
-            data = _prepare_hdf5_write_value(value)
-            h5f[h5name].attrs[attr_name] = data
+        # Write attribute
+        value = treedict[key]
+        data = _prepare_hdf5_write_value(value)
+        node.attrs[attr_name] = data
 
 
 def nexus_to_h5_dict(treedict, parents=tuple()):
@@ -333,8 +498,14 @@ def h5_to_nexus_dict(treedict):
 
     :rtype dict:
     """
-    copy = dict()
-    for key, value in treedict.items():
+    if isinstance(treedict, LazyH5Dict):
+        # Preserve datasets not read yet
+        copy = LazyH5Dict()
+        items = dict.items(treedict)
+    else:
+        copy = dict()
+        items = treedict.items()
+    for key, value in items:
         if isinstance(key, tuple):
             assert len(key)==2, "attribute must be defined by 2 values"
             key = "%s@%s" % (key[0], key[1])
@@ -378,13 +549,153 @@ def _handle_error(mode: str, exception, msg: str, *args) -> None:
         raise ValueError("Unsupported error handling: %s" % mode)
 
 
+class _H5DatasetProxy(object):
+    """Reference to a HDF5 dataset which is read on first access.
+
+    :param h5file: File name or file-like object the dataset belongs to
+    :param str name: Path of the dataset in the file
+    :param bool asarray: True to read scalar as arrays
+    :param str errors: Handling of errors, see :func:`h5todict`
+    """
+
+    def __init__(self, h5file, name, asarray, errors):
+        self.h5file = h5file
+        self.name = name
+        self.asarray = asarray
+        self.errors = errors
+
+    def __repr__(self):
+        return '<HDF5 dataset "%s" (not read)>' % self.name
+
+    def read(self):
+        """Read the dataset from the file.
+
+        :raises KeyError: If the dataset cannot be read and errors are not
+            raised
+        """
+        with _SafeH5FileRead(self.h5file) as h5f:
+            try:
+                return _read_h5_dataset(h5f[self.name], self.asarray)
+            except (KeyError, OSError):
+                _handle_error(self.errors,
+                              OSError,
+                              'Cannot retrieve dataset "%s"',
+                              self.name)
+        raise KeyError(self.name)
+
+
+class LazyH5Dict(dict):
+    """Nested dictionary returned by :func:`h5todict` in lazy mode.
+
+    Datasets bigger than the lazy threshold are only read from the file the
+    first time the corresponding value is accessed. The value then replaces
+    the reference to the dataset, so the file is read only once.
+
+    If the dictionary was created from a file handle, this handle must stay
+    open until all the values were accessed.
+    """
+
+    def __resolve(self, key, value):
+        if isinstance(value, _H5DatasetProxy):
+            try:
+                value = value.read()
+            except KeyError:
+                # Not readable: behave as if the dataset was skipped
+                dict.__delitem__(self, key)
+                raise KeyError(key)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __getitem__(self, key):
+        return self.__resolve(key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # Overriding __iter__ disables the fast path of dict(self), {**self}
+        # and dict.update(self) which would copy unresolved values
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, *args):
+        if key not in self and args:
+            return args[0]
+        value = self[key]
+        dict.__delitem__(self, key)
+        return value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            dict.__setitem__(self, key, default)
+        return self[key]
+
+    def items(self):
+        return ItemsView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def copy(self):
+        return LazyH5Dict(dict.items(self))
+
+    def __eq__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return dict(self.items()) == dict(other.items())
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+
+def _read_h5_dataset(h5obj, asarray):
+    """Read the whole content of a dataset.
+
+    :param h5obj: h5py-like dataset
+    :param bool asarray: True to read scalar as arrays
+    """
+    data = h5py_read_dataset(h5obj)
+    if asarray:  # Convert HDF5 dataset to numpy array
+        data = numpy.array(data, copy=False)
+    return data
+
+
+def _name_matches_patterns(name, patterns):
+    """Returns True if a path matches one of the glob patterns.
+
+    Patterns are matched level by level, so that ``*`` does not match ``/``.
+    """
+    if patterns is None:
+        return True
+    parts = name.split("/")
+    for pattern in patterns:
+        pattern_parts = pattern.strip("/").split("/")
+        if len(pattern_parts) != len(parts):
+            continue
+        if all(fnmatch.fnmatchcase(part, pattern_part)
+               for part, pattern_part in zip(parts, pattern_parts)):
+            return True
+    return False
+
+
 def h5todict(h5file,
              path="/",
              exclude_names=None,
              asarray=True,
              dereference_links=True,
              include_attributes=False,
-             errors='raise'):
+             errors='raise',
+             include_names=None,
+             max_depth=None,
+             lazy=False,
+             lazy_threshold=None):
     """Read a HDF5 file and return a nested dictionary with the complete file
     structure and all data.
 
@@ -403,6 +714,11 @@ def h5todict(h5file,
                                              "/94.1/measurement",
                                              exclude_names="mca_")
 
+        # read the metadata of a NeXus entry, the detector data being only
+        # read when accessed
+        entry = h5todict("scan.h5", "/entry", lazy=True)
+        title = entry["title"]
+
 
     .. note:: This function requires `h5py <http://www.h5py.org/>`_ to be
         installed.
@@ -429,82 +745,147 @@ def h5todict(h5file,
         - 'raise' (default): Raise an exception
         - 'log': Log as errors
         - 'ignore': Ignore errors
+    :param List[str] include_names: Glob patterns (see :mod:`fnmatch`)
+        matched against the path of the datasets relative to `path`, e.g.
+        ``"instrument/*/name"``, ``*`` not matching ``/``. When provided,
+        only matching datasets are read and groups left empty are not
+        included.
+        Default is None (include everything)
+    :param int max_depth: Maximum number of sub-group levels read below
+        `path`. 0 only reads the datasets of `path`.
+        Default is None (no limit)
+    :param bool lazy: False (default) to read all the datasets. True to
+        return a :class:`LazyH5Dict` where datasets bigger than
+        `lazy_threshold` are read on first access.
+    :param int lazy_threshold: Size in bytes under which datasets are read
+        while browsing the file in lazy mode.
+        Default is :data:`LAZY_THRESHOLD`.
     :return: Nested dictionary
     """
     with _SafeH5FileRead(h5file) as h5f:
-        ddict = {}
-        if path not in h5f:
-            _handle_error(
-                errors, KeyError, 'Path "%s" does not exist in file.', path)
-            return ddict
+        if lazy:
+            if lazy_threshold is None:
+                lazy_threshold = LAZY_THRESHOLD
+            if not is_h5_file_like(h5file):
+                # Datasets are read later from a newly opened file
+                source = h5file
+            else:
+                source = h5f
+        else:
+            source = None
+        return _h5todict(h5f, path, "", 0,
+                         source=source,
+                         lazy_threshold=lazy_threshold,
+                         exclude_names=exclude_names,
+                         include_names=include_names,
+                         max_depth=max_depth,
+                         asarray=asarray,
+                         dereference_links=dereference_links,
+                         include_attributes=include_attributes,
+                         errors=errors)
+
+
+def _h5todict(h5f, path, relpath, depth, source, lazy_threshold,
+              exclude_names, include_names, max_depth, asarray,
+              dereference_links, include_attributes, errors):
+    """Recursive implementation of :func:`h5todict`.
+
+    :param h5f: Opened file
+    :param str path: Name of the group to read
+    :param str relpath: Path of the group relative to the root of the
+        returned dictionary
+    :param int depth: Depth of the group relative to the root
+    :param source: File datasets are read from in lazy mode, None to read
+        all the datasets
+    """
+    ddict = {} if source is None else LazyH5Dict()
+    if path not in h5f:
+        _handle_error(
+            errors, KeyError, 'Path "%s" does not exist in file.', path)
+        return ddict
+
+    try:
+        root = h5f[path]
+    except KeyError as e:
+        if not isinstance(h5f.get(path, getlink=True), h5py.HardLink):
+            _handle_error(errors,
+                          KeyError,
+                          'Cannot retrieve path "%s" (broken link)',
+                          path)
+        else:
+            _handle_error(errors, KeyError, ', '.join(e.args))
+        return ddict
+
+    # Read the attributes of the group
+    if include_attributes:
+        attrs = H5pyAttributesReadWrapper(root.attrs)
+        for aname, avalue in attrs.items():
+            ddict[("", aname)] = avalue
+    # Read the children of the group
+    for key in root:
+        if _name_contains_string_in_list(key, exclude_names):
+            continue
+        h5name = path + "/" + key
+        relname = relpath + key
+        # Preserve HDF5 link when requested
+        if not dereference_links:
+            lnk = h5f.get(h5name, getlink=True)
+            if is_link(lnk):
+                if _name_matches_patterns(relname, include_names):
+                    ddict[key] = lnk
+                continue
 
         try:
-            root = h5f[path]
+            h5obj = h5f[h5name]
         except KeyError as e:
-            if not isinstance(h5f.get(path, getlink=True), h5py.HardLink):
+            if not isinstance(h5f.get(h5name, getlink=True), h5py.HardLink):
                 _handle_error(errors,
                               KeyError,
                               'Cannot retrieve path "%s" (broken link)',
-                              path)
+                              h5name)
             else:
                 _handle_error(errors, KeyError, ', '.join(e.args))
-            return ddict
-
-        # Read the attributes of the group
-        if include_attributes:
-            attrs = H5pyAttributesReadWrapper(root.attrs)
-            for aname, avalue in attrs.items():
-                ddict[("", aname)] = avalue
-        # Read the children of the group
-        for key in root:
-            if _name_contains_string_in_list(key, exclude_names):
-                continue
-            h5name = path + "/" + key
-            # Preserve HDF5 link when requested
-            if not dereference_links:
-                lnk = h5f.get(h5name, getlink=True)
-                if is_link(lnk):
-                    ddict[key] = lnk
-                    continue
+            continue
 
-            try:
-                h5obj = h5f[h5name]
-            except KeyError as e:
-                if not isinstance(h5f.get(h5name, getlink=True), h5py.HardLink):
-                    _handle_error(errors,
-                                  KeyError,
-                                  'Cannot retrieve path "%s" (broken link)',
-                                  h5name)
-                else:
-                    _handle_error(errors, KeyError, ', '.join(e.args))
+        if is_group(h5obj):
+            # Child is an HDF5 group
+            if max_depth is not None and depth >= max_depth:
                 continue
-
-            if is_group(h5obj):
-                # Child is an HDF5 group
-                ddict[key] = h5todict(h5f,
-                                      h5name,
-                                      exclude_names=exclude_names,
-                                      asarray=asarray,
-                                      dereference_links=dereference_links,
-                                      include_attributes=include_attributes)
+            subdict = _h5todict(h5f, h5name, relname + "/", depth + 1,
+                                source=source,
+                                lazy_threshold=lazy_threshold,
+                                exclude_names=exclude_names,
+                                include_names=include_names,
+                                max_depth=max_depth,
+                                asarray=asarray,
+                                dereference_links=dereference_links,
+                                include_attributes=include_attributes,
+                                errors=errors)
+            if (include_names is None or
+                    any(not isinstance(k, tuple) for k in subdict) or
+                    _name_matches_patterns(relname, include_names)):
+                ddict[key] = subdict
+        else:
+            # Child is an HDF5 dataset
+            if not _name_matches_patterns(relname, include_names):
+                continue
+            if (source is not None and
+                    h5obj.size * h5obj.dtype.itemsize > lazy_threshold):
+                ddict[key] = _H5DatasetProxy(source, h5name, asarray, errors)
             else:
-                # Child is an HDF5 dataset
                 try:
-                    data = h5py_read_dataset(h5obj)
+                    ddict[key] = _read_h5_dataset(h5obj, asarray)
                 except OSError:
                     _handle_error(errors,
                                   OSError,
                                   'Cannot retrieve dataset "%s"',
                                   h5name)
-                else:
-                    if asarray:  # Convert HDF5 dataset to numpy array
-                        data = numpy.array(data, copy=False)
-                    ddict[key] = data
-                    # Read the attributes of the child
-                    if include_attributes:
-                        attrs = H5pyAttributesReadWrapper(h5obj.attrs)
-                        for aname, avalue in attrs.items():
-                            ddict[(key, aname)] = avalue
+                    continue
+            # Read the attributes of the child
+            if include_attributes:
+                attrs = H5pyAttributesReadWrapper(h5obj.attrs)
+                for aname, avalue in attrs.items():
+                    ddict[(key, aname)] = avalue
     return ddict
 
 
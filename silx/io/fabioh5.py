@@ -33,12 +33,14 @@
 """
 
 import collections
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import logging
 import numbers
 import os
 
 import fabio.file_series
+import fabio.fabioutils
 import numpy
 import six
 
@@ -94,7 +96,12 @@ class _FileSeries(fabio.file_series.file_series):
 
 class FrameData(commonh5.LazyLoadableDataset):
     """Expose a cube of image from a Fabio file using `FabioReader` as
-    cache."""
+    cache.
+
+    Until the whole cube is requested, slices along the first axis only read
+    the selected frames through :meth:`FabioReader.get_frame`, and the shape
+    and the dtype are given by :meth:`FabioReader.get_data_layout`.
+    """
 
     def __init__(self, name, fabio_reader, parent=None):
         if fabio_reader.is_spectrum():
@@ -109,16 +116,17 @@ class FrameData(commonh5.LazyLoadableDataset):
     def _create_data(self):
         return self.__fabio_reader.get_data()
 
+    def _is_stack(self):
+        """Returns True if the frames are exposed as a stack of frames"""
+        fabio_file = self.__fabio_reader.fabio_file()
+        if isinstance(fabio_file, fabio.file_series.file_series):
+            return True
+        return self.__fabio_reader.frame_count() > 1
+
     def _update_cache(self):
-        if isinstance(self.__fabio_reader.fabio_file(),
-                      fabio.file_series.file_series):
-            # Reading all the files is taking too much time
-            # Reach the information from the only first frame
-            first_image = self.__fabio_reader.fabio_file().first_image()
-            self._dtype = first_image.data.dtype
-            shape0 = self.__fabio_reader.frame_count()
-            shape1, shape2 = first_image.data.shape
-            self._shape = shape0, shape1, shape2
+        if not self._is_initialized and self._is_stack():
+            # Reading all the frames is taking too much time
+            self._shape, self._dtype = self.__fabio_reader.get_data_layout()
         else:
             self._dtype = super(commonh5.LazyLoadableDataset, self).dtype
             self._shape = super(commonh5.LazyLoadableDataset, self).shape
@@ -135,20 +143,59 @@ class FrameData(commonh5.LazyLoadableDataset):
             self._update_cache()
         return self._shape
 
+    @property
+    def size(self):
+        return int(numpy.prod(self.shape))
+
+    def __len__(self):
+        if len(self.shape) == 0:
+            raise TypeError("Attempt to take len() of scalar dataset")
+        return self.shape[0]
+
     def __iter__(self):
         for frame in self.__fabio_reader.iter_frames():
             yield frame.data
 
+    def __get_frame(self, frame_id):
+        """Returns a frame with the shape and dtype of the stack frames
+
+        :param int frame_id: Index of the frame
+        :rtype: numpy.ndarray
+        """
+        frame = self.__fabio_reader.get_frame(frame_id)
+        frame_shape = self.shape[1:]
+        if frame.shape == frame_shape and frame.dtype == self.dtype:
+            return frame
+        # Crop or pad frames which do not have the size of the stack frames
+        normalized_frame = numpy.zeros(frame_shape, dtype=self.dtype)
+        location = tuple(slice(0, min(i, j)) for i, j in zip(frame.shape, frame_shape))
+        frame = frame[location + (0,) * (frame.ndim - len(location))]
+        location += (0,) * (len(frame_shape) - len(location))
+        normalized_frame[location] = frame
+        return normalized_frame
+
     def __getitem__(self, item):
-        # optimization for fetching a single frame if data not already loaded
-        if not self._is_initialized:
-            if isinstance(item, six.integer_types) and \
-                    isinstance(self.__fabio_reader.fabio_file(),
-                               fabio.file_series.file_series):
-                if item < 0:
+        # optimization for fetching frames if data not already loaded
+        if not self._is_initialized and self._is_stack():
+            if not isinstance(item, tuple):
+                item = (item,)
+            if len(item) > 0 and isinstance(item[0], (slice, numbers.Integral)):
+                selection, frame_item = item[0], item[1:]
+                frame_count = len(self)
+                if isinstance(selection, slice):
+                    frame_ids = range(*selection.indices(frame_count))
+                    if len(frame_ids) == 0:
+                        frame = self.__get_frame(0)[frame_item]
+                        return numpy.empty((0,) + frame.shape, dtype=self.dtype)
+                    return numpy.array([self.__get_frame(i)[frame_item]
+                                        for i in frame_ids])
+                frame_id = int(selection)
+                if frame_id < 0:
                     # negative indexing
-                    item += len(self)
-                return self.__fabio_reader.fabio_file().jump_image(item).data
+                    frame_id += frame_count
+                if not 0 <= frame_id < frame_count:
+                    raise IndexError("Index %d is out of bounds" % selection)
+                return numpy.array(self.__get_frame(frame_id)[frame_item])
         return super(FrameData, self).__getitem__(item)
 
 
@@ -346,7 +393,11 @@ class FabioReader(object):
     COUNTER = 1
     POSITIONER = 2
 
-    def __init__(self, file_name=None, fabio_image=None, file_series=None):
+    FRAME_CACHE_SIZE = 256 * 1024 ** 2
+    """Maximum size in bytes of the frames cached by :meth:`get_frame`"""
+
+    def __init__(self, file_name=None, fabio_image=None, file_series=None,
+                 workers=None, lazy_metadata=False):
         """
         Constructor
 
@@ -356,6 +407,12 @@ class FabioReader(object):
         :param Union[list[str],fabio.file_series.file_series] file_series: An
             list of file name or a :class:`fabio.file_series.file_series`
             instance
+        :param Union[int,None] workers: Number of threads reading the headers
+            of a file series, 0 to use the default of
+            :class:`concurrent.futures.ThreadPoolExecutor`.
+            If None (default), headers are read sequentially.
+        :param bool lazy_metadata: If True, the metadata is only read when
+            it is requested for the first time.
         """
         self.__at_least_32bits = False
         self.__signed_type = False
@@ -366,8 +423,14 @@ class FabioReader(object):
         self.__measurements = {}
         self.__key_filters = set([])
         self.__data = None
+        self.__frame_cache = collections.OrderedDict()
+        self.__frame_cache_size = 0
+        self.__data_layout = None
         self.__frame_count = self.frame_count()
-        self._read()
+        self.__workers = workers
+        self.__metadata_read = False
+        if not lazy_metadata:
+            self.__read_metadata()
 
     def __load(self, file_name=None, fabio_image=None, file_series=None):
         if file_name is not None and fabio_image:
@@ -408,6 +471,8 @@ class FabioReader(object):
             if hasattr(self.__fabio_file, "close"):
                 self.__fabio_file.close()
         self.__fabio_file = None
+        self.__frame_cache.clear()
+        self.__frame_cache_size = 0
 
     def fabio_file(self):
         return self.__fabio_file
@@ -450,8 +515,8 @@ class FabioReader(object):
         The computation is cached into the class, and only done ones.
         """
         images = []
-        for fabio_frame in self.iter_frames():
-            images.append(fabio_frame.data)
+        for frame_id in range(self.frame_count()):
+            images.append(self._read_frame_data(frame_id))
 
         # returns the data without extra dim in case of single frame
         if len(images) == 1:
@@ -500,11 +565,85 @@ class FabioReader(object):
             self.__data = self._create_data()
         return self.__data
 
+    def get_data_layout(self):
+        """Returns the shape and dtype of the cube returned by :meth:`get_data`
+
+        The data of the frames is not read: For a file series, the layout is
+        taken from the first file, and for a multi-frame file, it is
+        computed from the headers of all the frames, the same way as
+        :meth:`get_data` pads frames of different sizes.
+
+        :rtype: Tuple[Tuple[int],numpy.dtype]
+        """
+        if self.__data_layout is None:
+            if isinstance(self.__fabio_file, fabio.file_series.file_series):
+                first_frame = self.get_frame(0)
+                self.__data_layout = ((self.frame_count(),) + first_frame.shape,
+                                      first_frame.dtype)
+            else:
+                shapes, dtypes = [], []
+                for fabio_frame in self.iter_frames():
+                    shapes.append(tuple(fabio_frame.shape))
+                    dtypes.append(fabio_frame.dtype)
+                if len(shapes) == 1:
+                    self.__data_layout = shapes[0], dtypes[0]
+                else:
+                    max_dim = max([len(shape) for shape in shapes])
+                    max_shape = [0] * max_dim
+                    for shape in shapes:
+                        for dim, size in enumerate(shape):
+                            max_shape[dim] = max(max_shape[dim], size)
+                    self.__data_layout = ((len(shapes),) + tuple(max_shape),
+                                          numpy.result_type(*dtypes))
+        return self.__data_layout
+
+    def _read_frame_data(self, frame_id):
+        """Read the data of a single frame from the fabio file.
+
+        :param int frame_id: Index of the frame
+        :rtype: numpy.ndarray
+        """
+        if isinstance(self.__fabio_file, fabio.file_series.file_series):
+            with self.__fabio_file.jump_image(frame_id) as fabio_image:
+                return fabio_image.data
+        elif self.__fabio_file.nframes == 1:
+            return self.__fabio_file.data
+        else:
+            return self.__fabio_file.getframe(frame_id).data
+
+    def get_frame(self, frame_id):
+        """Returns the data of a single frame.
+
+        The last used frames are cached, up to :attr:`FRAME_CACHE_SIZE` bytes.
+
+        :param int frame_id: Index of the frame
+        :rtype: numpy.ndarray
+        """
+        frame = self.__frame_cache.pop(frame_id, None)
+        if frame is None:
+            frame = self._read_frame_data(frame_id)
+            self.__frame_cache_size += frame.nbytes
+        # The most recently used frame is the last one
+        self.__frame_cache[frame_id] = frame
+
+        while (self.__frame_cache_size > self.FRAME_CACHE_SIZE and
+               len(self.__frame_cache) > 1):
+            _, old_frame = self.__frame_cache.popitem(last=False)
+            self.__frame_cache_size -= old_frame.nbytes
+        return frame
+
+    def __read_metadata(self):
+        """Read the metadata if it was not yet done"""
+        if not self.__metadata_read:
+            self.__metadata_read = True
+            self._read()
+
     def get_keys(self, kind):
         """Get all available keys according to a kind of metadata.
 
         :rtype: list
         """
+        self.__read_metadata()
         return self.__get_dict(kind).keys()
 
     def get_value(self, kind, name):
@@ -512,6 +651,7 @@ class FabioReader(object):
 
         :rtype: numpy.ndarray
         """
+        self.__read_metadata()
         value = self.__get_dict(kind)[name]
         if not isinstance(value, numpy.ndarray):
             if kind in [self.COUNTER, self.POSITIONER]:
@@ -558,11 +698,28 @@ class FabioReader(object):
         if not file_series:
             self._enable_key_filters(self.__fabio_file)
 
-        for frame_id, fabio_frame in enumerate(self.iter_frames()):
+        if file_series and self.__workers is not None:
+            frames = self._iter_series_headers()
+        else:
+            frames = self.iter_frames()
+
+        for frame_id, fabio_frame in enumerate(frames):
             if file_series:
                 self._enable_key_filters(fabio_frame)
             self._read_frame(frame_id, fabio_frame.header)
 
+    def _iter_series_headers(self):
+        """Iter the images of a file series with only their header loaded.
+
+        Headers are read by a pool of threads, and returned in the order of
+        the file series.
+        """
+        max_workers = self.__workers if self.__workers > 0 else None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for fabio_image in executor.map(fabio.openheader,
+                                            list(self.__fabio_file)):
+                yield fabio_image
+
     def _is_filtered_key(self, key):
         """
         If this function returns True, the :meth:`_read_key` while not be
@@ -787,8 +944,10 @@ class EdfFabioReader(FabioReader):
     motor_mne are parsed using a special way.
     """
 
-    def __init__(self, file_name=None, fabio_image=None, file_series=None):
-        FabioReader.__init__(self, file_name, fabio_image, file_series)
+    def __init__(self, file_name=None, fabio_image=None, file_series=None,
+                 workers=None, lazy_metadata=False):
+        FabioReader.__init__(self, file_name, fabio_image, file_series,
+                             workers, lazy_metadata)
         self.__unit_cell_abc = None
         self.__unit_cell_alphabetagamma = None
         self.__ub_matrix = None
@@ -807,6 +966,59 @@ class EdfFabioReader(FabioReader):
             self._read_mnemonic_key(frame_id, "counter", header)
         FabioReader._read_frame(self, frame_id, header)
 
+    def _read_frame_data(self, frame_id):
+        """Overwrite the method to memory-map uncompressed frames."""
+        fabio_file = self.fabio_file()
+        if isinstance(fabio_file, fabio.file_series.file_series):
+            with fabio_file.jump_image(frame_id) as fabio_image:
+                data = self._memory_map(fabio_image, 0)
+        else:
+            data = self._memory_map(fabio_file, frame_id)
+        if data is None:
+            data = FabioReader._read_frame_data(self, frame_id)
+        return data
+
+    def _memory_map(self, edf_image, frame_id):
+        """Returns a read-only memory map of the data of an EDF frame.
+
+        This relies on the frame description provided by
+        :class:`fabio.edfimage.EdfFrame`.
+
+        :param fabio.edfimage.EdfImage edf_image: The EDF image
+        :param int frame_id: Index of the frame in the image
+        :returns: The data, or None if the frame can't be memory-mapped
+            (compressed or external data, data already loaded...)
+        :rtype: Union[numpy.memmap,None]
+        """
+        try:
+            frame = edf_image._frames[frame_id]
+            if frame._data is not None or frame._data_compression is not None:
+                return None
+            if getattr(frame, "bfname", None) is not None:
+                return None
+            compressed_files = (fabio.fabioutils.GzipFile,
+                                fabio.fabioutils.BZ2File)
+            if isinstance(frame.file, compressed_files):
+                return None
+            if frame._dtype is None or frame.start is None:
+                return None
+
+            shape = tuple(frame.shape)
+            dtype = numpy.dtype(frame._dtype)
+            if frame.header.get("ByteOrder") == "HighByteFirst":
+                dtype = dtype.newbyteorder(">")
+            else:
+                dtype = dtype.newbyteorder("<")
+            size = dtype.itemsize * int(numpy.prod(shape))
+            if os.path.getsize(edf_image.filename) < frame.start + size:
+                # Incomplete data is padded by fabio
+                return None
+            return numpy.memmap(edf_image.filename, dtype=dtype, mode="r",
+                                offset=frame.start, shape=shape)
+        except (AttributeError, IndexError, TypeError, ValueError, OSError):
+            _logger.debug("Backtrace", exc_info=True)
+            return None
+
     def _is_filtered_key(self, key):
         if key in self.__catch_keys:
             return True
@@ -944,7 +1156,8 @@ class File(commonh5.File):
     """Class which handle a fabio image as a mimick of a h5py.File.
     """
 
-    def __init__(self, file_name=None, fabio_image=None, file_series=None):
+    def __init__(self, file_name=None, fabio_image=None, file_series=None,
+                 workers=None, lazy_metadata=False):
         """
         Constructor
 
@@ -954,8 +1167,14 @@ class File(commonh5.File):
         :param Union[list[str],fabio.file_series.file_series] file_series: An
             list of file name or a :class:`fabio.file_series.file_series`
             instance
+        :param Union[int,None] workers: Number of threads reading the headers
+            of a file series, see :class:`FabioReader`
+        :param bool lazy_metadata: If True, the metadata is only read when
+            the groups exposing it are accessed
         """
-        self.__fabio_reader = self.create_fabio_reader(file_name, fabio_image, file_series)
+        self.__fabio_reader = self.create_fabio_reader(
+            file_name, fabio_image, file_series,
+            workers=workers, lazy_metadata=lazy_metadata)
         if fabio_image is not None:
             file_name = fabio_image.filename
         scan = self.create_scan_group(self.__fabio_reader)
@@ -1003,7 +1222,8 @@ class File(commonh5.File):
 
         return scan
 
-    def create_fabio_reader(self, file_name, fabio_image, file_series):
+    def create_fabio_reader(self, file_name, fabio_image, file_series,
+                            workers=None, lazy_metadata=False):
         """Factory to create fabio reader.
 
         :rtype: FabioReader"""
@@ -1036,9 +1256,11 @@ class File(commonh5.File):
             assert(False)
 
         if use_edf_reader:
-            reader = EdfFabioReader(file_name, fabio_image, file_series)
+            reader = EdfFabioReader(file_name, fabio_image, file_series,
+                                    workers, lazy_metadata)
         else:
-            reader = FabioReader(file_name, fabio_image, file_series)
+            reader = FabioReader(file_name, fabio_image, file_series,
+                                 workers, lazy_metadata)
         return reader
 
     def close(self):
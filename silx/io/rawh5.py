@@ -54,11 +54,15 @@ class NumpyFile(commonh5.File):
     """
     Expose a numpy file `npy`, or `npz` as an h5py.File-like.
 
+    The data of `npy` files is memory-mapped, so that only the accessed
+    part of the file is read.
+
     :param str name: Filename to load
     """
     def __init__(self, name=None):
         commonh5.File.__init__(self, name=name, mode="w")
-        np_file = numpy.load(name)
+        # mmap_mode is ignored for npz files
+        np_file = numpy.load(name, mmap_mode="r")
         if hasattr(np_file, "close"):
             # For npz (created using  by numpy.savez, numpy.savez_compressed)
             for key, value in np_file.items():
@@ -69,3 +73,49 @@ class NumpyFile(commonh5.File):
             value = np_file
             dataset = _FreeDataset("data", data=value)
             self.add_node(dataset)
+
+
+def read_vol_shape(info_file):
+    """Read the shape of a volume from the `.vol.info` file written by PyHST
+
+    :param str info_file: Name of the `.vol.info` file
+    :return: The shape of the volume as (z, y, x)
+    :rtype: tuple
+    :raises ValueError: If the shape is not defined in the file
+    """
+    ddict = {}
+    with open(info_file, "r") as _file:
+        for line in _file.readlines():
+            if '=' not in line:
+                continue
+            line = line.rstrip().replace(' ', '')
+            line = line.split('#')[0]
+            key, value = line.split('=')
+            ddict[key.lower()] = value
+
+    if 'num_x' not in ddict or 'num_y' not in ddict or 'num_z' not in ddict:
+        raise ValueError(
+            'Unable to retrieve volume shape from %s' % info_file)
+    return int(ddict['num_z']), int(ddict['num_y']), int(ddict['num_x'])
+
+
+class VolFile(commonh5.File):
+    """
+    Expose a raw `vol` volume written by PyHST as an h5py.File-like.
+
+    The volume is memory-mapped, so that only the accessed part of the file
+    is read.
+
+    :param str name: Filename to load
+    :param Union[str,None] info_file: Name of the `.vol.info` file
+        containing the shape of the volume. Default is `name + ".info"`.
+    :param numpy.dtype dtype: Data type of the volume elements
+    """
+    def __init__(self, name=None, info_file=None, dtype=numpy.float32):
+        commonh5.File.__init__(self, name=name, mode="r")
+        if info_file is None:
+            info_file = name + ".info"
+        shape = read_vol_shape(info_file)
+        dataset = commonh5.MemoryMappedDataset(
+            "data", name, dtype=dtype, shape=shape)
+        self.add_node(dataset)
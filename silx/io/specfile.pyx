@@ -74,6 +74,15 @@ provided by :class:`Scan`::
     for mca_data in first_scan.mca:
         print(sum(mca_data))
 
+Indexing a large file can take a while. The scan index can be cached on disk
+to be reused the next time the same file is opened. Only the bytes appended
+to the file since the index was written are then parsed::
+
+    # Store index files in a cache directory
+    sf = SpecFile("test.dat", index_cache="/tmp/specfile_index")
+
+The default is set by :attr:`silx.config.DEFAULT_SPECFILE_INDEX_CACHE`.
+
 Classes
 =======
 
@@ -107,6 +116,7 @@ __authors__ = ["P. Knobel"]
 __license__ = "MIT"
 __date__ = "11/08/2017"
 
+import hashlib
 import os.path
 import logging
 import numpy
@@ -495,7 +505,7 @@ class Scan(object):
         The first index is the detector, the second index is the sample index.
         """
         if self._data is None:
-            self._data = numpy.transpose(self._specfile.data(self._index))
+            self._data = self._specfile._read_data(self._index, columns=True)
 
         return self._data
 
@@ -573,9 +583,23 @@ class Scan(object):
             ``#L`` line of the scan header.
         :type label: str
 
-        :return: Line data as a 1D array of doubles
+        :return: Line data as a 1D array of doubles. It is a copy of a
+            column of :attr:`data`, so the scan is parsed only once for all
+            columns.
         :rtype: numpy.ndarray
         """
+        if label in self.labels:
+            column_index = self.labels.index(label)
+            try:
+                data = self.data
+            except SfErrLineNotFound:
+                data = None
+            if data is not None and column_index < data.shape[0]:
+                return numpy.array(data[column_index])
+            if data is not None and data.size == 0:
+                # Aborted scan, already reported while reading data
+                return numpy.empty((0, ), numpy.double)
+
         try:
             ret = self._specfile.data_column_by_name(self._index, label)
         except SfErrLineNotFound:
@@ -626,10 +650,49 @@ def is_specfile(filename):
     return False
 
 
+def _index_filename(filename, index_cache):
+    """Returns the path of the index file of a SPEC file or None.
+
+    :param str filename: Path of the SPEC file
+    :param Union[bool,str,None] index_cache:
+        See :class:`SpecFile`
+    :rtype: Union[str,None]
+    """
+    if index_cache is None:
+        from silx import config
+        index_cache = config.DEFAULT_SPECFILE_INDEX_CACHE
+
+    if index_cache is False:
+        return None
+    if index_cache is True:
+        return filename + ".sfI"
+
+    # Index files of different SPEC files with the same name are
+    # distinguished by a hash of the absolute path
+    abspath = os.path.abspath(filename)
+    digest = hashlib.sha1(abspath.encode("utf-8")).hexdigest()[:16]
+    if not os.path.isdir(index_cache):
+        try:
+            os.makedirs(index_cache)
+        except OSError:
+            _logger.warning("Cannot create index cache directory %s",
+                            index_cache)
+            return None
+    return os.path.join(
+        index_cache, "%s-%s.sfI" % (os.path.basename(filename), digest))
+
+
 cdef class SpecFile(object):
     """
 
     :param filename: Path of the SpecFile to read
+    :param Union[bool,str,None] index_cache:
+        Where to store the scan index so that it is reused the next time
+        this file is opened:
+        False to disable the index cache,
+        True to store it in a file next to the SPEC file,
+        or the path of a directory where to store index files.
+        Default: :attr:`silx.config.DEFAULT_SPECFILE_INDEX_CACHE`.
 
     This class wraps the main data and header access functions of the C
     SpecFile library.
@@ -639,13 +702,21 @@ cdef class SpecFile(object):
         specfile_wrapper.SpecFileHandle *handle
         str filename
 
-    def __cinit__(self, filename):
+    def __cinit__(self, filename, index_cache=None):
         cdef int error = 0
         self.handle = NULL
 
         if is_specfile(filename):
+            index_filename = _index_filename(
+                filename if isinstance(filename, str) else filename.decode(),
+                index_cache)
             filename = _string_to_char_star(filename)
-            self.handle = specfile_wrapper.SfOpen(filename, &error)
+            if index_filename is None:
+                self.handle = specfile_wrapper.SfOpen(filename, &error)
+            else:
+                index_filename = os.fsencode(index_filename)
+                self.handle = specfile_wrapper.SfOpenWithIndex(
+                    filename, index_filename, &error)
             if error:
                 self._handle_error(error)
         else:
@@ -653,7 +724,7 @@ cdef class SpecFile(object):
             # this causes the destructor to be called
             self._handle_error(SF_ERR_FILE_OPEN)
 
-    def __init__(self, filename):
+    def __init__(self, filename, index_cache=None):
         if not isinstance(filename, str):
             # decode bytes to str in python 3, str to unicode in python 2
             self.filename = filename.decode()
@@ -672,6 +743,24 @@ cdef class SpecFile(object):
                 _logger.warning("Error while closing SpecFile")
             self.handle = NULL
 
+    def update(self):
+        """Index scans appended to the file since it was opened or last
+        updated.
+
+        Only the last scan and the appended bytes are parsed.
+        The last scan may have grown, so :class:`Scan` objects created
+        before the update should be created again.
+
+        :return: True if the file was modified, False otherwise
+        :rtype: bool
+        :raises SfErrFileRead: If the file is smaller than when it was
+            indexed (i.e., it was rewritten and must be reopened)
+        """
+        cdef int error = SF_ERR_NO_ERRORS
+        updated = specfile_wrapper.SfUpdate(self.handle, &error)
+        self._handle_error(error)
+        return bool(updated)
+
     def __len__(self):
         """Return the number of scans in the SpecFile
         """
@@ -863,6 +952,18 @@ cdef class SpecFile(object):
             ``len(self)-1``.
         :type scan_index: int
 
+        :return: Complete scan data as a 2D array of doubles
+        :rtype: numpy.ndarray
+        """
+        return self._read_data(scan_index)
+
+    def _read_data(self, scan_index, columns=False):
+        """Returns data for the specified scan index.
+
+        :param int scan_index: Unique scan index between ``0`` and
+            ``len(self)-1``.
+        :param bool columns: If True, the array is indexed by column first
+            and each column is contiguous in memory.
         :return: Complete scan data as a 2D array of doubles
         :rtype: numpy.ndarray
         """
@@ -895,11 +996,16 @@ cdef class SpecFile(object):
             ncolumns = 0
             regular = 0
 
-        ret_array = numpy.empty((nlines, ncolumns), dtype=numpy.double)
-
-        for i in range(nlines):
-            for j in range(ncolumns):
-                ret_array[i, j] = mydata[i][j]
+        if columns:
+            ret_array = numpy.empty((ncolumns, nlines), dtype=numpy.double)
+            for i in range(nlines):
+                for j in range(ncolumns):
+                    ret_array[j, i] = mydata[i][j]
+        else:
+            ret_array = numpy.empty((nlines, ncolumns), dtype=numpy.double)
+            for i in range(nlines):
+                for j in range(ncolumns):
+                    ret_array[i, j] = mydata[i][j]
 
         specfile_wrapper.freeArrNZ(<void ***>&mydata, nlines)
         free(data_info)
@@ -124,6 +124,7 @@
 #define COMMENT      2
 
 #define SF_ISFX      ".sfI"
+#define SF_FINGERPRINT_SIZE 64
 
 #define SF_INIT      0
 #define SF_READY     1
@@ -135,15 +136,16 @@
 
 DllExport SpecFile * SfOpen   ( char *name,int *error);
 DllExport SpecFile * SfOpen2  ( int fd, char *name,int *error);
+DllExport SpecFile * SfOpenWithIndex ( char *name, char *idxname, int *error);
 DllExport int        SfClose  ( SpecFile *sf);
 DllExport short      SfUpdate ( SpecFile *sf, int *error);
 DllExport char     * SfError  ( int error);
 
 
 #ifdef linux
-char SF_SIGNATURE[] =  "Linux 2ruru Sf2.0";
+char SF_SIGNATURE[] =  "Linux 2ruru Sf2.1";
 #else
-char SF_SIGNATURE[] =  "2ruru Sf2.0";
+char SF_SIGNATURE[] =  "2ruru Sf2.1";
 #endif
 
 /*
@@ -155,14 +157,14 @@ static void  sfNewLine     ( SpecFile *sf, SfCursor *cursor, char c0,char c1,int
 static void  sfHeaderLine  ( SpecFile *sf, SfCursor *cursor, char c,int *error);
 static void  sfNewBlock    ( SpecFile *sf, SfCursor *cursor, short how,int *error);
 static void  sfSaveScan    ( SpecFile *sf, SfCursor *cursor, int *error);
-static void  sfAssignScanNumbers (SpecFile *sf);
+static void  sfAssignScanNumbers (SpecFile *sf, long first);
+static SpecFile * sfOpen   ( int fd, char *name, char *idxname, int *error);
 static void  sfReadFile    ( SpecFile *sf, SfCursor *cursor, int *error);
 static void  sfResumeRead  ( SpecFile *sf, SfCursor *cursor, int *error);
-#ifdef SPECFILE_USE_INDEX_FILE
 static short sfOpenIndex   ( SpecFile *sf, SfCursor *cursor, int *error);
 static short sfReadIndex   ( int sfi, SpecFile *sf, SfCursor *cursor, int *error);
 static void  sfWriteIndex  ( SpecFile *sf, SfCursor *cursor, int *error);
-#endif
+static void  sfFingerprint ( int fd, long offset, char *buffer);
 
 /*
  * errors
@@ -252,10 +254,67 @@ SfOpen(char *name, int *error) {
 
 DllExport SpecFile *
 SfOpen2(int fd, char *name,int *error) {
+   return (sfOpen(fd, name, (char *)NULL, error));
+}
+
+
+
+/*********************************************************************
+ *   Function:          SpecFile *SfOpenWithIndex( name, idxname, error)
+ *
+ *   Description:       Opens connection to Spec data file.
+ *                      Creates index list in memory, reusing the index
+ *                      file idxname if it is valid for this data file.
+ *                      The index file is (re)written if it was missing,
+ *                      invalid or if the data file was modified.
+ *
+ *   Parameters:
+ *              Input :
+ *                      (1) Filename
+ *                      (2) Index filename, NULL to use name + SF_ISFX
+ *              Output:
+ *                      (3) error number
+ *   Returns:
+ *                      SpecFile pointer.
+ *                      NULL if not successful.
+ *
+ *   Possible errors:
+ *                      SF_ERR_FILE_OPEN
+ *                      SF_ERR_MEMORY_ALLOC
+ *
+ *********************************************************************/
+
+DllExport SpecFile *
+SfOpenWithIndex(char *name, char *idxname, int *error) {
+   int         fd;
+   char       *defaultname;
+   SpecFile   *sf;
+
+   fd   = open(name,SF_OPENFLAG);
+   if (idxname != NULL) {
+      return (sfOpen(fd, name, idxname, error));
+   }
+
+   defaultname = (char *)malloc(strlen(name) + strlen(SF_ISFX) + 1);
+   if (defaultname == NULL) {
+      *error = SF_ERR_MEMORY_ALLOC;
+      if (fd != -1) close(fd);
+      return ( (SpecFile *) NULL );
+   }
+   sprintf(defaultname,"%s%s",name,SF_ISFX);
+   sf = sfOpen(fd, name, defaultname, error);
+   free(defaultname);
+   return (sf);
+}
+
+
+static SpecFile *
+sfOpen(int fd, char *name, char *idxname, int *error) {
    SpecFile   *sf;
    short       idxret;
    SfCursor      cursor;
    struct stat mystat;
+   long        first = 0;
 
    if ( fd == -1 ) {
       *error = SF_ERR_FILE_OPEN;
@@ -296,6 +355,7 @@ SfOpen2(int fd, char *name,int *error) {
    sf->data            = (double **)NULL;
    sf->data_info       = (long *)NULL;
    sf->updating        = 0;
+   sf->idxname         = (idxname != NULL) ? (char *)strdup(idxname) : (char *)NULL;
 
   /*
    * Init cursor
@@ -311,27 +371,32 @@ SfOpen2(int fd, char *name,int *error) {
    cursor.file_header  = 0;
 
 
-#ifdef SPECFILE_USE_INDEX_FILE
   /*
    * Check if index file
    *   open it and continue from there
    */
-   idxret = sfOpenIndex(sf,&cursor,error);
-#else
-   idxret = SF_INIT;
-#endif
+   if (sf->idxname != NULL) {
+      idxret = sfOpenIndex(sf,&cursor,error);
+   } else {
+      idxret = SF_INIT;
+   }
 
    switch(idxret) {
       case SF_MODIFIED:
+          /* Scans before the last indexed one are kept */
+          first = sf->no_scans - 1;
           sfResumeRead(sf,&cursor,error);
           sfReadFile(sf,&cursor,error);
           break;
 
       case SF_INIT:
+          lseek(sf->fd,0,SEEK_SET);
           sfReadFile(sf,&cursor,error);
           break;
 
       case SF_READY:
+          /* Scan numbers and orders are stored in the index */
+          first = sf->no_scans;
           break;
 
       default:
@@ -343,11 +408,9 @@ SfOpen2(int fd, char *name,int *error) {
   /*
    * Once is all done assign scan numbers and orders
    */
-   sfAssignScanNumbers(sf);
+   sfAssignScanNumbers(sf, first);
 
-#ifdef SPECFILE_USE_INDEX_FILE
-   if (idxret != SF_READY) sfWriteIndex(sf,&cursor,error);
-#endif
+   if (sf->idxname != NULL && idxret != SF_READY) sfWriteIndex(sf,&cursor,error);
    return(sf);
 }
 
@@ -383,6 +446,8 @@ SfClose( SpecFile *sf )
      }
 
      free ((char *)sf->sfname);
+     if (sf->idxname != NULL)
+        free ((char *)sf->idxname);
      if (sf->scanbuffer != NULL)
         free ((char *)sf->scanbuffer);
 
@@ -406,6 +471,8 @@ SfClose( SpecFile *sf )
  *
  *   Description:       Updates connection to Spec data file .
  *                      Appends to index list in memory.
+ *                      Only the last scan and the bytes appended to the
+ *                      file since last update are parsed.
  *
  *   Parameters:
  *              Input :
@@ -418,6 +485,7 @@ SfClose( SpecFile *sf )
  *
  *   Possible errors:
  *                      SF_ERR_FILE_OPEN
+ *                      SF_ERR_FILE_READ (file is smaller than indexed)
  *                      SF_ERR_MEMORY_ALLOC
  *
  *********************************************************************/
@@ -426,21 +494,47 @@ SfUpdate ( SpecFile *sf, int *error )
 {
     struct stat mystat;
     long   mtime;
+    long   first;
    /*printf("In SfUpdate\n");
    __asm("int3");*/
     stat(sf->sfname,&mystat);
 
     mtime = mystat.st_mtime;
 
-    if (sf->m_time != mtime)  {
-       sfResumeRead (sf,&(sf->cursor),error);
+   /*
+    * A file which shrank was rewritten: it cannot be updated
+    */
+    if ((long)mystat.st_size < sf->cursor.bytecnt) {
+       *error = SF_ERR_FILE_READ;
+       return(0);
+    }
+
+   /*
+    * mtime resolution is too coarse for files being written:
+    * also check whether the file size changed
+    */
+    if (sf->m_time != mtime || (long)mystat.st_size != sf->cursor.bytecnt)  {
+       if (sf->no_scans > 0) {
+          /* Only the last scan and the appended bytes are parsed */
+          first = sf->no_scans - 1;
+          sfResumeRead (sf,&(sf->cursor),error);
+       } else {
+          /* No scan yet: parse the whole file again */
+          first = 0;
+          memset(&(sf->cursor), 0, sizeof(SfCursor));
+          sf->cursor.hdafoffset = -1;
+          sf->cursor.dataoffset = -1;
+          lseek(sf->fd,0,SEEK_SET);
+       }
        sfReadFile   (sf,&(sf->cursor),error);
 
+       /* Cached data of the last scan may be outdated */
+       freeAllData(sf);
+       sf->current = (ObjectList *)NULL;
+
        sf->m_time = mtime;
-       sfAssignScanNumbers(sf);
-#ifdef SPECFILE_USE_INDEX_FILE
-       sfWriteIndex (sf,&(sf->cursor),error);
-#endif
+       sfAssignScanNumbers(sf, first);
+       if (sf->idxname != NULL) sfWriteIndex (sf,&(sf->cursor),error);
        return(1);
     }else{
        return(0);
@@ -547,104 +641,158 @@ sfResumeRead  ( SpecFile *sf, SfCursor *cursor, int *error) {
 }
 
 
-#ifdef SPECFILE_USE_INDEX_FILE
+/*
+ * Index file layout:
+ *   - SF_SIGNATURE
+ *   - sizeof(SfCursor) and sizeof(SpecScan) (long)
+ *   - data file modification time and size (long)
+ *   - SF_FINGERPRINT_SIZE bytes at the beginning of the data file
+ *   - SF_FINGERPRINT_SIZE bytes at the beginning of the last scan
+ *   - cursor (SfCursor)
+ *   - number of scans (long)
+ *   - scans (SpecScan)
+ *
+ * If the data file grew and both fingerprints still match, only the last
+ * indexed scan and the appended bytes are parsed again (SF_MODIFIED).
+ */
 static short
 sfOpenIndex ( SpecFile *sf, SfCursor *cursor, int *error) {
-    char *idxname;
-    short namelength;
     int   sfi;
+    short ret;
 
-    namelength = strlen(sf->sfname) + strlen(SF_ISFX) + 1;
-
-    idxname = (char *)malloc(sizeof(char) * namelength);
-
-    sprintf(idxname,"%s%s",sf->sfname,SF_ISFX);
-
-    if ((sfi = open(idxname,SF_OPENFLAG)) == -1) {
-        free(idxname);
+    if ((sfi = open(sf->idxname,SF_OPENFLAG)) == -1) {
         return(SF_INIT);
     } else {
-        free(idxname);
-        return(sfReadIndex(sfi,sf,cursor,error));
+        ret = sfReadIndex(sfi,sf,cursor,error);
+        close(sfi);
+        return(ret);
     }
 }
 
-
+
+static void
+sfFingerprint ( int fd, long offset, char *buffer) {
+    memset(buffer, 0, SF_FINGERPRINT_SIZE);
+    if (lseek(fd,offset,SEEK_SET) != -1) {
+        if (read(fd,buffer,SF_FINGERPRINT_SIZE) == -1) {
+            memset(buffer, 0, SF_FINGERPRINT_SIZE);
+        }
+    }
+}
+
+
 static short
 sfReadIndex   ( int sfi, SpecFile *sf, SfCursor *cursor, int *error) {
     SfCursor   filecurs;
-    char       buffer[200];
-    long       bytesread,i=0;
-    SpecScan   scan;
-    short      modif = 0;
-    long       mtime;
+    char       signature[sizeof(SF_SIGNATURE)];
+    char       head[SF_FINGERPRINT_SIZE], filehead[SF_FINGERPRINT_SIZE];
+    char       tail[SF_FINGERPRINT_SIZE], filetail[SF_FINGERPRINT_SIZE];
+    long       sizes[2];
+    long       mtime, size, no_scans, i;
+    SpecScan  *scans;
+    struct stat mystat;
 
    /*
-    * read signature
+    * read signature and check structure sizes
     */
-    bytesread = read(sfi,buffer,sizeof(SF_SIGNATURE));
-    if (strcmp(buffer,SF_SIGNATURE) || bytesread == 0 ) {
+    if (read(sfi,signature,sizeof(SF_SIGNATURE)) != sizeof(SF_SIGNATURE) ||
+            memcmp(signature,SF_SIGNATURE,sizeof(SF_SIGNATURE))) {
+        return(SF_INIT);
+    }
+    if (read(sfi,sizes,sizeof(sizes)) != sizeof(sizes) ||
+            sizes[0] != sizeof(SfCursor) || sizes[1] != sizeof(SpecScan)) {
         return(SF_INIT);
     }
 
    /*
-    * read cursor and specfile structure
+    * read data file description and cursor
     */
-    if ( read(sfi,&mtime,   sizeof(long)) == 0)   return(SF_INIT);
-    if ( read(sfi,&filecurs, sizeof(SfCursor)) == 0) return(SF_INIT);
+    if (read(sfi,&mtime,sizeof(long)) != sizeof(long)) return(SF_INIT);
+    if (read(sfi,&size, sizeof(long)) != sizeof(long)) return(SF_INIT);
+    if (read(sfi,head,SF_FINGERPRINT_SIZE) != SF_FINGERPRINT_SIZE) return(SF_INIT);
+    if (read(sfi,tail,SF_FINGERPRINT_SIZE) != SF_FINGERPRINT_SIZE) return(SF_INIT);
+    if (read(sfi,&filecurs,sizeof(SfCursor)) != sizeof(SfCursor)) return(SF_INIT);
+    if (read(sfi,&no_scans,sizeof(long)) != sizeof(long) || no_scans < 1) {
+        return(SF_INIT);
+    }
 
-    if (sf->m_time != mtime)  modif = 1;
+   /*
+    * data file must not have shrunk nor been rewritten
+    */
+    if (fstat(sf->fd,&mystat) != 0 || (long)mystat.st_size < size) {
+        return(SF_INIT);
+    }
+    sfFingerprint(sf->fd, 0, filehead);
+    sfFingerprint(sf->fd, filecurs.cursor, filetail);
+    if (memcmp(head,filehead,SF_FINGERPRINT_SIZE) ||
+            memcmp(tail,filetail,SF_FINGERPRINT_SIZE)) {
+        return(SF_INIT);
+    }
 
-    while(read(sfi,&scan, sizeof(SpecScan))) {
-        addToList(&(sf->list), (void *)&scan, (long)sizeof(SpecScan));
-        i++;
+    if ((scans = (SpecScan *)malloc(no_scans * sizeof(SpecScan))) == NULL) {
+        return(SF_INIT);
+    }
+    if (read(sfi,scans,no_scans * sizeof(SpecScan)) !=
+            (long)(no_scans * sizeof(SpecScan))) {
+        free(scans);
+        return(SF_INIT);
     }
-    sf->no_scans = i;
 
-    memcpy(cursor,&filecurs,sizeof(SfCursor));
+    for (i=0; i<no_scans; i++) {
+        addToList(&(sf->list), (void *)&(scans[i]), (long)sizeof(SpecScan));
+    }
+    free(scans);
+    sf->no_scans = no_scans;
 
-    if (modif) return(SF_MODIFIED);
+    memcpy(cursor,&filecurs,sizeof(SfCursor));
 
+    if (sf->m_time != mtime || (long)mystat.st_size != size) {
+        return(SF_MODIFIED);
+    }
     return(SF_READY);
 }
 
-
+
 static void
 sfWriteIndex  ( SpecFile *sf, SfCursor *cursor, int *error) {
 
     int         fdi;
-    char       *idxname;
-    short       namelength;
     ObjectList *obj;
-    long        mtime;
-
-    namelength = strlen(sf->sfname) + strlen(SF_ISFX) + 1;
-
-    idxname = (char *)malloc(sizeof(char) * namelength);
-
-    sprintf(idxname,"%s%s",sf->sfname,SF_ISFX);
+    long        sizes[2];
+    long        mtime, size;
+    char        head[SF_FINGERPRINT_SIZE], tail[SF_FINGERPRINT_SIZE];
+    struct stat mystat;
 
-    /* if ((fdi = open(idxname,SF_WRITEFLAG,SF_UMASK)) == -1) { */
-    if ((fdi = open(idxname,O_CREAT | O_WRONLY,SF_UMASK)) == -1) {
-        printf("    - cannot open. Error: (%d)\n",errno);
-        free(idxname);
+    if (sf->no_scans < 1 || fstat(sf->fd,&mystat) != 0) {
         return;
-    } else {
-        mtime = sf->m_time;
-        write(fdi,SF_SIGNATURE,sizeof(SF_SIGNATURE));
- /*
-  * Swap bytes for linux
-  */
-        write(fdi, (void *) &mtime, sizeof(long));
-        write(fdi, (void *) cursor, sizeof(SfCursor));
-        for( obj = sf->list.first; obj ; obj = obj->next)
-           write(fdi,(void *) obj->contents, sizeof(SpecScan));
-        close(fdi);
-        free(idxname);
+    }
+
+   /*
+    * The index is only a cache: failing to write it is not an error
+    */
+    if ((fdi = open(sf->idxname,O_CREAT | O_WRONLY | O_TRUNC,SF_UMASK)) == -1) {
         return;
     }
+
+    sizes[0] = sizeof(SfCursor);
+    sizes[1] = sizeof(SpecScan);
+    mtime = sf->m_time;
+    size = (long) mystat.st_size;
+    sfFingerprint(sf->fd, 0, head);
+    sfFingerprint(sf->fd, cursor->cursor, tail);
+
+    write(fdi,SF_SIGNATURE,sizeof(SF_SIGNATURE));
+    write(fdi,(void *) sizes, sizeof(sizes));
+    write(fdi,(void *) &mtime, sizeof(long));
+    write(fdi,(void *) &size, sizeof(long));
+    write(fdi,head,SF_FINGERPRINT_SIZE);
+    write(fdi,tail,SF_FINGERPRINT_SIZE);
+    write(fdi,(void *) cursor, sizeof(SfCursor));
+    write(fdi,(void *) &(sf->no_scans), sizeof(long));
+    for( obj = sf->list.first; obj ; obj = obj->next)
+       write(fdi,(void *) obj->contents, sizeof(SpecScan));
+    close(fdi);
 }
-#endif
 
 
 /*****************************************************************************
@@ -789,9 +937,10 @@ sfSaveScan(SpecFile *sf, SfCursor *cursor,int *error) {
 
 
 static void
-sfAssignScanNumbers(SpecFile *sf) {
+sfAssignScanNumbers(SpecFile *sf, long first) {
 
   int i;
+  long index = 0;
   char *ptr;
   char buffer[50];
   char buffer2[50];
@@ -801,7 +950,9 @@ sfAssignScanNumbers(SpecFile *sf) {
   SpecScan              *scan,
                         *scan2;
 
-  for ( object = (sf->list).first; object; object=object->next) {
+  for ( object = (sf->list).first; object; object=object->next, index++) {
+        if (index < first) continue;  /* Already assigned */
+
         scan = (SpecScan *) object->contents;
 
         lseek(sf->fd,scan->offset,SEEK_SET);
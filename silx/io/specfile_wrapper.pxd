@@ -37,7 +37,9 @@ ctypedef _SpecFile SpecFileHandle
 cdef extern from "SpecFileCython.h":
     # sfinit
     SpecFileHandle* SfOpen(char*, int*)
+    SpecFileHandle* SfOpenWithIndex(char*, char*, int*)
     int SfClose(SpecFileHandle*)
+    short SfUpdate(SpecFileHandle*, int*)
     char* SfError(int)
     
     # sfindex
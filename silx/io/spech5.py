@@ -87,7 +87,9 @@ is also a data column header defined in the ``#L`` scan header line.
 
 Scan data  (e.g. ``/1.1/measurement/colname0``) is accessed by column,
 the dataset name ``colname0`` being the column label as defined in the ``#L``
-scan header line.
+scan header line. The scan data is parsed once, the first time one of its
+columns is read, and all the column datasets of the scan are views of this
+buffer.
 
 If a ``/`` character is present in a column label or in a motor name in the
 original SPEC file, it will be substituted with a ``%`` character in the
@@ -194,7 +196,7 @@ import numpy
 import six
 
 from silx import version as silx_version
-from .specfile import SpecFile
+from .specfile import SpecFile, SfErrLineNotFound
 from . import commonh5
 
 __authors__ = ["P. Knobel", "D. Naudet"]
@@ -217,6 +219,18 @@ def to_h5py_utf8(str_list):
     return numpy.array(str_list, dtype=text_dtype)
 
 
+def _get_root_attrs(filename):
+    """Returns the attributes of the root group of a SPEC file
+
+    :param str filename: Path of the SPEC file
+    :rtype: dict
+    """
+    return {"NX_class": to_h5py_utf8("NXroot"),
+            "file_time": to_h5py_utf8(datetime.datetime.now().isoformat()),
+            "file_name": to_h5py_utf8(filename),
+            "creator": to_h5py_utf8("silx spech5 %s" % silx_version)}
+
+
 def _get_number_of_mca_analysers(scan):
     """
     :param SpecFile sf: :class:`SpecFile` instance
@@ -551,29 +565,50 @@ class SpecH5(commonh5.File, SpecH5Group):
     which implements most of its API.
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, index_cache=None):
         """
         :param filename: Path to SpecFile in filesystem
         :type filename: str
+        :param Union[bool,str,None] index_cache:
+            Where to store the scan index, see
+            :class:`silx.io.specfile.SpecFile`
         """
         if isinstance(filename, io.IOBase):
             # see https://github.com/silx-kit/silx/issues/858
             filename = filename.name
 
-        self._sf = SpecFile(filename)
+        self._sf = SpecFile(filename, index_cache=index_cache)
 
-        attrs = {"NX_class": to_h5py_utf8("NXroot"),
-                 "file_time": to_h5py_utf8(
-                         datetime.datetime.now().isoformat()),
-                 "file_name": to_h5py_utf8(filename),
-                 "creator": to_h5py_utf8("silx spech5 %s" % silx_version)}
-        commonh5.File.__init__(self, filename, attrs=attrs)
+        commonh5.File.__init__(self, filename, attrs=_get_root_attrs(filename))
 
         for scan_key in self._sf.keys():
             scan = self._sf[scan_key]
             scan_group = ScanGroup(scan_key, parent=self, scan=scan)
             self.add_node(scan_group)
 
+    def update(self):
+        """Expose the scans appended to the SPEC file since it was opened.
+
+        Only the appended bytes are parsed. New scans are added as groups
+        and the group of the previously last scan is created again,
+        as this scan may have grown.
+
+        :return: Names of the scan groups which were added or replaced
+        :rtype: List[str]
+        :raises IOError: If the file was rewritten and must be reopened
+        """
+        if not self._sf.update():
+            return []
+
+        scan_keys = self._sf.keys()
+        # The previously last scan may have been updated
+        first = max(0, len(self._get_items()) - 1)
+        updated_keys = scan_keys[first:]
+        for scan_key in updated_keys:
+            scan = self._sf[scan_key]
+            self.add_node(ScanGroup(scan_key, parent=self, scan=scan))
+        return updated_keys
+
     def close(self):
         self._sf.close()
         self._sf = None
@@ -809,17 +844,62 @@ class MeasurementGroup(commonh5.Group, SpecH5Group):
         """
         commonh5.Group.__init__(self, name="measurement", parent=parent,
                                 attrs={"NX_class": to_h5py_utf8("NXcollection"),})
+        self._scan = scan
+        self._columns = None
         for label in scan.labels:
             safe_label = label.replace("/", "%")
-            self.add_node(SpecH5NodeDataset(name=safe_label,
-                                            data=scan.data_column_by_name(label),
-                                            parent=self))
+            self.add_node(MeasurementDataset(name=safe_label,
+                                             label=label,
+                                             parent=self))
 
         num_analysers = _get_number_of_mca_analysers(scan)
         for anal_idx in range(num_analysers):
             self.add_node(MeasurementMcaGroup(parent=self, analyser_index=anal_idx))
 
 
+    def _get_columns(self):
+        """Returns the scan data columns shared by all measurement datasets.
+
+        The scan is parsed and converted to float32 only once, the first
+        time a column is read. Columns do not overlap in memory, so each
+        of them can be modified in place like separate arrays.
+
+        :rtype: numpy.ndarray
+        """
+        if self._columns is None:
+            try:
+                data = self._scan.data
+            except SfErrLineNotFound:
+                data = numpy.empty((0, 0))
+            self._columns = numpy.ascontiguousarray(data, dtype=numpy.float32)
+        return self._columns
+
+
+class MeasurementDataset(SpecH5LazyNodeDataset):
+    """Dataset exposing a data column of a scan.
+
+    The data is a view of the columns loaded once by the parent
+    :class:`MeasurementGroup`."""
+    def __init__(self, name, label, parent):
+        """
+
+        :param str name: Name of the dataset
+        :param str label: Label of the column in the ``#L`` scan header line
+        :param MeasurementGroup parent: Parent group
+        """
+        commonh5.LazyLoadableDataset.__init__(self, name, parent)
+        self._label = label
+
+    def _create_data(self):
+        scan = self.parent._scan
+        column_index = scan.labels.index(self._label)
+        columns = self.parent._get_columns()
+        if column_index < columns.shape[0]:
+            return columns[column_index]
+        return numpy.asarray(scan.data_column_by_name(self._label),
+                             dtype=numpy.float32)
+
+
 class MeasurementMcaGroup(commonh5.Group, SpecH5Group):
     def __init__(self, parent, analyser_index):
         basename = "mca_%d" % analyser_index
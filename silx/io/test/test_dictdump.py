@@ -144,6 +144,15 @@ class TestDictToH5(unittest.TestCase):
             self.assertEqual(h5file["dataset"].attrs['dataset_attr'], 12)
             self.assertEqual(h5file["group"].attrs['group_attr2'], 13)
 
+    def testKeyPathThenGroup(self):
+        """A key with a path creates a group used by a later key"""
+        ddict = {"a/b": 1, "a": {"c": 2}, "d/e": 3.5}
+        with h5py.File(self.h5_fname, "w") as h5file:
+            dictdump.dicttoh5(ddict, h5file)
+            self.assertEqual(h5file["a/b"][()], 1)
+            self.assertEqual(h5file["a/c"][()], 2)
+            self.assertEqual(h5file["d/e"][()], 3.5)
+
     def testPathAttributes(self):
         """A group is requested at a path"""
         ddict = {
@@ -242,6 +251,62 @@ class TestDictToH5(unittest.TestCase):
                                              ddict['darks']['0'])
 
 
+    def testScalarTypes(self):
+        """Scalars are written with their type"""
+        ddict = {
+            "bool": numpy.bool_(True),
+            "int8": numpy.int8(-3),
+            "uint64": numpy.uint64(2**63),
+            "float32": numpy.float32(1.5),
+            "float64be": numpy.array(2.5, dtype=">f8"),
+            "complex": 1 + 2j,
+            "str": "a",
+            "bytes": b"b",
+        }
+        with h5py.File(self.h5_fname, "w") as h5file:
+            dictdump.dicttoh5(ddict, h5file)
+        with h5py.File(self.h5_fname, "r") as h5file:
+            for key, expected in ddict.items():
+                dataset = h5file[key]
+                self.assertEqual(dataset.shape, ())
+                self.assertEqual(h5py_read_dataset(dataset), expected)
+                if isinstance(expected, numpy.generic):
+                    self.assertEqual(dataset.dtype, expected.dtype)
+            self.assertEqual(h5file["float64be"].dtype, numpy.dtype(">f8"))
+
+    def testExistingGroups(self):
+        """Groups are reused when writing several times in a file"""
+        with h5py.File(self.h5_fname, "w") as h5file:
+            for i in range(3):
+                dictdump.dicttoh5({"fit": {"point%d" % i: {"chi2": i}},
+                                   ("fit", "NX_class"): "NXcollection"},
+                                  h5file, h5path="/results")
+            self.assertEqual(len(h5file["results/fit"]), 3)
+            self.assertEqual(h5file["results/fit/point2/chi2"][()], 2)
+
+    def testDatasetCreationPolicy(self):
+        policy = dictdump.DatasetCreationPolicy(
+            min_size=1024, chunk_size=4096, compression="gzip", shuffle=True)
+        self.assertEqual(policy.chunks((100, 32, 16), 4), (2, 32, 16))
+        self.assertEqual(policy.chunks((10, 4096), 4), (1, 1024))
+        self.assertEqual(policy.chunks((10,), 4), (10,))
+        ddict = {
+            "small": numpy.arange(10),
+            "stack": numpy.zeros((100, 32, 16), dtype=numpy.float32),
+            "scalar": 1.,
+        }
+        with h5py.File(self.h5_fname, "w") as h5file:
+            dictdump.dicttoh5(ddict, h5file, create_dataset_args=policy)
+        with h5py.File(self.h5_fname, "r") as h5file:
+            self.assertIsNone(h5file["small"].chunks)
+            self.assertIsNone(h5file["small"].compression)
+            stack = h5file["stack"]
+            self.assertEqual(stack.chunks, (2, 32, 16))
+            self.assertEqual(stack.compression, "gzip")
+            self.assertTrue(stack.shuffle)
+            self.assertEqual(h5file["scalar"][()], 1.)
+
+
 class TestH5ToDict(unittest.TestCase):
     def setUp(self):
         self.tempdir = tempfile.mkdtemp()
@@ -313,6 +378,74 @@ class TestH5ToDict(unittest.TestCase):
         numpy.testing.assert_array_equal(ddict[("", "attr_2utf8")], adict[("", "attr_2utf8")])
 
 
+class TestLazyH5ToDict(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.h5_fname = os.path.join(self.tempdir, "lazy.h5")
+        with h5py.File(self.h5_fname, "w") as h5f:
+            h5f["entry/title"] = "scan"
+            h5f["entry/instrument/detector/name"] = "pilatus"
+            h5f["entry/instrument/detector/data"] = numpy.zeros((10, 20, 30))
+            h5f["entry/instrument/source/name"] = "ESRF"
+            h5f["entry/instrument/source/sample/name"] = "powder"
+
+    def tearDown(self):
+        os.unlink(self.h5_fname)
+        os.rmdir(self.tempdir)
+
+    def testLazyRead(self):
+        ddict = h5todict(self.h5_fname, path="/entry", lazy=True,
+                         lazy_threshold=1024)
+        self.assertIsInstance(ddict, dictdump.LazyH5Dict)
+        with h5py.File(self.h5_fname, "r+") as h5f:
+            h5f["entry/title"][()] = "modified"
+            h5f["entry/instrument/detector/data"][0, 0, 0] = 1
+        # Small datasets were read while browsing the file
+        self.assertEqual(ddict["title"], "scan")
+        detector = ddict["instrument"]["detector"]
+        self.assertEqual(detector["name"], "pilatus")
+        # Big datasets are read on first access
+        self.assertEqual(detector["data"].shape, (10, 20, 30))
+        self.assertEqual(detector["data"][0, 0, 0], 1)
+        self.assertIs(detector["data"], detector["data"])
+
+    def testLazyItems(self):
+        ddict = h5todict(self.h5_fname, path="/entry", lazy=True,
+                         lazy_threshold=1024)
+        detector = ddict["instrument"]["detector"]
+        values = dict(detector.items())
+        self.assertIsInstance(values["data"], numpy.ndarray)
+        expected = h5todict(self.h5_fname, path="/entry")
+        self.assertEqual(ddict["instrument"]["source"],
+                         expected["instrument"]["source"])
+
+    def testLazyToDict(self):
+        ddict = h5todict(self.h5_fname, path="/entry", lazy=True,
+                         lazy_threshold=1024)
+        detector = ddict["instrument"]["detector"]
+        updated = {}
+        updated.update(detector)
+        for values in (dict(detector), {**detector}, updated):
+            self.assertIsInstance(values["data"], numpy.ndarray)
+            self.assertEqual(values["data"].shape, (10, 20, 30))
+
+    def testMaxDepth(self):
+        ddict = h5todict(self.h5_fname, path="/entry", max_depth=0)
+        self.assertEqual(list(ddict.keys()), ["title"])
+        ddict = h5todict(self.h5_fname, path="/entry", max_depth=2)
+        self.assertIn("name", ddict["instrument"]["source"])
+        self.assertNotIn("sample", ddict["instrument"]["source"])
+
+    def testIncludeNames(self):
+        ddict = h5todict(self.h5_fname, path="/entry",
+                         include_names=["instrument/*/name"])
+        self.assertNotIn("title", ddict)
+        instrument = ddict["instrument"]
+        self.assertEqual(set(instrument.keys()), {"detector", "source"})
+        self.assertEqual(list(instrument["detector"].keys()), ["name"])
+        self.assertEqual(list(instrument["source"].keys()), ["name"])
+
+
 class TestDictToNx(unittest.TestCase):
     def setUp(self):
         self.tempdir = tempfile.mkdtemp()
@@ -634,6 +767,7 @@ def suite():
     test_suite.addTest(loadTests(TestDictToNx))
     test_suite.addTest(loadTests(TestDictToJson))
     test_suite.addTest(loadTests(TestH5ToDict))
+    test_suite.addTest(loadTests(TestLazyH5ToDict))
     test_suite.addTest(loadTests(TestNxToDict))
     return test_suite
 
@@ -136,6 +136,29 @@ class TestFabioH5(unittest.TestCase):
         self.assertEqual(dataset[...][0, 0, 0], 0)
         self.assertEqual(dataset.attrs["interpretation"], "image")
 
+    def test_heterogeneous_frames_shape(self):
+        """Shape of frames with different sizes before reading the data"""
+        data1 = numpy.arange(2 * 3)
+        data1.shape = 2, 3
+        data2 = numpy.arange(2 * 5)
+        data2.shape = 2, 5
+        fabio_image = fabio.edfimage.edfimage(data=data1)
+        fabio_image.append_frame(data=data2)
+        h5_image = fabioh5.File(fabio_image=fabio_image)
+
+        dataset = h5_image["/scan_0/instrument/detector_0/data"]
+        self.assertEqual(dataset.shape, (2, 2, 5))
+        self.assertEqual(dataset[0].tolist(), [[0, 1, 2, 0, 0], [3, 4, 5, 0, 0]])
+        self.assertEqual(dataset[1].tolist(), data2.tolist())
+
+        # Frames are read one at a time
+        reader = fabioh5.FabioReader(fabio_image=fabio_image)
+        frameData = _TestableFrameData("foo", reader)
+        self.assertEqual(frameData.shape, (2, 2, 5))
+        self.assertEqual(frameData.dtype, reader.get_frame(0).dtype)
+        self.assertEqual(frameData[:, 1, 2].tolist(), [5, 7])
+        self.assertEqual(frameData[0, :, 3:].tolist(), [[0, 0], [0, 0]])
+
     def test_single_3d_frame(self):
         """Image source contains a cube"""
         data = numpy.arange(2 * 3 * 4)
@@ -548,6 +571,14 @@ class TestFabioH5WithEdf(unittest.TestCase):
         # We do not expose them in FabioH5
         self.assertNotIn("/scan_0/instrument/detector_0/others/HeaderID", self.h5_image)
 
+    def test_memory_mapped_data(self):
+        h5_image = fabioh5.File(self.edf_filename)
+        dataset = h5_image["/scan_0/instrument/detector_0/data"]
+        self.assertIsInstance(dataset._get_data(), numpy.memmap)
+        self.assertEqual(dataset[1].tolist(), [12, 13])
+        self.assertEqual(dataset[()].tolist(), [[10, 11], [12, 13], [14, 15]])
+        h5_image.close()
+
 
 class _TestableFrameData(fabioh5.FrameData):
     """Allow to test if the full data is reached."""
@@ -602,6 +633,15 @@ class TestFabioH5WithFileSeries(unittest.TestCase):
         h5_image = fabioh5.File(file_series=self.edf_filenames)
         self._testH5Image(h5_image)
 
+    def testFileListWorkers(self):
+        h5_image = fabioh5.File(file_series=self.edf_filenames, workers=4)
+        self._testH5Image(h5_image)
+
+    def testLazyMetadata(self):
+        h5_image = fabioh5.File(file_series=self.edf_filenames,
+                                lazy_metadata=True)
+        self._testH5Image(h5_image)
+
     def testFileSeries(self):
         file_series = fabioh5._FileSeries(self.edf_filenames)
         h5_image = fabioh5.File(file_series=file_series)
@@ -614,6 +654,28 @@ class TestFabioH5WithFileSeries(unittest.TestCase):
         self.assertEqual(frameData.dtype.kind, "i")
         self.assertEqual(frameData.shape, (10, 3, 2))
 
+    def testFrameDataSlicing(self):
+        file_series = fabioh5._FileSeries(self.edf_filenames)
+        reader = fabioh5.FabioReader(file_series=file_series)
+        frameData = _TestableFrameData("foo", reader)
+        self.assertEqual(len(frameData), 10)
+        self.assertEqual(frameData[-1].tolist(), [[9, 11], [12, 13], [14, 15]])
+        self.assertEqual(frameData[2:8:2, 0, 0].tolist(), [2, 4, 6])
+        self.assertEqual(frameData[5:5].shape, (0, 3, 2))
+        with self.assertRaises(IndexError):
+            frameData[10]
+
+    def testFrameCacheSize(self):
+        file_series = fabioh5._FileSeries(self.edf_filenames)
+        reader = fabioh5.FabioReader(file_series=file_series)
+        frame_size = reader.get_frame(0).nbytes
+        reader.FRAME_CACHE_SIZE = 3 * frame_size
+        frameData = _TestableFrameData("foo", reader)
+        self.assertEqual(frameData[:, 0, 0].tolist(), list(range(10)))
+        # Only the last frames are kept
+        self.assertIs(reader.get_frame(9), reader.get_frame(9))
+        self.assertEqual(reader.get_frame(0)[0, 0], 0)
+
 
 def suite():
     loadTests = unittest.defaultTestLoader.loadTestsFromTestCase
@@ -53,6 +53,8 @@ class TestNumpyFile(unittest.TestCase):
         h5 = rawh5.NumpyFile(filename)
         self.assertIn("data", h5)
         self.assertEqual(h5["data"].dtype.kind, "f")
+        self.assertIsInstance(h5["data"]._get_data(), numpy.memmap)
+        numpy.testing.assert_array_equal(h5["data"][1:3, 2], c[1:3, 2])
 
     def testNumpyZFile(self):
         filename = "%s/%s.npz" % (self.tmpDirectory, self.id())
@@ -85,10 +87,42 @@ class TestNumpyFile(unittest.TestCase):
         self.assertIn("a/b/e", h5)
 
 
+class TestVolFile(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpDirectory = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpDirectory)
+
+    def testVolFile(self):
+        filename = "%s/%s.vol" % (self.tmpDirectory, self.id())
+        volume = numpy.arange(4 * 3 * 2, dtype=numpy.float32).reshape(4, 3, 2)
+        volume.tofile(filename)
+        with open(filename + ".info", "w") as info_file:
+            info_file.write("! PyHST_SLAVE VOLUME INFO FILE\n")
+            info_file.write("NUM_X =  2\nNUM_Y =  3\nNUM_Z =  4\n")
+        h5 = rawh5.VolFile(filename)
+        self.assertEqual(h5["data"].shape, (4, 3, 2))
+        self.assertIsInstance(h5["data"]._get_data(), numpy.memmap)
+        numpy.testing.assert_array_equal(h5["data"][2], volume[2])
+
+    def testMissingShape(self):
+        filename = "%s/%s.vol" % (self.tmpDirectory, self.id())
+        numpy.zeros(10, dtype=numpy.float32).tofile(filename)
+        with open(filename + ".info", "w") as info_file:
+            info_file.write("NUM_X =  2\n")
+        with self.assertRaises(ValueError):
+            rawh5.VolFile(filename)
+
+
 def suite():
     test_suite = unittest.TestSuite()
     loadTests = unittest.defaultTestLoader.loadTestsFromTestCase
     test_suite.addTest(loadTests(TestNumpyFile))
+    test_suite.addTest(loadTests(TestVolFile))
     return test_suite
 
 
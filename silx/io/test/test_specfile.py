@@ -32,6 +32,7 @@ import locale
 import logging
 import numpy
 import os
+import shutil
 import sys
 import tempfile
 import unittest
@@ -308,6 +309,16 @@ class TestSpecFile(unittest.TestCase):
         with self.assertRaises(specfile.SfErrColNotFound):
             self.scan25.data_column_by_name("ygfxgfyxg")
 
+    def test_data_column_by_name_copy(self):
+        col2 = self.scan25.data_column_by_name("col2")
+        # columns are writable copies of the data parsed once
+        self.assertFalse(numpy.shares_memory(col2, self.scan25.data))
+        self.assertTrue(col2.flags.c_contiguous)
+        expected = numpy.array(col2)
+        col2 -= 1.
+        self.assertTrue(numpy.array_equal(
+            self.scan25.data_column_by_name("col2"), expected))
+
     def test_motors(self):
         self.assertEqual(len(self.scan1.motor_names), 6)
         self.assertEqual(len(self.scan1.motor_positions), 6)
@@ -385,6 +396,79 @@ class TestSpecFile(unittest.TestCase):
         self.assertEqual(col1.shape, (0, ))
 
 
+class TestSFIndexCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.fname = os.path.join(cls.tmpdir, "test.dat")
+        with open(cls.fname, "wb") as f:
+            f.write(bytes(sftext, 'ascii'))
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def test_sidecar(self):
+        """Test index stored next to the SPEC file"""
+        reference = SpecFile(self.fname, index_cache=False)
+        keys = reference.keys()
+        reference.close()
+        self.assertFalse(os.path.exists(self.fname + ".sfI"))
+
+        for _ in range(2):  # Create index then reuse it
+            sf = SpecFile(self.fname, index_cache=True)
+            self.assertTrue(os.path.exists(self.fname + ".sfI"))
+            self.assertEqual(sf.keys(), keys)
+            self.assertAlmostEqual(sf[0].data_line(1)[2], 1.56)
+            sf.close()
+        os.unlink(self.fname + ".sfI")
+
+    def test_directory(self):
+        """Test index stored in a cache directory"""
+        cache_dir = os.path.join(self.tmpdir, "cache")
+        sf = SpecFile(self.fname, index_cache=cache_dir)
+        keys = sf.keys()
+        sf.close()
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        sf = SpecFile(self.fname, index_cache=cache_dir)
+        self.assertEqual(sf.keys(), keys)
+        sf.close()
+        shutil.rmtree(cache_dir)
+
+    def test_appended(self):
+        """Test index of a SPEC file appended after the index was written"""
+        fname = os.path.join(self.tmpdir, "appended.dat")
+        with open(fname, "wb") as f:
+            f.write(bytes(sftext, 'ascii'))
+        sf = SpecFile(fname, index_cache=True)
+        self.assertEqual(len(sf), 4)
+        sf.close()
+
+        with open(fname, "ab") as f:
+            f.write(b"\n#S 25 ascan\n#N 2\n#L a  b\n1 2\n3 4\n")
+        sf = SpecFile(fname, index_cache=True)
+        self.assertEqual(len(sf), 5)
+        self.assertEqual(sf.keys()[-1], "25.2")
+        self.assertEqual(sf[4].data.shape, (2, 2))
+        sf.close()
+
+    def test_rewritten(self):
+        """Test index of a SPEC file rewritten after the index was written"""
+        fname = os.path.join(self.tmpdir, "rewritten.dat")
+        with open(fname, "wb") as f:
+            f.write(bytes(sftext, 'ascii'))
+        sf = SpecFile(fname, index_cache=True)
+        self.assertEqual(len(sf), 4)
+        sf.close()
+
+        with open(fname, "wb") as f:
+            f.write(b"#S 1 ascan\n#N 2\n#L a  b\n1 2\n")
+        sf = SpecFile(fname, index_cache=True)
+        self.assertEqual(sf.keys(), ["1.1"])
+        sf.close()
+
+
 class TestSFLocale(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -424,6 +508,8 @@ def suite():
     test_suite = unittest.TestSuite()
     test_suite.addTest(
         unittest.defaultTestLoader.loadTestsFromTestCase(TestSpecFile))
+    test_suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestSFIndexCache))
     test_suite.addTest(
         unittest.defaultTestLoader.loadTestsFromTestCase(TestSFLocale))
     return test_suite
@@ -22,6 +22,7 @@
 #
 # ############################################################################*/
 """Tests for spech5"""
+import numpy
 from numpy import array_equal
 import os
 import io
@@ -265,6 +266,18 @@ class TestSpecH5(unittest.TestCase):
                 sum(self.sfh5["1.1"]["measurement"]["MRTSlit UP"]),
                 87.891, places=4)
 
+    def testDataColumnsShareBuffer(self):
+        measurement = self.sfh5["/1.2/measurement"]
+        uno = measurement["uno"][()]
+        duo = measurement["duo"][()]
+        self.assertEqual(uno.dtype, numpy.float32)
+        self.assertIs(uno.base, duo.base)
+
+        # Columns can be modified in place independently
+        expected = numpy.array(duo)
+        uno -= 1.
+        self.assertTrue(array_equal(measurement["duo"][()], expected))
+
     def testDate(self):
         # start time is in Iso8601 format
         self.assertEqual(self.sfh5["/1.1/start_time"],
@@ -862,6 +875,44 @@ class TestSpecH5SlashInLabels(unittest.TestCase):
                       self.sfh5["1.1/instrument/positioners"])
 
 
+sftext_update_scan = """#S 3 aaaaaa
+#N 2
+#L x  y
+1 2
+3 4
+"""
+
+
+class TestSpecH5Update(unittest.TestCase):
+    """Test exposing scans appended to a SPEC file after it was opened"""
+    def setUp(self):
+        fd, self.fname = tempfile.mkstemp()
+        if sys.version_info < (3, ):
+            os.write(fd, sftext)
+        else:
+            os.write(fd, bytes(sftext, 'ascii'))
+        os.close(fd)
+        self.sfh5 = SpecH5(self.fname)
+
+    def tearDown(self):
+        self.sfh5.close()
+        os.unlink(self.fname)
+
+    def testUnchanged(self):
+        self.assertEqual(self.sfh5.update(), [])
+
+    def testAppendScan(self):
+        keys = list(self.sfh5.keys())
+        with open(self.fname, "a") as f:
+            f.write("\n" + sftext_update_scan)
+
+        updated = self.sfh5.update()
+        self.assertEqual(updated, [keys[-1], "3.1"])
+        self.assertEqual(list(self.sfh5.keys()), keys + ["3.1"])
+        self.assertEqual(list(self.sfh5["3.1/measurement/y"]), [2, 4])
+        self.assertEqual(self.sfh5.update(), [])
+
+
 def suite():
     test_suite = unittest.TestSuite()
     test_suite.addTest(
@@ -874,6 +925,8 @@ def suite():
         unittest.defaultTestLoader.loadTestsFromTestCase(TestSpecH5NoDataCols))
     test_suite.addTest(
         unittest.defaultTestLoader.loadTestsFromTestCase(TestSpecH5SlashInLabels))
+    test_suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestSpecH5Update))
     return test_suite
 
 
@@ -183,10 +183,22 @@ class TestConvertSpecHDF5(unittest.TestCase):
         )
 
 
+class TestConvertSpecHDF5Workers(TestConvertSpecHDF5):
+    """Same tests with SPEC scans parsed by worker processes"""
+
+    def setUp(self):
+        convert(self.spec_fname, self.h5_fname, workers=2)
+
+        self.sfh5 = SpecH5(self.spec_fname)
+        self.h5f = h5py.File(self.h5_fname, "a")
+
+
 def suite():
     test_suite = unittest.TestSuite()
     test_suite.addTest(
         unittest.defaultTestLoader.loadTestsFromTestCase(TestConvertSpecHDF5))
+    test_suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestConvertSpecHDF5Workers))
     return test_suite
 
 
@@ -462,6 +462,7 @@ def _open_local_file(filename):
     - SPEC files exposed as a NeXus layout
     - raster files exposed as a NeXus layout (if `fabio` is installed)
     - Numpy files ('npy' and 'npz' files)
+    - PyHST volumes ('vol' files with a 'vol.info' file)
 
     The file is opened in read-only mode.
 
@@ -484,6 +485,14 @@ def _open_local_file(filename):
                 debugging_info.append((sys.exc_info(),
                                       "File '%s' can't be read as a numpy file." % filename))
 
+        if extension == ".vol" and os.path.isfile(filename + ".info"):
+            try:
+                from . import rawh5
+                return rawh5.VolFile(filename)
+            except (IOError, ValueError) as e:
+                debugging_info.append((sys.exc_info(),
+                                      "File '%s' can't be read as a vol file." % filename))
+
         if h5py.is_hdf5(filename):
             try:
                 return h5py.File(filename, "r")
@@ -932,28 +941,8 @@ def vol_to_h5_external_dataset(vol_file, output_url, info_file=None,
                          'specify .vol.info file' % _info_file)
             return
 
-    def info_file_to_dict():
-        ddict = {}
-        with builtin_open(info_file, "r") as _file:
-            lines = _file.readlines()
-            for line in lines:
-                if not '=' in line:
-                    continue
-                l = line.rstrip().replace(' ', '')
-                l = l.split('#')[0]
-                key, value = l.split('=')
-                ddict[key.lower()] = value
-        return ddict
-
-    ddict = info_file_to_dict()
-    if 'num_x' not in ddict or 'num_y' not in ddict or 'num_z' not in ddict:
-        raise ValueError(
-            'Unable to retrieve volume shape from %s' % info_file)
-
-    dimX = int(ddict['num_x'])
-    dimY = int(ddict['num_y'])
-    dimZ = int(ddict['num_z'])
-    shape = (dimZ, dimY, dimX)
+    from .rawh5 import read_vol_shape
+    shape = read_vol_shape(_info_file)
 
     return rawfile_to_h5_external_dataset(bin_file=vol_file,
                                           output_url=output_url,
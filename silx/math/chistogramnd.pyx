@@ -28,6 +28,7 @@ __date__ = "02/10/2017"
 
 cimport numpy as cnumpy  # noqa
 cimport cython
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 cimport silx.math.histogramnd_c as histogramnd_c
@@ -42,7 +43,8 @@ def chistogramnd(sample,
                  last_bin_closed=False,
                  histo=None,
                  weighted_histo=None,
-                 wh_dtype=None):
+                 wh_dtype=None,
+                 n_threads=None):
     """Computes the multidimensional histogram of some data.
 
     :param sample:
@@ -144,6 +146,14 @@ def chistogramnd(sample,
         *weights*. Allowed values are : `numpu.double` and `numpy.float32`.
     :type wh_dtype: *optional*, numpy data type
 
+    :param n_threads: Number of threads to use. The sample is split into
+        contiguous chunks, each binned into a private histogram by its own
+        thread, and the histograms are summed at the end.
+        Bin counts are the same as with a single thread, weighted
+        histograms may differ by rounding errors.
+        Default: None, a single thread is used.
+    :type n_threads: *optional*, int
+
     :return: Histogram (bin counts, always returned), weighted histogram of
         the sample (or *None* if weights is *None*) and bin edges for each
         dimension.
@@ -270,6 +280,22 @@ def chistogramnd(sample,
                                        np.float32,
                                        weighted_histo.dtype))
 
+    n_elem = sample.size // n_dims
+
+    if n_threads is not None and n_threads > 1:
+        n_threads = min(n_threads, n_elem // _MIN_ELEMENTS_PER_THREAD)
+        if n_threads > 1:
+            return _chistogramnd_threaded(sample,
+                                          histo_range,
+                                          n_bins,
+                                          weights,
+                                          weight_min,
+                                          weight_max,
+                                          last_bin_closed,
+                                          histo,
+                                          weighted_histo,
+                                          n_threads)
+
     option_flags = 0
 
     if weight_min is not None:
@@ -288,8 +314,6 @@ def chistogramnd(sample,
     sample_type = sample.dtype
     sample_type = sample_type.newbyteorder('N')
 
-    n_elem = sample.size // n_dims
-
     bin_edges = np.zeros(n_bins.sum() + n_bins.size, dtype=np.double)
 
     # wanted to store the functions in a dict (with the supported types
@@ -663,6 +687,59 @@ def chistogramnd(sample,
 
     return histo, weighted_histo, tuple(edges)
 
+
+_MIN_ELEMENTS_PER_THREAD = 100000
+"""Minimum number of sample elements processed by each thread"""
+
+
+def _chistogramnd_threaded(sample,
+                           histo_range,
+                           n_bins,
+                           weights,
+                           weight_min,
+                           weight_max,
+                           last_bin_closed,
+                           histo,
+                           weighted_histo,
+                           n_threads):
+    """Multi-threaded :func:`chistogramnd` implementation.
+
+    The first chunk is accumulated directly in *histo* and *weighted_histo*,
+    other chunks are accumulated in private histograms which are then summed.
+    """
+    n_elem = sample.shape[0]
+    chunk_size = (n_elem + n_threads - 1) // n_threads
+
+    histos = [histo] + [np.zeros_like(histo) for _ in range(n_threads - 1)]
+    if weighted_histo is None:
+        weighted_histos = [None] * n_threads
+    else:
+        weighted_histos = [weighted_histo] + [
+            np.zeros_like(weighted_histo) for _ in range(n_threads - 1)]
+
+    def compute(index):
+        start = index * chunk_size
+        end = min(n_elem, start + chunk_size)
+        return chistogramnd(sample[start:end],
+                            histo_range,
+                            n_bins,
+                            weights=None if weights is None else weights[start:end],
+                            weight_min=weight_min,
+                            weight_max=weight_max,
+                            last_bin_closed=last_bin_closed,
+                            histo=histos[index],
+                            weighted_histo=weighted_histos[index])
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        results = list(executor.map(compute, range(n_threads)))
+
+    for index in range(1, n_threads):
+        histo += histos[index]
+        if weighted_histo is not None:
+            weighted_histo += weighted_histos[index]
+
+    return results[0]
+
 # =====================
 #  double sample, double cumul
 # =====================
@@ -683,20 +760,23 @@ cdef int _histogramnd_double_double_double(double[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            double weight_min,
-                                           double weight_max) nogil:
+                                           double weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_double_double_double(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_double_double_double(&sample[0],
+                                                            &weights[0],
+                                                            n_dims,
+                                                            n_elem,
+                                                            &histo_range[0],
+                                                            &n_bins[0],
+                                                            &histo[0],
+                                                            &cumul[0],
+                                                            &bin_edges[0],
+                                                            option_flags,
+                                                            weight_min,
+                                                            weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -714,20 +794,23 @@ cdef int _histogramnd_double_float_double(double[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           float weight_min,
-                                          float weight_max) nogil:
+                                          float weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_double_float_double(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_double_float_double(&sample[0],
+                                                           &weights[0],
+                                                           n_dims,
+                                                           n_elem,
+                                                           &histo_range[0],
+                                                           &n_bins[0],
+                                                           &histo[0],
+                                                           &cumul[0],
+                                                           &bin_edges[0],
+                                                           option_flags,
+                                                           weight_min,
+                                                           weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -745,20 +828,23 @@ cdef int _histogramnd_double_int32_t_double(double[:] sample,
                                             double[:] bin_edges,
                                             int option_flags,
                                             cnumpy.int32_t weight_min,
-                                            cnumpy.int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_double_int32_t_double(&sample[0],
-                                                           &weights[0],
-                                                           n_dims,
-                                                           n_elem,
-                                                           &histo_range[0],
-                                                           &n_bins[0],
-                                                           &histo[0],
-                                                           &cumul[0],
-                                                           &bin_edges[0],
-                                                           option_flags,
-                                                           weight_min,
-                                                           weight_max)
+                                            cnumpy.int32_t weight_max):
+    cdef int rc
+
+    with nogil:
+        rc = histogramnd_c.histogramnd_double_int32_t_double(&sample[0],
+                                                             &weights[0],
+                                                             n_dims,
+                                                             n_elem,
+                                                             &histo_range[0],
+                                                             &n_bins[0],
+                                                             &histo[0],
+                                                             &cumul[0],
+                                                             &bin_edges[0],
+                                                             option_flags,
+                                                             weight_min,
+                                                             weight_max)
+    return rc
 
 
 # =====================
@@ -781,20 +867,23 @@ cdef int _histogramnd_float_double_double(float[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           double weight_min,
-                                          double weight_max) nogil:
+                                          double weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_float_double_double(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_float_double_double(&sample[0],
+                                                           &weights[0],
+                                                           n_dims,
+                                                           n_elem,
+                                                           &histo_range[0],
+                                                           &n_bins[0],
+                                                           &histo[0],
+                                                           &cumul[0],
+                                                           &bin_edges[0],
+                                                           option_flags,
+                                                           weight_min,
+                                                           weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -812,20 +901,23 @@ cdef int _histogramnd_float_float_double(float[:] sample,
                                          double[:] bin_edges,
                                          int option_flags,
                                          float weight_min,
-                                         float weight_max) nogil:
+                                         float weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_float_float_double(&sample[0],
-                                                        &weights[0],
-                                                        n_dims,
-                                                        n_elem,
-                                                        &histo_range[0],
-                                                        &n_bins[0],
-                                                        &histo[0],
-                                                        &cumul[0],
-                                                        &bin_edges[0],
-                                                        option_flags,
-                                                        weight_min,
-                                                        weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_float_float_double(&sample[0],
+                                                          &weights[0],
+                                                          n_dims,
+                                                          n_elem,
+                                                          &histo_range[0],
+                                                          &n_bins[0],
+                                                          &histo[0],
+                                                          &cumul[0],
+                                                          &bin_edges[0],
+                                                          option_flags,
+                                                          weight_min,
+                                                          weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -843,20 +935,23 @@ cdef int _histogramnd_float_int32_t_double(float[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            cnumpy.int32_t weight_min,
-                                           cnumpy.int32_t weight_max) nogil:
+                                           cnumpy.int32_t weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_float_int32_t_double(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_float_int32_t_double(&sample[0],
+                                                            &weights[0],
+                                                            n_dims,
+                                                            n_elem,
+                                                            &histo_range[0],
+                                                            &n_bins[0],
+                                                            &histo[0],
+                                                            &cumul[0],
+                                                            &bin_edges[0],
+                                                            option_flags,
+                                                            weight_min,
+                                                            weight_max)
+    return rc
 
 
 # =====================
@@ -879,20 +974,23 @@ cdef int _histogramnd_int32_t_double_double(cnumpy.int32_t[:] sample,
                                             double[:] bin_edges,
                                             int option_flags,
                                             double weight_min,
-                                            double weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_double_double(&sample[0],
-                                                           &weights[0],
-                                                           n_dims,
-                                                           n_elem,
-                                                           &histo_range[0],
-                                                           &n_bins[0],
-                                                           &histo[0],
-                                                           &cumul[0],
-                                                           &bin_edges[0],
-                                                           option_flags,
-                                                           weight_min,
-                                                           weight_max)
+                                            double weight_max):
+    cdef int rc
+
+    with nogil:
+        rc = histogramnd_c.histogramnd_int32_t_double_double(&sample[0],
+                                                             &weights[0],
+                                                             n_dims,
+                                                             n_elem,
+                                                             &histo_range[0],
+                                                             &n_bins[0],
+                                                             &histo[0],
+                                                             &cumul[0],
+                                                             &bin_edges[0],
+                                                             option_flags,
+                                                             weight_min,
+                                                             weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -910,20 +1008,23 @@ cdef int _histogramnd_int32_t_float_double(cnumpy.int32_t[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            float weight_min,
-                                           float weight_max) nogil:
+                                           float weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_int32_t_float_double(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_int32_t_float_double(&sample[0],
+                                                            &weights[0],
+                                                            n_dims,
+                                                            n_elem,
+                                                            &histo_range[0],
+                                                            &n_bins[0],
+                                                            &histo[0],
+                                                            &cumul[0],
+                                                            &bin_edges[0],
+                                                            option_flags,
+                                                            weight_min,
+                                                            weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -941,20 +1042,23 @@ cdef int _histogramnd_int32_t_int32_t_double(cnumpy.int32_t[:] sample,
                                              double[:] bin_edges,
                                              int option_flags,
                                              cnumpy.int32_t weight_min,
-                                             cnumpy.int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_int32_t_double(&sample[0],
-                                                            &weights[0],
-                                                            n_dims,
-                                                            n_elem,
-                                                            &histo_range[0],
-                                                            &n_bins[0],
-                                                            &histo[0],
-                                                            &cumul[0],
-                                                            &bin_edges[0],
-                                                            option_flags,
-                                                            weight_min,
-                                                            weight_max)
+                                             cnumpy.int32_t weight_max):
+    cdef int rc
+
+    with nogil:
+        rc = histogramnd_c.histogramnd_int32_t_int32_t_double(&sample[0],
+                                                              &weights[0],
+                                                              n_dims,
+                                                              n_elem,
+                                                              &histo_range[0],
+                                                              &n_bins[0],
+                                                              &histo[0],
+                                                              &cumul[0],
+                                                              &bin_edges[0],
+                                                              option_flags,
+                                                              weight_min,
+                                                              weight_max)
+    return rc
 
 
 # =====================
@@ -977,20 +1081,23 @@ cdef int _histogramnd_double_double_float(double[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           double weight_min,
-                                          double weight_max) nogil:
+                                          double weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_double_double_float(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_double_double_float(&sample[0],
+                                                           &weights[0],
+                                                           n_dims,
+                                                           n_elem,
+                                                           &histo_range[0],
+                                                           &n_bins[0],
+                                                           &histo[0],
+                                                           &cumul[0],
+                                                           &bin_edges[0],
+                                                           option_flags,
+                                                           weight_min,
+                                                           weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -1008,20 +1115,23 @@ cdef int _histogramnd_double_float_float(double[:] sample,
                                          double[:] bin_edges,
                                          int option_flags,
                                          float weight_min,
-                                         float weight_max) nogil:
+                                         float weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_double_float_float(&sample[0],
-                                                        &weights[0],
-                                                        n_dims,
-                                                        n_elem,
-                                                        &histo_range[0],
-                                                        &n_bins[0],
-                                                        &histo[0],
-                                                        &cumul[0],
-                                                        &bin_edges[0],
-                                                        option_flags,
-                                                        weight_min,
-                                                        weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_double_float_float(&sample[0],
+                                                          &weights[0],
+                                                          n_dims,
+                                                          n_elem,
+                                                          &histo_range[0],
+                                                          &n_bins[0],
+                                                          &histo[0],
+                                                          &cumul[0],
+                                                          &bin_edges[0],
+                                                          option_flags,
+                                                          weight_min,
+                                                          weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -1039,20 +1149,23 @@ cdef int _histogramnd_double_int32_t_float(double[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            cnumpy.int32_t weight_min,
-                                           cnumpy.int32_t weight_max) nogil:
+                                           cnumpy.int32_t weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_double_int32_t_float(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_double_int32_t_float(&sample[0],
+                                                            &weights[0],
+                                                            n_dims,
+                                                            n_elem,
+                                                            &histo_range[0],
+                                                            &n_bins[0],
+                                                            &histo[0],
+                                                            &cumul[0],
+                                                            &bin_edges[0],
+                                                            option_flags,
+                                                            weight_min,
+                                                            weight_max)
+    return rc
 
 
 # =====================
@@ -1075,20 +1188,23 @@ cdef int _histogramnd_float_double_float(float[:] sample,
                                          double[:] bin_edges,
                                          int option_flags,
                                          double weight_min,
-                                         double weight_max) nogil:
+                                         double weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_float_double_float(&sample[0],
-                                                        &weights[0],
-                                                        n_dims,
-                                                        n_elem,
-                                                        &histo_range[0],
-                                                        &n_bins[0],
-                                                        &histo[0],
-                                                        &cumul[0],
-                                                        &bin_edges[0],
-                                                        option_flags,
-                                                        weight_min,
-                                                        weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_float_double_float(&sample[0],
+                                                          &weights[0],
+                                                          n_dims,
+                                                          n_elem,
+                                                          &histo_range[0],
+                                                          &n_bins[0],
+                                                          &histo[0],
+                                                          &cumul[0],
+                                                          &bin_edges[0],
+                                                          option_flags,
+                                                          weight_min,
+                                                          weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -1106,20 +1222,23 @@ cdef int _histogramnd_float_float_float(float[:] sample,
                                         double[:] bin_edges,
                                         int option_flags,
                                         float weight_min,
-                                        float weight_max) nogil:
+                                        float weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_float_float_float(&sample[0],
-                                                       &weights[0],
-                                                       n_dims,
-                                                       n_elem,
-                                                       &histo_range[0],
-                                                       &n_bins[0],
-                                                       &histo[0],
-                                                       &cumul[0],
-                                                       &bin_edges[0],
-                                                       option_flags,
-                                                       weight_min,
-                                                       weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_float_float_float(&sample[0],
+                                                         &weights[0],
+                                                         n_dims,
+                                                         n_elem,
+                                                         &histo_range[0],
+                                                         &n_bins[0],
+                                                         &histo[0],
+                                                         &cumul[0],
+                                                         &bin_edges[0],
+                                                         option_flags,
+                                                         weight_min,
+                                                         weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -1137,20 +1256,23 @@ cdef int _histogramnd_float_int32_t_float(float[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           cnumpy.int32_t weight_min,
-                                          cnumpy.int32_t weight_max) nogil:
+                                          cnumpy.int32_t weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_float_int32_t_float(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_float_int32_t_float(&sample[0],
+                                                           &weights[0],
+                                                           n_dims,
+                                                           n_elem,
+                                                           &histo_range[0],
+                                                           &n_bins[0],
+                                                           &histo[0],
+                                                           &cumul[0],
+                                                           &bin_edges[0],
+                                                           option_flags,
+                                                           weight_min,
+                                                           weight_max)
+    return rc
 
 
 # =====================
@@ -1173,20 +1295,23 @@ cdef int _histogramnd_int32_t_double_float(cnumpy.int32_t[:] sample,
                                            double[:] bin_edges,
                                            int option_flags,
                                            double weight_min,
-                                           double weight_max) nogil:
+                                           double weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_int32_t_double_float(&sample[0],
-                                                          &weights[0],
-                                                          n_dims,
-                                                          n_elem,
-                                                          &histo_range[0],
-                                                          &n_bins[0],
-                                                          &histo[0],
-                                                          &cumul[0],
-                                                          &bin_edges[0],
-                                                          option_flags,
-                                                          weight_min,
-                                                          weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_int32_t_double_float(&sample[0],
+                                                            &weights[0],
+                                                            n_dims,
+                                                            n_elem,
+                                                            &histo_range[0],
+                                                            &n_bins[0],
+                                                            &histo[0],
+                                                            &cumul[0],
+                                                            &bin_edges[0],
+                                                            option_flags,
+                                                            weight_min,
+                                                            weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -1204,20 +1329,23 @@ cdef int _histogramnd_int32_t_float_float(cnumpy.int32_t[:] sample,
                                           double[:] bin_edges,
                                           int option_flags,
                                           float weight_min,
-                                          float weight_max) nogil:
+                                          float weight_max):
+    cdef int rc
 
-    return histogramnd_c.histogramnd_int32_t_float_float(&sample[0],
-                                                         &weights[0],
-                                                         n_dims,
-                                                         n_elem,
-                                                         &histo_range[0],
-                                                         &n_bins[0],
-                                                         &histo[0],
-                                                         &cumul[0],
-                                                         &bin_edges[0],
-                                                         option_flags,
-                                                         weight_min,
-                                                         weight_max)
+    with nogil:
+        rc = histogramnd_c.histogramnd_int32_t_float_float(&sample[0],
+                                                           &weights[0],
+                                                           n_dims,
+                                                           n_elem,
+                                                           &histo_range[0],
+                                                           &n_bins[0],
+                                                           &histo[0],
+                                                           &cumul[0],
+                                                           &bin_edges[0],
+                                                           option_flags,
+                                                           weight_min,
+                                                           weight_max)
+    return rc
 
 
 @cython.wraparound(False)
@@ -1235,17 +1363,20 @@ cdef int _histogramnd_int32_t_int32_t_float(cnumpy.int32_t[:] sample,
                                             double[:] bin_edges,
                                             int option_flags,
                                             cnumpy.int32_t weight_min,
-                                            cnumpy.int32_t weight_max) nogil:
-
-    return histogramnd_c.histogramnd_int32_t_int32_t_float(&sample[0],
-                                                           &weights[0],
-                                                           n_dims,
-                                                           n_elem,
-                                                           &histo_range[0],
-                                                           &n_bins[0],
-                                                           &histo[0],
-                                                           &cumul[0],
-                                                           &bin_edges[0],
-                                                           option_flags,
-                                                           weight_min,
-                                                           weight_max)
+                                            cnumpy.int32_t weight_max):
+    cdef int rc
+
+    with nogil:
+        rc = histogramnd_c.histogramnd_int32_t_int32_t_float(&sample[0],
+                                                             &weights[0],
+                                                             n_dims,
+                                                             n_elem,
+                                                             &histo_range[0],
+                                                             &n_bins[0],
+                                                             &histo[0],
+                                                             &cumul[0],
+                                                             &bin_edges[0],
+                                                             option_flags,
+                                                             weight_min,
+                                                             weight_max)
+    return rc
@@ -29,6 +29,7 @@ __date__ = "15/05/2016"
 
 cimport numpy as cnumpy  # noqa
 cimport cython
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 ctypedef fused sample_t:
@@ -215,9 +216,14 @@ def histogramnd_from_lut(weights,
                          shape=None,
                          dtype=None,
                          weight_min=None,
-                         weight_max=None):
+                         weight_max=None,
+                         n_threads=None):
     """
     dtype ignored if weighted_histo provided
+
+    If n_threads is greater than 1, the weights are split into contiguous
+    chunks accumulated in parallel into private histograms which are summed
+    at the end. Default: None, a single thread is used.
     """
 
     if histo is None and weighted_histo is None:
@@ -275,6 +281,17 @@ def histogramnd_from_lut(weights,
         raise ValueError('The LUT and weights arrays must have the same '
                          'number of elements.')
 
+    if n_threads is not None and n_threads > 1:
+        n_threads = min(n_threads, weights.size // _MIN_ELEMENTS_PER_THREAD)
+        if n_threads > 1:
+            return _histogramnd_from_lut_threaded(weights,
+                                                  histo_lut,
+                                                  histo,
+                                                  weighted_histo,
+                                                  weight_min,
+                                                  weight_max,
+                                                  n_threads)
+
     w_c = np.ascontiguousarray(weights.reshape((weights.size,)),
                                dtype=weights.dtype.newbyteorder('N'))
 
@@ -320,6 +337,50 @@ def histogramnd_from_lut(weights,
     return histo, weighted_histo
 
 
+_MIN_ELEMENTS_PER_THREAD = 100000
+"""Minimum number of weights processed by each thread"""
+
+
+def _histogramnd_from_lut_threaded(weights,
+                                   histo_lut,
+                                   histo,
+                                   weighted_histo,
+                                   weight_min,
+                                   weight_max,
+                                   n_threads):
+    """Multi-threaded :func:`histogramnd_from_lut` implementation.
+
+    The first chunk is accumulated directly in *histo* and *weighted_histo*,
+    other chunks are accumulated in private histograms which are then summed.
+    """
+    weights = weights.reshape((weights.size,))
+    histo_lut = histo_lut.reshape((histo_lut.size,))
+    chunk_size = (weights.size + n_threads - 1) // n_threads
+
+    histos = [histo] + [np.zeros_like(histo) for _ in range(n_threads - 1)]
+    weighted_histos = [weighted_histo] + [
+        np.zeros_like(weighted_histo) for _ in range(n_threads - 1)]
+
+    def compute(index):
+        start = index * chunk_size
+        end = min(weights.size, start + chunk_size)
+        histogramnd_from_lut(weights[start:end],
+                             histo_lut[start:end],
+                             histo=histos[index],
+                             weighted_histo=weighted_histos[index],
+                             weight_min=weight_min,
+                             weight_max=weight_max)
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        list(executor.map(compute, range(n_threads)))
+
+    for index in range(1, n_threads):
+        histo += histos[index]
+        weighted_histo += weighted_histos[index]
+
+    return histo, weighted_histo
+
+
 # =====================
 # =====================
 
@@ -24,8 +24,10 @@
 # ###########################################################################*/
 """This module provides combination of statistics as single operation.
 
-For now it provides min/max (and optionally positive min) and indices
-of first occurrences (i.e., argmin/argmax) in a single pass.
+It provides min/max (and optionally positive min) and indices
+of first occurrences (i.e., argmin/argmax) in a single pass with
+:func:`min_max`, and count, sum, sum of squares, min/max and
+argmin/argmax in a single multi-threaded pass with :func:`statistics`.
 """
 
 __authors__ = ["T. Vincent"]
@@ -33,12 +35,29 @@ __license__ = "MIT"
 __date__ = "24/04/2018"
 
 cimport cython
+from cython.parallel import prange
 from .math_compatibility cimport isnan, isfinite, INFINITY
 
 
+import math
+import os
+
 import numpy
 
 
+cdef int DEFAULT_NUM_THREADS
+if hasattr(os, 'sched_getaffinity'):
+    DEFAULT_NUM_THREADS = min(4, len(os.sched_getaffinity(0)))
+elif os.cpu_count() is not None:
+    DEFAULT_NUM_THREADS = min(4, os.cpu_count())
+else:  # Fallback
+    DEFAULT_NUM_THREADS = 1
+# Number of threads to use for the computation (initialized to up to 4)
+
+cdef int USE_OPENMP_THRESHOLD = 100000
+"""OpenMP is not used for arrays with less elements than this threshold"""
+
+
 # All supported types
 ctypedef fused _number:
     float
@@ -327,3 +346,304 @@ def min_max(data not None, bint min_positive=False, bint finite=False):
         return _finite_min_max(data, min_positive)
     else:
         return _min_max(data, min_positive)
+
+
+class _StatisticsResult(object):
+    """Object storing result from :func:`statistics`"""
+
+    def __init__(self, count, nan_count, shift, shifted_sum,
+                 shifted_sum_of_squares, weights_sum,
+                 minimum, maximum, argmin, argmax):
+        self._count = count
+        self._nan_count = nan_count
+        # Sums are computed on values - shift for accuracy of variance
+        self._shift = shift
+        self._shifted_sum = shifted_sum
+        self._shifted_sum_of_squares = shifted_sum_of_squares
+        self._weights_sum = weights_sum
+        self._minimum = minimum
+        self._maximum = maximum
+        self._argmin = argmin
+        self._argmax = argmax
+
+    count = property(
+        lambda self: self._count,
+        doc="Number of values taken into account (i.e., not NaN nor masked)")
+    nan_count = property(
+        lambda self: self._nan_count,
+        doc="Number of NaN values which are not masked")
+    sum = property(
+        lambda self: (self._shifted_sum +
+                      self._shift * self._weights_sum),
+        doc="(Weighted) sum of values")
+    sum_of_squares = property(
+        lambda self: (self._shifted_sum_of_squares +
+                      2. * self._shift * self._shifted_sum +
+                      self._shift * self._shift * self._weights_sum),
+        doc="(Weighted) sum of squared values")
+    weights_sum = property(
+        lambda self: self._weights_sum,
+        doc="Sum of weights (equals count if no weights were provided)")
+
+    minimum = property(
+        lambda self: self._minimum,
+        doc="Minimum value or None if no value is taken into account")
+    maximum = property(
+        lambda self: self._maximum,
+        doc="Maximum value or None if no value is taken into account")
+    argmin = property(
+        lambda self: self._argmin,
+        doc="Index of the first occurrence of the minimum value or None")
+    argmax = property(
+        lambda self: self._argmax,
+        doc="Index of the first occurrence of the maximum value or None")
+
+    @property
+    def mean(self):
+        """(Weighted) mean of values or NaN if no value is taken into account
+        """
+        if self._weights_sum == 0:
+            return float('nan')
+        return self._shift + self._shifted_sum / self._weights_sum
+
+    @property
+    def variance(self):
+        """(Weighted) population variance of values or NaN"""
+        if self._weights_sum == 0:
+            return float('nan')
+        shifted_mean = self._shifted_sum / self._weights_sum
+        return max(0., (self._shifted_sum_of_squares / self._weights_sum -
+                        shifted_mean * shifted_mean))
+
+    @property
+    def std(self):
+        """(Weighted) population standard deviation of values or NaN"""
+        return math.sqrt(self.variance)
+
+
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef void _chunk_statistics(_number[::1] data,
+                            unsigned char[::1] mask,
+                            bint use_mask,
+                            double[::1] weights,
+                            bint use_weights,
+                            double shift,
+                            Py_ssize_t start,
+                            Py_ssize_t end,
+                            long long[::1] counts,
+                            double[::1] sums,
+                            Py_ssize_t[::1] indices) nogil:
+    """Compute statistics of data[start:end].
+
+    Sums of (value - shift) use Kahan compensated summation.
+
+    :param counts: Array where to store (count, NaN count)
+    :param sums: Array where to store (sum, sum compensation,
+        sum of squares, sum of squares compensation,
+        weights sum, weights sum compensation)
+    :param indices: Array where to store (argmin, argmax), -1 if no values
+    """
+    cdef:
+        Py_ssize_t index
+        Py_ssize_t argmin = -1
+        Py_ssize_t argmax = -1
+        long long count = 0
+        long long nan_count = 0
+        double value, weight, term, corrected, total
+        double sum_ = 0., sum_comp = 0.
+        double sum_sq = 0., sum_sq_comp = 0.
+        double weights_sum = 0., weights_sum_comp = 0.
+
+    for index in range(start, end):
+        if use_mask and mask[index] != 0:
+            continue
+
+        if _number in _floating:
+            if isnan(<double> data[index]):
+                nan_count = nan_count + 1
+                continue
+
+        value = <double> data[index] - shift
+        count = count + 1
+
+        if argmin == -1:
+            argmin = index
+            argmax = index
+        elif data[index] < data[argmin]:
+            argmin = index
+        elif data[index] > data[argmax]:
+            argmax = index
+
+        if use_weights:
+            weight = weights[index]
+            corrected = weight - weights_sum_comp
+            total = weights_sum + corrected
+            weights_sum_comp = (((total - weights_sum) - corrected)
+                                if isfinite(total) else 0.)
+            weights_sum = total
+        else:
+            weight = 1.
+
+        term = weight * value
+        corrected = term - sum_comp
+        total = sum_ + corrected
+        sum_comp = ((total - sum_) - corrected) if isfinite(total) else 0.
+        sum_ = total
+
+        term = term * value
+        corrected = term - sum_sq_comp
+        total = sum_sq + corrected
+        sum_sq_comp = ((total - sum_sq) - corrected) if isfinite(total) else 0.
+        sum_sq = total
+
+    counts[0] = count
+    counts[1] = nan_count
+    sums[0] = sum_
+    sums[1] = sum_comp
+    sums[2] = sum_sq
+    sums[3] = sum_sq_comp
+    sums[4] = weights_sum if use_weights else <double> count
+    sums[5] = weights_sum_comp
+    indices[0] = argmin
+    indices[1] = argmax
+
+
+@cython.initializedcheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _statistics(_number[::1] data,
+                unsigned char[::1] mask,
+                double[::1] weights,
+                int num_threads):
+    """:func:`statistics` implementation
+
+    See :func:`statistics` for documentation.
+    """
+    cdef:
+        Py_ssize_t length = data.shape[0]
+        Py_ssize_t chunk_size, index
+        int chunk, nb_chunks
+        bint use_mask = mask is not None
+        bint use_weights = weights is not None
+        double shift = 0.
+        long long[:, ::1] counts
+        double[:, ::1] sums
+        Py_ssize_t[:, ::1] indices
+
+    nb_chunks = max(1, num_threads)
+    chunk_size = (length + nb_chunks - 1) // nb_chunks
+
+    counts = numpy.zeros((nb_chunks, 2), dtype=numpy.int64)
+    sums = numpy.zeros((nb_chunks, 6), dtype=numpy.float64)
+    indices = numpy.full((nb_chunks, 2), -1, dtype=numpy.intp)
+
+    with nogil:
+        # Use first finite value as shift to avoid loss of precision
+        for index in range(length):
+            if use_mask and mask[index] != 0:
+                continue
+            if _number in _floating:
+                if not isfinite(<double> data[index]):
+                    continue
+            shift = <double> data[index]
+            break
+
+        for chunk in prange(nb_chunks, num_threads=nb_chunks,
+                            schedule='static', chunksize=1):
+            _chunk_statistics(
+                data, mask, use_mask, weights, use_weights, shift,
+                min(length, chunk * chunk_size),
+                min(length, (chunk + 1) * chunk_size),
+                counts[chunk], sums[chunk], indices[chunk])
+
+    # Merge results of chunks
+    cdef Py_ssize_t argmin = -1, argmax = -1
+    for chunk in range(nb_chunks):
+        index = indices[chunk, 0]
+        if index != -1 and (argmin == -1 or data[index] < data[argmin]):
+            argmin = index
+        index = indices[chunk, 1]
+        if index != -1 and (argmax == -1 or data[index] > data[argmax]):
+            argmax = index
+
+    sums_array = numpy.asarray(sums)
+    return _StatisticsResult(
+        count=int(numpy.sum(counts[:, 0])),
+        nan_count=int(numpy.sum(counts[:, 1])),
+        shift=shift,
+        shifted_sum=math.fsum(sums_array[:, 0]) - math.fsum(sums_array[:, 1]),
+        shifted_sum_of_squares=(math.fsum(sums_array[:, 2]) -
+                                math.fsum(sums_array[:, 3])),
+        weights_sum=(math.fsum(sums_array[:, 4]) -
+                     math.fsum(sums_array[:, 5])),
+        minimum=None if argmin == -1 else data[argmin],
+        maximum=None if argmax == -1 else data[argmax],
+        argmin=None if argmin == -1 else argmin,
+        argmax=None if argmax == -1 else argmax)
+
+
+def statistics(data not None, mask=None, weights=None):
+    """Returns count, sum, sum of squares and min/max of data in a single pass.
+
+    It also computes the indices of first occurrence of min/max.
+
+    NaNs and masked values are ignored. Sums are computed in double precision
+    with compensated summation. For large arrays, the computation is
+    performed in parallel using OpenMP.
+
+    Examples:
+
+    >>> import numpy
+    >>> result = statistics(numpy.arange(10))
+    >>> result.count, result.sum, result.mean
+    (10, 45.0, 4.5)
+    >>> result.minimum, result.argmin, result.maximum, result.argmax
+    (0, 0, 9, 9)
+
+    Computing the center of mass of a profile:
+
+    >>> profile = numpy.array((0., 1., 2., 1., 0.))
+    >>> statistics(numpy.arange(len(profile)), weights=profile).mean
+    2.0
+
+    :param data: Array-like dataset
+    :param mask: Array-like of the same size as data,
+        non-zero values are ignored. Default: None, no mask.
+    :param weights: Array-like of the same size as data
+        used to weight sums and mean. Default: None, no weights.
+    :returns: An object with count, nan_count, sum, sum_of_squares,
+        weights_sum, minimum, maximum, argmin and argmax attributes,
+        and mean, variance and std properties.
+        Indices are in the flattened data.
+    :raises: ValueError if mask or weights size does not match data size
+    """
+    data = numpy.array(data, copy=False)
+    native_endian_dtype = data.dtype.newbyteorder('N')
+    if native_endian_dtype.kind == 'f' and native_endian_dtype.itemsize == 2:
+        # Use native float32 instead of float16
+        native_endian_dtype = "=f4"
+    elif native_endian_dtype.kind == 'b':
+        native_endian_dtype = numpy.uint8
+    data = numpy.ascontiguousarray(data, dtype=native_endian_dtype).ravel()
+
+    if mask is not None:
+        mask = numpy.ascontiguousarray(mask, dtype=bool).ravel()
+        if mask.size != data.size:
+            raise ValueError("mask and data sizes mismatch")
+        mask = mask.view(numpy.uint8)
+
+    if weights is not None:
+        weights = numpy.ascontiguousarray(weights, dtype=numpy.float64).ravel()
+        if weights.size != data.size:
+            raise ValueError("weights and data sizes mismatch")
+
+    if data.size < USE_OPENMP_THRESHOLD:
+        num_threads = 1
+    else:
+        num_threads = min(
+            DEFAULT_NUM_THREADS,
+            int(os.environ.get("OMP_NUM_THREADS", DEFAULT_NUM_THREADS)))
+
+    return _statistics(data, mask, weights, num_threads)
@@ -32,6 +32,7 @@ try:
     import gpyfft
     from gpyfft.fft import FFT as cl_fft
     from ...opencl.common import ocl
+    from ...opencl.processing import get_memory_pool
     __have_clfft__ = True
 except ImportError:
     __have_clfft__ = False
@@ -113,7 +114,10 @@ class CLFFT(BaseFFT):
         self.axes = self.axes[::-1]
 
     def _allocate(self, shape, dtype):
-        ary = parray.empty(self.queue, shape, dtype=dtype)
+        if self.memory_pool is None:
+            ary = parray.empty(self.queue, shape, dtype=dtype)
+        else:
+            ary = self.memory_pool.allocate_array(self.queue, shape, dtype)
         ary.fill(0)
         return ary
 
@@ -177,6 +181,11 @@ class CLFFT(BaseFFT):
             else:
                 self.ctx = cl.create_some_context()
         self.queue = cl.CommandQueue(self.ctx)
+        from ... import config
+        if config.DEFAULT_OPENCL_MEMORY_POOL:
+            self.memory_pool = get_memory_pool(self.ctx)
+        else:
+            self.memory_pool = None
 
 
     def compute_forward_plan(self):
@@ -283,4 +292,9 @@ class CLFFT(BaseFFT):
         #   Please consider explicitly calling clfftTeardown( )
         del self.plan_forward
         del self.plan_inverse
+        if self.memory_pool is not None:
+            # Wait for pending commands before the pool reuses the arrays
+            self.queue.finish()
+            for array in self.refs.values():
+                self.memory_pool.free(array)
 
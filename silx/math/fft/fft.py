@@ -23,12 +23,208 @@
 # THE SOFTWARE.
 #
 # ###########################################################################*/
-from .fftw import FFTW
-from .clfft import CLFFT
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from .fftw import FFTW, __have_fftw__
+from .clfft import CLFFT, __have_clfft__
 from .npfft import NPFFT
 from .cufft import CUFFT
 
 
+logger = logging.getLogger(__name__)
+
+
+_backends = {
+    "numpy": NPFFT,
+    "np": NPFFT,
+    "fftw": FFTW,
+    "opencl": CLFFT,
+    "clfft": CLFFT,
+    "cuda": CUFFT,
+    "cufft": CUFFT,
+}
+
+
+def _get_template(shape, dtype, template):
+    """Returns a template array without memory footprint.
+
+    It only provides shape, dtype and real/complex information to backends.
+    """
+    if template is not None:
+        shape, dtype = template.shape, template.dtype
+    elif shape is None or dtype is None:
+        raise ValueError("Please provide either (shape and dtype) or template")
+    return np.broadcast_to(np.zeros((), dtype=dtype), tuple(shape))
+
+
+def _get_key(template, shape_out, axes, normalize):
+    """Returns a hashable key describing a transform"""
+    return (template.shape,
+            template.dtype.str,
+            None if shape_out is None else tuple(shape_out),
+            None if axes is None else tuple(axes),
+            normalize)
+
+
+def _benchmark(plan, data, repeat=3):
+    """Returns the best time in seconds of a forward and inverse transform.
+
+    :param plan: FFT plan to benchmark
+    :param numpy.ndarray data: Input data of the transform
+    :param int repeat: Number of measures
+    :rtype: float
+    """
+    plan.ifft(plan.fft(data))  # Warm-up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.time()
+        plan.ifft(plan.fft(data))
+        best = min(best, time.time() - start)
+    return best
+
+
+AUTO_BACKENDS = "numpy", "fftw", "opencl"
+"""Backends tried by the "auto" backend, when available"""
+
+_fastest_backends = {}
+_fastest_backends_lock = threading.Lock()
+
+
+def _get_fastest_backend(template, shape_out, axes, normalize,
+                         backends=AUTO_BACKENDS):
+    """Returns the fastest backend for a transform and a plan if it was just
+    created by the benchmark.
+
+    :return: (backend name, plan or None)
+    """
+    backends = tuple(backends)
+    key = _get_key(template, shape_out, axes, normalize) + (backends,)
+    with _fastest_backends_lock:
+        backend = _fastest_backends.get(key)
+        if backend is not None:
+            return backend, None
+
+        available = {
+            "numpy": True,
+            "fftw": __have_fftw__,
+            "opencl": __have_clfft__,
+        }
+        data = np.random.random(template.shape)
+        if np.iscomplexobj(template):
+            data = data + 1j * np.random.random(template.shape)
+        data = data.astype(template.dtype)
+
+        best_time, best_name, best_plan = float("inf"), None, None
+        for name in backends:
+            if not available[name]:
+                continue
+            try:
+                plan = _backends[name](
+                    template=template,
+                    shape_out=shape_out,
+                    axes=axes,
+                    normalize=normalize)
+                elapsed = _benchmark(plan, data)
+            except Exception as e:
+                if name == "numpy":
+                    raise
+                logger.debug("FFT backend %s not available: %s", name, e)
+                continue
+            logger.debug("FFT backend %s: %fs for %s", name, elapsed, key)
+            if elapsed < best_time:
+                best_time, best_name, best_plan = elapsed, name, plan
+        # Store the requested name: plan.backend is "clfft" for "opencl"
+        _fastest_backends[key] = best_name
+        return best_name, best_plan
+
+
+def get_fastest_backend(shape=None, dtype=None, template=None,
+                        shape_out=None, axes=None, normalize="rescale",
+                        backends=None):
+    """Returns the name of the fastest FFT backend for a transform.
+
+    Available backends are benchmarked the first time a transform is
+    requested, and the fastest one is remembered for the lifetime of the
+    process.
+
+    Please see :func:`FFT` for other parameters help.
+
+    :param List[str] backends:
+        Backends to choose from among :data:`AUTO_BACKENDS` (the default).
+    :rtype: str
+    """
+    if backends is None:
+        backends = AUTO_BACKENDS
+    for name in backends:
+        if name not in AUTO_BACKENDS:
+            raise ValueError("Unsupported backend %s, available are %s" %
+                             (name, AUTO_BACKENDS))
+    template = _get_template(shape, dtype, template)
+    return _get_fastest_backend(
+        template, shape_out, axes, normalize, backends)[0]
+
+
+class PlanCache(object):
+    """Cache of FFT plans, shared by all the users of the same transform.
+
+    Plans are kept for the lifetime of the process, up to `max_plans` least
+    recently used ones.
+
+    As plans are shared, arrays they return may be overwritten by the next
+    transform, and they must not be used by several threads at the same time.
+
+    :param int max_plans: Maximum number of plans to keep
+    """
+
+    def __init__(self, max_plans=32):
+        self.max_plans = max_plans
+        self._plans = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._plans)
+
+    def get_plan(self, shape=None, dtype=None, template=None, shape_out=None,
+                 axes=None, normalize="rescale", backend="numpy", **kwargs):
+        """Returns a plan from the cache, creating it if needed.
+
+        Please see :func:`FFT` for parameters help.
+        """
+        template = _get_template(shape, dtype, template)
+        key = (backend.lower(),
+               _get_key(template, shape_out, axes, normalize),
+               tuple(sorted(kwargs.items())))
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                return plan
+            plan = FFT(template=template,
+                       shape_out=shape_out,
+                       axes=axes,
+                       normalize=normalize,
+                       backend=backend,
+                       **kwargs)
+            self._plans[key] = plan
+            while len(self._plans) > self.max_plans:
+                self._plans.popitem(last=False)
+        return plan
+
+    def clear(self):
+        """Remove all plans from the cache"""
+        with self._lock:
+            self._plans.clear()
+
+
+plan_cache = PlanCache()
+"""Process-wide cache of FFT plans used by :func:`FFT` with `cache=True`"""
+
+
 def FFT(
     shape=None,
     dtype=None,
@@ -37,6 +233,7 @@ def FFT(
     axes=None,
     normalize="rescale",
     backend="numpy",
+    cache=False,
     **kwargs
 ):
     """
@@ -69,22 +266,40 @@ def FFT(
             the transform is unitary. Both FFT and IFFT are scaled with 1/sqrt(N).
           * "none": no normalizatio is done : IFFT(FFT(data)) = data*N
     :param str backend:
-        FFT Backend to use. Value can be "numpy", "fftw", "opencl", "cuda".
+        FFT Backend to use. Value can be "numpy", "fftw", "opencl", "cuda"
+        or "auto" to use the fastest available backend of
+        :data:`AUTO_BACKENDS` (see :func:`get_fastest_backend`).
+        Backend specific arguments are not supported with "auto".
+    :param bool cache:
+        True to get the plan from the process-wide :data:`plan_cache`,
+        which is shared with all the users of the same transform.
     """
-    backends = {
-        "numpy": NPFFT,
-        "np": NPFFT,
-        "fftw": FFTW,
-        "opencl": CLFFT,
-        "clfft": CLFFT,
-        "cuda": CUFFT,
-        "cufft": CUFFT,
-    }
-
     backend = backend.lower()
-    if backend not in backends:
-        raise ValueError("Unknown backend %s, available are %s" % (backend, backends))
-    F = backends[backend](
+    if cache:
+        return plan_cache.get_plan(
+            shape=shape,
+            dtype=dtype,
+            template=template,
+            shape_out=shape_out,
+            axes=axes,
+            normalize=normalize,
+            backend=backend,
+            **kwargs
+        )
+
+    if backend == "auto":
+        if kwargs:
+            raise ValueError("Backend specific arguments are not supported "
+                             "with backend 'auto': %s" % list(kwargs.keys()))
+        # Use a template so that all backends perform the same transform
+        template = _get_template(shape, dtype, template)
+        backend, plan = _get_fastest_backend(template, shape_out, axes, normalize)
+        if plan is not None:  # Reuse the plan created by the benchmark
+            return plan
+
+    if backend not in _backends:
+        raise ValueError("Unknown backend %s, available are %s" % (backend, _backends))
+    F = _backends[backend](
         shape=shape,
         dtype=dtype,
         template=template,
@@ -23,6 +23,11 @@
 # THE SOFTWARE.
 #
 # ###########################################################################*/
+import json
+import logging
+import os
+import threading
+
 import numpy as np
 
 from .basefft import BaseFFT, check_version
@@ -39,6 +44,80 @@ if __have_fftw__:
     __have_fftw__ = check_version(pyfftw, __required_pyfftw_version__)
 
 
+logger = logging.getLogger(__name__)
+
+
+def export_wisdom(filename):
+    """Save the FFTW wisdom accumulated by the current process to a file.
+
+    Plans of the transforms described by this wisdom can then be created
+    without measuring them again, see :func:`import_wisdom`.
+
+    :param str filename: Path of the file
+    """
+    if not(__have_fftw__):
+        raise ImportError("Please install pyfftw >= %s to use the FFTW back-end" % __required_pyfftw_version__)
+    wisdom = [w.decode("ascii") for w in pyfftw.export_wisdom()]
+    # Write a temporary file first to never leave a partial file
+    tmp_filename = "%s.%d.tmp" % (filename, os.getpid())
+    with open(tmp_filename, "w") as f:
+        json.dump(wisdom, f)
+    os.replace(tmp_filename, filename)
+
+
+def import_wisdom(filename):
+    """Load FFTW wisdom from a file saved with :func:`export_wisdom`.
+
+    :param str filename: Path of the file
+    :return: True if the wisdom of all precisions was imported
+    :rtype: bool
+    """
+    if not(__have_fftw__):
+        raise ImportError("Please install pyfftw >= %s to use the FFTW back-end" % __required_pyfftw_version__)
+    with open(filename, "r") as f:
+        wisdom = json.load(f)
+    return all(pyfftw.import_wisdom(tuple(w.encode("ascii") for w in wisdom)))
+
+
+_wisdom_lock = threading.Lock()
+_wisdom_files = {}
+"""Wisdom last imported/exported per file of config.DEFAULT_FFTW_WISDOM_FILE"""
+
+
+def _import_default_wisdom():
+    """Import wisdom from config.DEFAULT_FFTW_WISDOM_FILE the first time
+
+    :return: The wisdom file or None if not set
+    """
+    from ... import config
+    filename = config.DEFAULT_FFTW_WISDOM_FILE
+    if filename is None:
+        return None
+    with _wisdom_lock:
+        if filename not in _wisdom_files:
+            if os.path.exists(filename):
+                try:
+                    import_wisdom(filename)
+                except Exception as e:
+                    logger.warning("Cannot import FFTW wisdom from %s: %s",
+                                   filename, e)
+            _wisdom_files[filename] = pyfftw.export_wisdom()
+    return filename
+
+
+def _export_default_wisdom(filename):
+    """Export wisdom to filename if new plans were measured"""
+    with _wisdom_lock:
+        wisdom = pyfftw.export_wisdom()
+        if wisdom != _wisdom_files.get(filename):
+            try:
+                export_wisdom(filename)
+            except Exception as e:
+                logger.warning("Cannot export FFTW wisdom to %s: %s",
+                               filename, e)
+            _wisdom_files[filename] = wisdom
+
+
 class FFTW(BaseFFT):
     """Initialize a FFTW plan.
 
@@ -80,8 +159,11 @@ class FFTW(BaseFFT):
 
         self.allocate_arrays()
         self.set_fftw_flags()
+        wisdom_file = _import_default_wisdom()
         self.compute_forward_plan()
         self.compute_inverse_plan()
+        if wisdom_file is not None:
+            _export_default_wisdom(wisdom_file)
         self.refs = {
             "data_in": self.data_in,
             "data_out": self.data_out,
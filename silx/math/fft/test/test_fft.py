@@ -26,6 +26,9 @@
 """Test of the FFT module"""
 
 import numpy as np
+import os
+import shutil
+import tempfile
 import unittest
 import logging
 try:
@@ -34,7 +37,8 @@ try:
 except ImportError:
     __have_scipy = False
 from silx.utils.testutils import ParametricTestCase
-from silx.math.fft.fft import FFT
+from silx import config
+from silx.math.fft.fft import FFT, get_fastest_backend, plan_cache
 from silx.math.fft.clfft import __have_clfft__
 from silx.math.fft.cufft import __have_cufft__
 from silx.math.fft.fftw import __have_fftw__
@@ -256,9 +260,71 @@ class TestNumpyFFT(ParametricTestCase):
         self.assertTrue(np.allclose(res2, ref2))
 
 
+class TestAutoBackend(unittest.TestCase):
+    """Test the auto backend and the plan cache"""
+
+    def setUp(self):
+        self.data = np.random.random((16, 32)).astype(np.float32)
+
+    def tearDown(self):
+        plan_cache.clear()
+
+    def test_auto(self):
+        F = FFT(template=self.data, axes=(-1,), backend="auto")
+        self.assertIn(F.backend, ("numpy", "fftw", "clfft"))
+        self.assertEqual(
+            get_fastest_backend(template=self.data, axes=(-1,)),
+            "opencl" if F.backend == "clfft" else F.backend)
+        ref = np.fft.rfft(self.data, axis=-1).astype(np.complex64)
+        self.assertTrue(np.allclose(F.fft(self.data), ref, atol=1e-4))
+        self.assertTrue(np.allclose(F.ifft(ref), self.data, atol=1e-4))
+
+        # Same transform described by shape and dtype
+        F = FFT(shape=self.data.shape, dtype=self.data.dtype, axes=(-1,),
+                backend="auto")
+        self.assertTrue(np.allclose(F.fft(self.data), ref, atol=1e-4))
+
+        self.assertEqual(get_fastest_backend(template=self.data,
+                                             backends=["numpy"]),
+                         "numpy")
+        with self.assertRaises(ValueError):
+            FFT(template=self.data, backend="auto", num_threads=2)
+
+    def test_plan_cache(self):
+        F = FFT(template=self.data, backend="numpy", cache=True)
+        self.assertIs(FFT(shape=self.data.shape, dtype=self.data.dtype,
+                          backend="numpy", cache=True),
+                      F)
+        self.assertIsNot(FFT(template=self.data, axes=(-1,),
+                             backend="numpy", cache=True),
+                         F)
+        self.assertEqual(len(plan_cache), 2)
+        self.assertTrue(np.allclose(F.fft(self.data),
+                                    np.fft.rfft2(self.data)))
+        plan_cache.clear()
+        self.assertEqual(len(plan_cache), 0)
+
+    @unittest.skipIf(not __have_fftw__, "fftw back-end requires pyfftw")
+    def test_fftw_wisdom(self):
+        from silx.math.fft import fftw
+        tmpdir = tempfile.mkdtemp()
+        filename = os.path.join(tmpdir, "wisdom.json")
+        previous = config.DEFAULT_FFTW_WISDOM_FILE
+        config.DEFAULT_FFTW_WISDOM_FILE = filename
+        try:
+            FFT(template=self.data, backend="fftw")
+            self.assertTrue(os.path.exists(filename))
+            self.assertTrue(fftw.import_wisdom(filename))
+            fftw.export_wisdom(filename + "2")
+            self.assertTrue(fftw.import_wisdom(filename + "2"))
+        finally:
+            config.DEFAULT_FFTW_WISDOM_FILE = previous
+            shutil.rmtree(tmpdir)
+
+
 def suite():
     suite = unittest.TestSuite()
-    for cls in (TestNumpyFFT, TestFFT):
+    for cls in (TestNumpyFFT, TestFFT, TestAutoBackend):
         suite.addTest(
             unittest.defaultTestLoader.loadTestsFromTestCase(cls))
     return suite
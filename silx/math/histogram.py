@@ -119,6 +119,19 @@ Second call with weights_2
 
 >>> histo, w_histo = histo_lut.apply_lut(weights_2, histo=histo, weighted_histo=w_histo)
 
+Out-of-core histogram
+---------------------
+
+Datasets which do not fit in memory (e.g., h5py datasets) can be streamed
+through :meth:`Histogramnd.accumulate_chunks`. They are read by blocks of
+rows aligned on the dataset chunks and only one or two blocks are held in
+memory at a time:
+
+>>> histo = Histogramnd(None, ranges, n_bins)  # doctest: +SKIP
+>>> with h5py.File('events.h5', 'r') as h5file:  # doctest: +SKIP
+...     histo.accumulate_chunks(h5file['events/position'],
+...                             weights=h5file['events/energy'])
+
 Bin edges
 ---------
 When computing an histogram the caller is asked to provide the histogram
@@ -142,6 +155,9 @@ __authors__ = ["D. Naudet"]
 __license__ = "MIT"
 __date__ = "02/10/2017"
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+
 import numpy as np
 from .chistogramnd import chistogramnd as _chistogramnd  # noqa
 from .chistogramnd_lut import histogramnd_get_lut as _histo_get_lut
@@ -161,7 +177,8 @@ class Histogramnd(object):
                  weight_min=None,
                  weight_max=None,
                  last_bin_closed=False,
-                 wh_dtype=None):
+                 wh_dtype=None,
+                 n_threads=None):
         """
         :param sample:
             The data to be histogrammed.
@@ -231,12 +248,20 @@ class Histogramnd(object):
             of type numpy.double. Allowed values are : `numpy.double` and
             `numpy.float32`
         :type wh_dtype: *optional*, numpy data type
+
+        :param n_threads: Number of threads used to compute histograms
+            (in __init__ and :meth:`accumulate`).
+            Bin counts do not depend on the number of threads, weighted
+            histograms may differ by rounding errors.
+            Default: None, a single thread is used.
+        :type n_threads: *optional*, int
         """
 
         self.__histo_range = histo_range
         self.__n_bins = n_bins
         self.__last_bin_closed = last_bin_closed
         self.__wh_dtype = wh_dtype
+        self.__n_threads = n_threads
 
         if sample is None:
             self.__data = [None, None, None]
@@ -248,7 +273,8 @@ class Histogramnd(object):
                                         weight_min=weight_min,
                                         weight_max=weight_max,
                                         last_bin_closed=self.__last_bin_closed,
-                                        wh_dtype=self.__wh_dtype)
+                                        wh_dtype=self.__wh_dtype,
+                                        n_threads=self.__n_threads)
 
     def __getitem__(self, key):
         """
@@ -325,12 +351,72 @@ class Histogramnd(object):
                                last_bin_closed=self.__last_bin_closed,
                                histo=self.__data[0],
                                weighted_histo=self.__data[1],
-                               wh_dtype=self.__wh_dtype)
+                               wh_dtype=self.__wh_dtype,
+                               n_threads=self.__n_threads)
         if self.__data[0] is None:
             self.__data = result
         elif self.__data[1] is None and result[1] is not None:
             self.__data = result
 
+    STREAM_BLOCK_SIZE = 2**22
+    """Minimum number of sample rows read at once by
+    :meth:`accumulate_chunks` from array-like datasets"""
+
+    def accumulate_chunks(self,
+                          sample,
+                          weights=None,
+                          weight_min=None,
+                          weight_max=None,
+                          block_size=None,
+                          prefetch=True):
+        """
+        Accumulates the histogram of data read block by block.
+
+        This allows to compute histograms of datasets which do not fit in
+        memory, e.g., h5py or :mod:`silx.io.commonh5` datasets.
+
+        :param sample:
+            Either an array-like (e.g., h5py dataset) of shape (N,) or (N, D)
+            which is read by blocks of rows, or an iterable of numpy arrays
+            (i.e., the blocks to histogram).
+        :param weights:
+            Either an array-like of N elements or an iterable of numpy arrays
+            (same number of blocks and elements as *sample*).
+            See :meth:`accumulate`.
+        :param weight_min: See :meth:`accumulate`.
+        :param weight_max: See :meth:`accumulate`.
+        :param int block_size:
+            Number of rows read at once from array-like *sample* and
+            *weights*. Default: A multiple of the dataset chunk size of at
+            least :attr:`STREAM_BLOCK_SIZE` rows.
+        :param bool prefetch:
+            True (default) to read the next block in a background thread
+            while the current one is histogrammed.
+        """
+        blocks = _iter_blocks(sample, weights, block_size,
+                              self.STREAM_BLOCK_SIZE)
+
+        if not prefetch:
+            for sample_block, weights_block in blocks:
+                self.accumulate(sample_block,
+                                weights=weights_block,
+                                weight_min=weight_min,
+                                weight_max=weight_max)
+            return
+
+        end = object()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(next, blocks, end)
+            while True:
+                block = future.result()
+                if block is end:
+                    break
+                future = executor.submit(next, blocks, end)
+                self.accumulate(block[0],
+                                weights=block[1],
+                                weight_min=weight_min,
+                                weight_max=weight_max)
+
     histo = property(lambda self: self[0])
     """ Histogram array, or None if this instance was initialized without
         <sample> and accumulate has not been called yet.
@@ -351,6 +437,53 @@ class Histogramnd(object):
     """
 
 
+def _iter_blocks(sample, weights, block_size, min_block_size):
+    """Generator of (sample, weights) blocks as numpy arrays.
+
+    :param sample: array-like or iterable of numpy arrays
+    :param weights: array-like or iterable of numpy arrays or None
+    :param Union[int,None] block_size: Number of rows per block
+    :param int min_block_size:
+        Minimum number of rows per block used if block_size is None
+    """
+    if not hasattr(sample, 'shape') or not hasattr(sample, '__getitem__'):
+        # Iterable of blocks
+        if weights is None:
+            for sample_block in sample:
+                yield np.asarray(sample_block), None
+        else:
+            end = object()
+            for sample_block, weights_block in zip_longest(
+                    sample, weights, fillvalue=end):
+                if sample_block is end or weights_block is end:
+                    raise ValueError('<weights> must have the same number '
+                                     'of blocks as <sample>.')
+                sample_block = np.asarray(sample_block)
+                weights_block = np.asarray(weights_block)
+                if weights_block.shape != sample_block.shape[:1]:
+                    raise ValueError('<weights> blocks must be 1D arrays '
+                                     'whose length is equal to the number '
+                                     'of samples of <sample> blocks.')
+                yield sample_block, weights_block
+        return
+
+    n_rows = sample.shape[0]
+    if weights is not None and len(weights) != n_rows:
+        raise ValueError('<weights> must be an array whose length '
+                         'is equal to the number of samples.')
+
+    if block_size is None:
+        # Align blocks on dataset chunks along the first dimension
+        chunks = getattr(sample, 'chunks', None)
+        chunk_rows = chunks[0] if chunks else 1
+        block_size = max(1, min_block_size // chunk_rows) * chunk_rows
+
+    for start in range(0, n_rows, block_size):
+        end = min(n_rows, start + block_size)
+        yield (np.asarray(sample[start:end]),
+               None if weights is None else np.asarray(weights[start:end]))
+
+
 class HistogramndLut(object):
     """
     The HistogramndLut class allows you to bin data onto a regular grid.
@@ -363,7 +496,8 @@ class HistogramndLut(object):
                  histo_range,
                  n_bins,
                  last_bin_closed=False,
-                 dtype=None):
+                 dtype=None,
+                 n_threads=None):
         """
         :param sample:
             The coordinates of the data to be histogrammed.
@@ -397,6 +531,11 @@ class HistogramndLut(object):
             Set this parameter to true if you want
             the LAST bin to be closed.
         :type last_bin_closed: *optional*, :class:`python.boolean`
+
+        :param n_threads: Number of threads used by :meth:`accumulate` and
+            :meth:`apply_lut`.
+            Default: None, a single thread is used.
+        :type n_threads: *optional*, int
         """
         lut, histo, edges = _histo_get_lut(sample,
                                            histo_range,
@@ -412,6 +551,7 @@ class HistogramndLut(object):
         self.__dtype = dtype
         self.__shape = histo.shape
         self.__last_bin_closed = last_bin_closed
+        self.__n_threads = n_threads
         self.clear()
 
     def clear(self):
@@ -521,7 +661,8 @@ class HistogramndLut(object):
                                          shape=self.__shape,
                                          dtype=self.__dtype,
                                          weight_min=weight_min,
-                                         weight_max=weight_max)
+                                         weight_max=weight_max,
+                                         n_threads=self.__n_threads)
 
         if self.__histo is None:
             self.__histo = histo
@@ -585,7 +726,8 @@ class HistogramndLut(object):
                                          shape=self.__shape,
                                          dtype=self.__dtype,
                                          weight_min=weight_min,
-                                         weight_max=weight_max)
+                                         weight_max=weight_max,
+                                         n_threads=self.__n_threads)
         self.__dtype = w_histo.dtype
         return histo, w_histo
 
@@ -74,7 +74,9 @@ def configuration(parent_package='', top_path=None):
     config.add_extension('combo',
                          sources=['combo.pyx'],
                          include_dirs=['include'],
-                         language='c')
+                         language='c',
+                         extra_link_args=['-fopenmp'],
+                         extra_compile_args=['-fopenmp'])
 
     config.add_extension('colormap',
                          sources=["colormap.pyx"],
@@ -30,6 +30,7 @@ import numpy as np
 import time
 
 from silx.math import histogramnd
+from silx.math.chistogramnd import chistogramnd
 
 
 def print_times(t0s, t1s, t2s, t3s):
@@ -260,6 +261,42 @@ def run_benchmark(dtype=np.double,
               do_weights=True,
               do_numpy=do_numpy)
 
+
+def run_threads_benchmark(n_threads_list=(1, 2, 4, 8, 16, 32),
+                          sample_shape=(10**8, 2),
+                          n_loops=3):
+    """Benchmark histogramnd scaling with the number of threads"""
+    print('==========================')
+    print(' Threads {0}'.format(sample_shape))
+    print('==========================')
+    sample = np.random.random(sample_shape) * 100.
+    weights = np.random.random((sample_shape[0],))
+    histo_range = [[0., 100.]] * sample.ndim if sample.ndim > 1 else [0., 100.]
+    n_bins = 30
+
+    reference = None
+    for n_threads in n_threads_list:
+        times = []
+        for i in range(n_loops):
+            t0 = time.time()
+            result = chistogramnd(sample,
+                                  histo_range,
+                                  n_bins,
+                                  weights=weights,
+                                  n_threads=n_threads)
+            times.append(time.time() - t0)
+        if reference is None:
+            reference = result
+            speedup = 1.
+            ref_time = min(times)
+        else:
+            assert np.array_equal(result[0], reference[0])
+            assert np.allclose(result[1], reference[1])
+            speedup = ref_time / min(times)
+        print('\t{0: >2} threads : min : {1: <7.3f}; speedup : {2: <5.2f}'
+              ''.format(n_threads, min(times), speedup))
+
+
 if __name__ == '__main__':
     types = (np.double, np.int32, np.float32,)
 
@@ -267,3 +304,5 @@ if __name__ == '__main__':
         run_benchmark(t,
                       do_weights=True,
                       do_numpy=True)
+
+    run_threads_benchmark()
@@ -306,6 +306,32 @@ class _TestHistogramndLut_nominal(unittest.TestCase):
         self.assertTrue(np.array_equal(instance.weighted_histo(),
                                        expected_c))
 
+    def test_nominal_accumulate_n_threads(self):
+        """
+        """
+        n_repeat = 50000
+        sample = np.tile(self.sample, (n_repeat, 1) if self.ndims > 1 else n_repeat)
+        weights = np.tile(self.weights, n_repeat)
+
+        reference = HistogramndLut(sample,
+                                   self.histo_range,
+                                   self.n_bins)
+        reference.accumulate(weights)
+
+        instance = HistogramndLut(sample,
+                                  self.histo_range,
+                                  self.n_bins,
+                                  n_threads=4)
+        instance.accumulate(weights)
+        instance.accumulate(weights)
+
+        histo = instance.histo()
+        w_histo = instance.weighted_histo()
+
+        self.assertEqual(histo.dtype, np.uint32)
+        self.assertTrue(np.array_equal(histo, 2 * reference.histo()))
+        self.assertTrue(np.allclose(w_histo, 2 * reference.weighted_histo()))
+
     def test_nominal_apply_lut_once(self):
         """
         """
@@ -36,7 +36,7 @@ import numpy
 
 from silx.utils.testutils import ParametricTestCase
 
-from silx.math.combo import min_max
+from silx.math.combo import min_max, statistics
 
 
 class TestMinMax(ParametricTestCase):
@@ -207,10 +207,136 @@ class TestMinMax(ParametricTestCase):
                     self._test_min_max(data, min_positive=True, finite=True)
 
 
+class TestStatistics(ParametricTestCase):
+    """Tests of statistics combo"""
+
+    DTYPES = TestMinMax.DTYPES
+
+    def _test_statistics(self, data, mask=None, weights=None):
+        """Compare statistics with numpy for the given dataset
+
+        :param numpy.ndarray data: Data set to use for test
+        :param mask: Mask to use or None
+        :param weights: Weights to use or None
+        """
+        data = numpy.array(data, copy=False)
+        flat_data = data.ravel()
+        valid = numpy.ones(flat_data.shape, dtype=bool)
+        if mask is not None:
+            valid = numpy.logical_not(numpy.array(mask, dtype=bool).ravel())
+        not_nan = valid.copy()
+        if flat_data.dtype.kind == 'f':
+            not_nan &= numpy.logical_not(numpy.isnan(flat_data))
+        values = flat_data[not_nan].astype(numpy.float64)
+        if weights is None:
+            weight_values = numpy.ones(values.shape, dtype=numpy.float64)
+        else:
+            weight_values = numpy.array(
+                weights, dtype=numpy.float64).ravel()[not_nan]
+
+        result = statistics(data, mask=mask, weights=weights)
+
+        self.assertEqual(result.count, values.size)
+        self.assertEqual(result.nan_count,
+                         numpy.count_nonzero(valid) - values.size)
+        self.assertAlmostEqual(result.weights_sum, numpy.sum(weight_values))
+        numpy.testing.assert_allclose(
+            result.sum, numpy.sum(weight_values * values))
+        numpy.testing.assert_allclose(
+            result.sum_of_squares, numpy.sum(weight_values * values ** 2))
+
+        if values.size == 0:
+            self.assertIsNone(result.minimum)
+            self.assertIsNone(result.argmin)
+            self.assertIsNone(result.maximum)
+            self.assertIsNone(result.argmax)
+            self.assertTrue(numpy.isnan(result.mean))
+        else:
+            indices = numpy.nonzero(not_nan)[0]
+            self.assertEqual(result.minimum, numpy.min(flat_data[not_nan]))
+            self.assertEqual(
+                result.argmin, indices[numpy.argmin(flat_data[not_nan])])
+            self.assertEqual(result.maximum, numpy.max(flat_data[not_nan]))
+            self.assertEqual(
+                result.argmax, indices[numpy.argmax(flat_data[not_nan])])
+            mean = numpy.average(values, weights=weight_values)
+            numpy.testing.assert_allclose(result.mean, mean)
+            numpy.testing.assert_allclose(
+                result.variance,
+                numpy.average((values - mean) ** 2, weights=weight_values),
+                atol=1e-10)
+
+    def test_dtypes(self):
+        """Test statistics with different dtypes"""
+        for dtype in self.DTYPES:
+            with self.subTest(dtype=dtype):
+                data = numpy.arange(100, dtype=dtype)[::-1]
+                self._test_statistics(data)
+
+    def test_large(self):
+        """Test statistics on a dataset processed in parallel"""
+        data = numpy.random.random(1000000).reshape(1000, 1000)
+        data[500, 500] = -1.
+        data[10, 10] = 2.
+        self._test_statistics(data)
+
+        result = statistics(data)
+        self.assertEqual(result.argmin, 500 * 1000 + 500)
+        self.assertEqual(result.argmax, 10 * 1000 + 10)
+
+    def test_accuracy(self):
+        """Test variance of data with large offset"""
+        data = 1e9 + numpy.array((4., 7., 13., 16.) * 1000)
+        result = statistics(data)
+        self.assertAlmostEqual(result.mean, 1e9 + 10.)
+        self.assertAlmostEqual(result.variance, 22.5)
+
+    def test_nandata(self):
+        """Test statistics with NaN in data"""
+        for data in TestMinMax.NAN_TEST_DATA:
+            with self.subTest(data=data):
+                self._test_statistics(numpy.array(data, dtype=numpy.float64))
+
+    def test_mask_and_weights(self):
+        """Test statistics with mask and weights"""
+        data = numpy.array((1., 5., numpy.nan, 3., -2., 8.))
+        mask = numpy.array((0, 1, 0, 0, 0, 1), dtype=numpy.uint8)
+        weights = numpy.array((1., 2., 3., 0.5, 2., 1.))
+
+        with self.subTest(mask=True, weights=False):
+            self._test_statistics(data, mask=mask)
+        with self.subTest(mask=False, weights=True):
+            self._test_statistics(data, weights=weights)
+        with self.subTest(mask=True, weights=True):
+            self._test_statistics(data, mask=mask, weights=weights)
+        with self.subTest(mask='all'):
+            self._test_statistics(data, mask=numpy.ones(data.shape))
+
+    def test_center_of_mass(self):
+        """Test center of mass computation with weights"""
+        profile = numpy.array((0., 1., 2., 1., 0.))
+        result = statistics(numpy.arange(len(profile)), weights=profile)
+        self.assertEqual(result.mean, 2.)
+
+    def test_errors(self):
+        """Test statistics with wrong arguments"""
+        with self.assertRaises(TypeError):
+            statistics(None)
+        with self.assertRaises(ValueError):
+            statistics(numpy.arange(10), mask=numpy.zeros(5))
+        with self.assertRaises(ValueError):
+            statistics(numpy.arange(10), weights=numpy.ones(5))
+
+    def test_empty(self):
+        """Test statistics with an empty array"""
+        self._test_statistics(numpy.array((), dtype=numpy.float32))
+
+
 def suite():
     test_suite = unittest.TestSuite()
-    test_suite.addTests(
-        unittest.defaultTestLoader.loadTestsFromTestCase(TestMinMax))
+    for test_case in (TestMinMax, TestStatistics):
+        test_suite.addTests(
+            unittest.defaultTestLoader.loadTestsFromTestCase(test_case))
     return test_suite
 
 
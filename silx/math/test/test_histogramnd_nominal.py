@@ -27,6 +27,7 @@ Nominal tests of the histogramnd function.
 
 import unittest
 
+import h5py
 import numpy as np
 
 from silx.math.chistogramnd import chistogramnd as histogramnd
@@ -152,6 +153,40 @@ class _Test_chistogramnd_nominal(unittest.TestCase):
                             msg='Testing bin_edges for dim {0}'
                                 ''.format(i_edges+1))
 
+    def test_nominal_n_threads(self):
+        """
+        """
+        n_repeat = 50000
+        sample = np.tile(self.sample, (n_repeat, 1) if self.ndims > 1 else n_repeat)
+        weights = np.tile(self.weights, n_repeat)
+
+        expected_h, expected_c, _ = histogramnd(sample,
+                                                self.histo_range,
+                                                self.n_bins,
+                                                weights=weights)
+
+        histo, cumul, bin_edges = histogramnd(sample,
+                                              self.histo_range,
+                                              self.n_bins,
+                                              weights=weights,
+                                              n_threads=4)
+
+        self.assertEqual(cumul.dtype, np.float64)
+        self.assertEqual(histo.dtype, np.uint32)
+        self.assertTrue(np.array_equal(histo, expected_h))
+        self.assertTrue(np.allclose(cumul, expected_c))
+
+        # Accumulate in provided arrays
+        histogramnd(sample,
+                    self.histo_range,
+                    self.n_bins,
+                    weights=weights,
+                    histo=histo,
+                    weighted_histo=cumul,
+                    n_threads=4)
+        self.assertTrue(np.array_equal(histo, 2 * expected_h))
+        self.assertTrue(np.allclose(cumul, 2 * expected_c))
+
     def test_nominal_wh_dtype(self):
         """
         """
@@ -527,9 +562,9 @@ class _Test_Histogramnd_nominal(unittest.TestCase):
                 idx = [self.other_axes_index]*len(h.shape)
                 idx[dim] = slice(0, None)
                 if op:
-                    h[idx] = op(h[idx], v)
+                    h[tuple(idx)] = op(h[tuple(idx)], v)
                 else:
-                    h[idx] = v
+                    h[tuple(idx)] = v
             self.fill_histo = fill_histo
 
     def test_nominal(self):
@@ -805,6 +840,81 @@ class _Test_Histogramnd_nominal(unittest.TestCase):
         self.assertTrue(np.array_equal(histo, expected_h))
         self.assertTrue(np.allclose(cumul, expected_c, rtol=10e-15))
 
+    def test_accumulate_chunks(self):
+        """
+        """
+        expected_h_tpl = np.array([2, 1, 1, 1, 1])
+        expected_c_tpl = np.array([-700.7, -0.5, 0.01, 300.3, 500.5])
+
+        expected_h = np.zeros(shape=self.n_bins, dtype=np.double)
+        expected_c = np.zeros(shape=self.n_bins, dtype=np.double)
+
+        self.fill_histo(expected_h, expected_h_tpl, self.ndims-1)
+        self.fill_histo(expected_c, expected_c_tpl, self.ndims-1)
+
+        blocks = [(self.sample[:4], self.weights[:4]),
+                  (self.sample[4:], self.weights[4:])]
+
+        for prefetch in (True, False):
+            for name, sample, weights, block_size in (
+                    ('array', self.sample, self.weights, 2),
+                    ('iterable', [b[0] for b in blocks], [b[1] for b in blocks], None)):
+                with self.subTest(input=name, prefetch=prefetch):
+                    histo_inst = Histogramnd(None,
+                                             self.histo_range,
+                                             self.n_bins)
+                    histo_inst.accumulate_chunks(sample,
+                                                 weights=weights,
+                                                 block_size=block_size,
+                                                 prefetch=prefetch)
+
+                    self.assertTrue(np.array_equal(histo_inst.histo,
+                                                   expected_h))
+                    self.assertTrue(np.allclose(histo_inst.weighted_histo,
+                                                expected_c,
+                                                rtol=10e-15))
+
+    def test_accumulate_chunks_h5py(self):
+        """
+        """
+        expected_h_tpl = np.array([2, 1, 1, 1, 1])
+        expected_c_tpl = np.array([-700.7, -0.5, 0.01, 300.3, 500.5])
+
+        expected_h = np.zeros(shape=self.n_bins, dtype=np.double)
+        expected_c = np.zeros(shape=self.n_bins, dtype=np.double)
+
+        self.fill_histo(expected_h, expected_h_tpl, self.ndims-1)
+        self.fill_histo(expected_c, expected_c_tpl, self.ndims-1)
+
+        with h5py.File('histogramnd.h5', 'w',
+                       driver='core', backing_store=False) as h5file:
+            sample = h5file.create_dataset(
+                'sample', data=self.sample,
+                chunks=(2,) + self.sample.shape[1:])
+            weights = h5file.create_dataset(
+                'weights', data=self.weights, chunks=(3,))
+
+            histo_inst = Histogramnd(None, self.histo_range, self.n_bins)
+            histo_inst.accumulate_chunks(sample, weights=weights)
+
+        self.assertTrue(np.array_equal(histo_inst.histo, expected_h))
+        self.assertTrue(np.allclose(histo_inst.weighted_histo,
+                                    expected_c,
+                                    rtol=10e-15))
+
+    def test_accumulate_chunks_weights_mismatch(self):
+        """
+        """
+        histo_inst = Histogramnd(None, self.histo_range, self.n_bins)
+        sample = [self.sample[:4], self.sample[4:]]
+
+        with self.assertRaises(ValueError):
+            histo_inst.accumulate_chunks(
+                sample, weights=[self.weights[:3], self.weights[3:]])
+
+        with self.assertRaises(ValueError):
+            histo_inst.accumulate_chunks(sample, weights=[self.weights[:4]])
+
     def test_accumulate_no_weights(self):
         """
         """
@@ -105,6 +105,8 @@ class Backprojection(OpenclProcessing):
                                   platformid=platformid, deviceid=deviceid,
                                   profile=profile)
 
+        self._stack_buffers = None  # Device buffers of the stack processing
+        self._stack_filters = {}  # SinoFilter for stacks, per number of slices
         self._init_geometry(sino_shape, slice_shape, angles, axis_position,
                            extra_options)
         self._allocate_memory()
@@ -381,6 +383,257 @@ class Backprojection(OpenclProcessing):
 
     __call__ = filtered_backprojection
 
+    def _get_stack_batch_size(self, n_slices):
+        """Returns the number of sinograms processed at once by
+        :meth:`filtered_backprojection_stack`.
+
+        As many sinograms as fit in an eighth of the device memory are used.
+
+        :param int n_slices: Number of sinograms in the stack
+        :rtype: int
+        """
+        n_projs, n_bins = self.shape
+        slice_size = _sizeof(np.float32) * (
+            # Input and filtered sinograms (double buffered)
+            4 * n_projs * n_bins +
+            # Padded sinogram and its Fourier transform
+            2 * n_projs * self.sino_filter.dwidth_padded +
+            # Reconstructed slices (double buffered)
+            2 * self.dimrec_shape[0] * self.dimrec_shape[1])
+        return int(max(1, min(n_slices, self.device.memory // 8 // slice_size)))
+
+    def _get_stack_buffers(self, batch_size):
+        """Returns the device buffers used to process a stack of sinograms.
+
+        Buffers are kept for the next call with the same batch size.
+        All buffers are double buffered to overlap transfers and computation.
+
+        :param int batch_size: Number of sinograms processed at once
+        :return: (input sinograms, filtered sinograms, slices, transfer queue)
+        """
+        if (self._stack_buffers is None or
+                self._stack_buffers[0][0].shape[0] != batch_size):
+            self._stack_buffers = None  # Release previous buffers first
+            sinos_shape = (batch_size,) + tuple(self.shape)
+            slices_shape = (batch_size,) + tuple(self.dimrec_shape)
+            self._stack_buffers = (
+                [parray.empty(self.queue, sinos_shape, np.float32) for _ in range(2)],
+                [parray.empty(self.queue, sinos_shape, np.float32) for _ in range(2)],
+                [parray.zeros(self.queue, slices_shape, np.float32) for _ in range(2)],
+                pyopencl.CommandQueue(self.ctx, properties=self.queue.properties),
+            )
+        return self._stack_buffers
+
+    def _get_stack_filter(self, n_slices):
+        """Returns a SinoFilter for a stack of sinograms.
+
+        It uses the same filter as :attr:`sino_filter`.
+
+        :param int n_slices: Number of sinograms in the stack
+        :rtype: SinoFilter
+        """
+        sino_filter = self._stack_filters.get(n_slices)
+        if sino_filter is None:
+            if len(self._stack_filters) >= 2:
+                # Only keep the filters of full batches and of the last one
+                self._stack_filters.clear()
+            sino_filter = SinoFilter(
+                (n_slices,) + tuple(self.shape),
+                ctx=self.ctx,
+                filter_name=self.filter_name,
+                extra_options=self.extra_options,
+            )
+            self._stack_filters[n_slices] = sino_filter
+        if sino_filter.filter_f is not self.sino_filter.filter_f:
+            # Follow changes made with self.sino_filter.set_filter
+            # (filter is already normalized)
+            sino_filter.set_filter(self.sino_filter.filter_f.copy(),
+                                   normalize=False)
+            sino_filter.filter_f = self.sino_filter.filter_f
+        return sino_filter
+
+    def _download_slices(self, queue, d_slices, output, start, wait_for):
+        """Copy reconstructed slices from device without their padding.
+
+        :param queue: Command queue to use for the transfer
+        :param d_slices: Device slices of shape (n, dimrec_shape)
+        :param output: Stack of output slices (numpy or pyopencl array)
+        :param int start: Index in output of the first slice to copy
+        :param wait_for: Events to wait for before starting the transfer
+        :return: OpenCL event of the transfer
+        """
+        itemsize = _sizeof(np.float32)
+        n_slices = d_slices.shape[0]
+        height, width = self.slice_shape
+        region = (width * itemsize, height, n_slices)
+        src_pitches = (self.dimrec_shape[1] * itemsize,
+                       self.dimrec_shape[0] * self.dimrec_shape[1] * itemsize)
+        dst_pitches = (width * itemsize, height * width * itemsize)
+        if isinstance(output, np.ndarray):
+            return pyopencl.enqueue_copy(
+                queue,
+                output[start:start + n_slices],
+                d_slices.base_data,
+                buffer_origin=(0, 0, 0),
+                host_origin=(0, 0, 0),
+                region=region,
+                buffer_pitches=src_pitches,
+                host_pitches=dst_pitches,
+                wait_for=wait_for,
+                is_blocking=False)
+        else:
+            return pyopencl.enqueue_copy(
+                queue,
+                output.base_data,
+                d_slices.base_data,
+                src_origin=(0, 0, 0),
+                dst_origin=(output.offset, 0, start),
+                region=region,
+                src_pitches=src_pitches,
+                dst_pitches=dst_pitches,
+                wait_for=wait_for)
+
+    def filtered_backprojection_stack(self, sinos, output=None,
+                                      batch_size=None):
+        """
+        Compute the filtered backprojection (FBP) of a stack of sinograms.
+
+        The sinograms are processed by batches: all the sinograms of a batch
+        are filtered with one batched FFT and backprojected with a single
+        kernel launch.
+        Meanwhile, the next batch is uploaded and the slices of the previous
+        one are downloaded with another command queue.
+
+        The stack is always backprojected without textures, so results can
+        slightly differ from :meth:`filtered_backprojection` on devices
+        supporting textures.
+
+        :param sinos: stack of sinograms (`np.ndarray` or
+            `pyopencl.array.Array`) with the shape
+            (n_slices, n_projections, n_bins)
+        :param output: output (`np.ndarray` or `pyopencl.array.Array`)
+            with the shape (n_slices,) + slice_shape.
+            If nothing is provided, a new numpy array is returned.
+        :param int batch_size: Number of sinograms processed at once.
+            Default: as many as fit in an eighth of the device memory.
+        :return: stack of reconstructed slices
+        """
+        if sinos.ndim != 3 or tuple(sinos.shape[1:]) != tuple(self.shape):
+            raise ValueError("Expected sinograms of shape (n_slices, %d, %d), got %s" %
+                             (tuple(self.shape) + (sinos.shape,)))
+        n_slices = sinos.shape[0]
+        if isinstance(sinos, np.ndarray):
+            sinos = np.ascontiguousarray(sinos, dtype=np.float32)
+        elif sinos.dtype != np.float32 or not sinos.flags.c_contiguous:
+            raise ValueError("Expected C-contiguous numpy.float32 sinograms")
+
+        output_shape = (n_slices,) + tuple(self.slice_shape)
+        if output is None:
+            output = np.empty(output_shape, dtype=np.float32)
+        elif (tuple(output.shape) != output_shape or
+                output.dtype != np.float32 or not output.flags.c_contiguous):
+            raise ValueError("Expected a C-contiguous numpy.float32 output of shape %s" %
+                             (output_shape,))
+        if n_slices == 0:
+            return output
+
+        if batch_size is None:
+            batch_size = self._get_stack_batch_size(n_slices)
+        batch_size = max(1, min(int(batch_size), n_slices))
+        starts = list(range(0, n_slices, batch_size))
+
+        sino_nbytes = _sizeof(np.float32) * int(np.prod(self.shape))
+
+        def get_batch(index):
+            start = starts[index]
+            return start, min(start + batch_size, n_slices)
+
+        # Sinograms are staged on the device only when they are filtered
+        # on the device
+        stage_input = self.sino_filter.fft_backend == "opencl"
+
+        events = []
+        with self.sem:
+            d_inputs, d_sinos, d_slices, transfer_queue = \
+                self._get_stack_buffers(batch_size)
+
+            def upload(index):
+                start, stop = get_batch(index)
+                d_input = d_inputs[index % 2][:stop - start]
+                if isinstance(sinos, np.ndarray):
+                    ev = pyopencl.enqueue_copy(transfer_queue,
+                                               d_input.data,
+                                               sinos[start:stop],
+                                               is_blocking=False)
+                    events.append(EventDescription("upload sinograms H->D", ev))
+                else:
+                    ev = pyopencl.enqueue_copy(transfer_queue,
+                                               d_input.data,
+                                               sinos.base_data,
+                                               byte_count=d_input.nbytes,
+                                               src_offset=sinos.offset + start * sino_nbytes)
+                    events.append(EventDescription("upload sinograms D->D", ev))
+                return ev
+
+            upload_events = [None, None]
+            download_events = [[], []]
+            if stage_input:
+                upload_events[0] = upload(0)
+
+            for index in range(len(starts)):
+                start, stop = get_batch(index)
+                n_batch = stop - start
+                current = index % 2
+
+                if stage_input:
+                    upload_events[current].wait()
+                    batch = d_inputs[current][:n_batch]
+                    if index + 1 < len(starts):
+                        # Filtering of previous batch is complete
+                        upload_events[1 - current] = upload(index + 1)
+                elif isinstance(sinos, np.ndarray):
+                    batch = sinos[start:stop]
+                else:
+                    # Sinograms are filtered on the host
+                    batch = sinos[start:stop].get()
+
+                # Wait for buffers of the batch before last to be available
+                for ev in download_events[current]:
+                    ev.wait()
+
+                d_filtered = d_sinos[current][:n_batch]
+                stack_filter = self._get_stack_filter(n_batch)
+                stack_filter(batch, output=d_filtered)
+                # The filter writes d_filtered with its own command queue
+                stack_filter.queue.finish()
+
+                kernel_args = list(self._backproj_kernel_args)
+                kernel_args[3] = d_slices[current].data
+                kernel_args[4] = d_filtered.data
+                ev = self.kernels.backproj_cpu_kernel(
+                    self.queue,
+                    self.ndrange + (n_batch,),
+                    self.wg + (1,),
+                    *kernel_args
+                )
+                events.append(EventDescription("backprojection", ev))
+
+                ev = self._download_slices(transfer_queue,
+                                           d_slices[current][:n_batch],
+                                           output,
+                                           start,
+                                           wait_for=[ev])
+                events.append(EventDescription("download slices", ev))
+                download_events[current] = [ev]
+
+            for ev in download_events[0] + download_events[1]:
+                ev.wait()
+        # /with self.sem
+        if self.profile:
+            self.events += events
+
+        return output
+
 
     # -------------------
     # - Compatibility  -
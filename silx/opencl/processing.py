@@ -46,7 +46,8 @@ __status__ = "stable"
 import os
 import logging
 import gc
-from collections import namedtuple
+import hashlib
+from collections import namedtuple, OrderedDict
 import numpy
 import threading
 from .common import ocl, pyopencl, release_cl_buffers, query_kernel_info, allocate_texture, check_textures_availability
@@ -100,6 +101,301 @@ class KernelContainer(object):
         return query_kernel_info(self._program, kernel, "PREFERRED_WORK_GROUP_SIZE_MULTIPLE")
 
 
+class ProgramCache(object):
+    """Process-wide cache of built OpenCL programs.
+
+    Programs are identified by their context, the devices of this context,
+    the hash of their source code and their compile options, so that all
+    the :class:`OpenclProcessing` instances working with the same context
+    share the same program instead of compiling it again.
+
+    Programs keep a reference to their context: the least recently used
+    ones are discarded when more than `max_programs` programs are cached.
+
+    If :data:`silx.config.DEFAULT_OPENCL_PROGRAM_CACHE_DIR` is set, binaries
+    of programs built for a single device are also stored in this directory
+    and reused by the next processes.
+
+    :param int max_programs: Maximum number of programs kept in memory
+    """
+
+    def __init__(self, max_programs=128):
+        self.max_programs = max_programs
+        self._programs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._programs)
+
+    def get_program(self, ctx, source, options=None):
+        """Returns the program built from a source code for a context.
+
+        :param pyopencl.Context ctx: Context of the program
+        :param str source: OpenCL source code of the program
+        :param str options: Compile options
+        :rtype: pyopencl.Program
+        """
+        if not isinstance(options, str):
+            options = " ".join(options or [])
+        source_hash = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        devices = tuple(device.int_ptr for device in ctx.devices)
+        key = ctx.int_ptr, devices, source_hash, options
+        with self._lock:
+            program = self._programs.get(key)
+            if program is not None:
+                self._programs.move_to_end(key)
+                return program
+
+        # Build outside of the lock, not to block other builds
+        from .. import config
+        cache_dir = config.DEFAULT_OPENCL_PROGRAM_CACHE_DIR
+        if cache_dir and len(ctx.devices) == 1:
+            program = self._build_with_binary_cache(
+                ctx, source, source_hash, options, cache_dir)
+        else:
+            program = pyopencl.Program(ctx, source).build(options=options)
+
+        with self._lock:
+            self._programs[key] = program
+            while len(self._programs) > self.max_programs:
+                self._programs.popitem(last=False)
+        return program
+
+    @staticmethod
+    def _build_with_binary_cache(ctx, source, source_hash, options, cache_dir):
+        """Build a program from its binary stored in the cache directory,
+        or from its source, storing its binary.
+        """
+        device = ctx.devices[0]
+        description = "\n".join((device.platform.name, device.name,
+                                  device.driver_version, source_hash,
+                                  options))
+        filename = os.path.join(
+            cache_dir,
+            hashlib.sha1(description.encode("utf-8")).hexdigest() + ".bin")
+
+        if os.path.exists(filename):
+            try:
+                with open(filename, "rb") as f:
+                    binary = f.read()
+                return pyopencl.Program(ctx, [device], [binary]).build(
+                    options=options)
+            except (IOError, pyopencl.Error) as error:
+                logger.debug("Cannot use cached binary %s: %s",
+                             filename, error)
+
+        program = pyopencl.Program(ctx, source).build(options=options)
+        try:
+            binary = program.get_info(pyopencl.program_info.BINARIES)[0]
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            # Write the file atomically for concurrent processes
+            tmp_filename = "%s.%d.tmp" % (filename, os.getpid())
+            with open(tmp_filename, "wb") as f:
+                f.write(binary)
+            os.replace(tmp_filename, filename)
+        except (IOError, OSError, pyopencl.Error) as error:
+            logger.warning("Cannot store OpenCL program binary in %s: %s",
+                           cache_dir, error)
+        return program
+
+    def clear(self):
+        """Remove all the programs from memory"""
+        with self._lock:
+            self._programs.clear()
+
+
+program_cache = ProgramCache()
+"""Programs shared by all :class:`OpenclProcessing` instances"""
+
+
+class MemoryPool(object):
+    """Pool of device memory of an OpenCL context.
+
+    Released buffers and images are held by the pool and reused by the next
+    allocations of the same kind, instead of being released to the OpenCL
+    driver. Buffers are grouped by size classes (4 per power of two) so that
+    a buffer can be reused for a slightly smaller request, images by format
+    and shape.
+
+    The least recently released memory is given back to the driver when
+    more than `max_held_size` bytes are held, or when an allocation fails.
+
+    :param pyopencl.Context ctx: Context of the memory
+    :param int max_held_size: Maximum size in bytes of the memory held
+        without being used. Default: a quarter of the device memory.
+    """
+
+    def __init__(self, ctx, max_held_size=None):
+        self.ctx = ctx
+        if max_held_size is None:
+            max_held_size = ctx.devices[0].global_mem_size // 4
+        self.max_held_size = max_held_size
+        self._lock = threading.Lock()
+        self._held = {}  # key: list of memory objects, last released last
+        self._held_order = OrderedDict()  # id: (key, mem, size)
+        self._active = {}  # id: (key, mem, size)
+        self._active_size = 0
+        self._held_size = 0
+        self._high_water_mark = 0
+
+    @staticmethod
+    def size_class(size):
+        """Returns the size of the buffers used for a requested size.
+
+        :param int size: Requested size in bytes
+        :rtype: int
+        """
+        size = max(int(size), 1)
+        step = 1 << max(size.bit_length() - 3, 0)
+        return ((size + step - 1) // step) * step
+
+    @property
+    def active_size(self):
+        """Size in bytes of the memory currently used"""
+        return self._active_size
+
+    @property
+    def held_size(self):
+        """Size in bytes of the memory held for reuse"""
+        return self._held_size
+
+    @property
+    def high_water_mark(self):
+        """Maximum size in bytes of the memory used at the same time"""
+        return self._high_water_mark
+
+    def reset_high_water_mark(self):
+        """Reset the high-water mark to the memory currently used"""
+        with self._lock:
+            self._high_water_mark = self._active_size
+
+    def __get(self, key, size, create):
+        with self._lock:
+            held = self._held.get(key)
+            if held:
+                mem = held.pop()
+                del self._held_order[id(mem)]
+                self._held_size -= size
+            else:
+                mem = None
+
+        if mem is None:
+            try:
+                mem = create()
+            except (pyopencl.MemoryError, pyopencl.RuntimeError):
+                # Give the memory held back to the driver and try again
+                self.trim(0)
+                mem = create()
+
+        with self._lock:
+            self._active[id(mem)] = key, mem, size
+            self._active_size += size
+            self._high_water_mark = max(self._high_water_mark,
+                                        self._active_size)
+        return mem
+
+    def allocate(self, size, flags=None):
+        """Returns a buffer of at least the requested size.
+
+        :param int size: Size in bytes
+        :param flags: pyopencl.mem_flags of the buffer
+        :rtype: pyopencl.Buffer
+        """
+        if flags is None:
+            flags = pyopencl.mem_flags.READ_WRITE
+        size = self.size_class(size)
+        return self.__get(("buffer", int(flags), size), size,
+                          lambda: pyopencl.Buffer(self.ctx, flags, size))
+
+    def allocate_array(self, queue, shape, dtype):
+        """Returns an uninitialized array whose data is taken from the pool.
+
+        :param pyopencl.CommandQueue queue:
+        :param shape: Shape of the array
+        :param dtype: Data type of the array
+        :rtype: pyopencl.array.Array
+        """
+        nbytes = numpy.dtype(dtype).itemsize * int(numpy.prod(shape))
+        buffer_ = self.allocate(nbytes)
+        return pyopencl.array.Array(queue, shape, dtype, data=buffer_)
+
+    def allocate_image(self, flags, image_format, shape):
+        """Returns an uninitialized image.
+
+        :param flags: pyopencl.mem_flags of the image
+        :param pyopencl.ImageFormat image_format:
+        :param shape: Shape of the image, fastest dimension first
+        :rtype: pyopencl.Image
+        """
+        shape = tuple(int(dim) for dim in shape)
+        size = image_format.itemsize * int(numpy.prod(shape))
+        key = ("image", int(flags), image_format.channel_order,
+               image_format.channel_data_type, shape)
+        return self.__get(key, size,
+                          lambda: pyopencl.Image(self.ctx, flags,
+                                                 image_format, shape))
+
+    def free(self, mem):
+        """Give memory allocated by this pool back to it.
+
+        :param mem: Buffer, image or array allocated by this pool
+        :return: True if the memory was allocated by this pool, False
+            otherwise (the memory is then left untouched)
+        :rtype: bool
+        """
+        if isinstance(mem, pyopencl.array.Array):
+            mem = mem.base_data
+        with self._lock:
+            item = self._active.pop(id(mem), None)
+            if item is None:
+                return False
+            key, mem, size = item
+            self._active_size -= size
+            self._held.setdefault(key, []).append(mem)
+            self._held_order[id(mem)] = item
+            self._held_size += size
+        if self._held_size > self.max_held_size:
+            self.trim()
+        return True
+
+    def trim(self, max_held_size=None):
+        """Release the least recently used memory held by the pool.
+
+        :param int max_held_size: Maximum size in bytes of held memory to
+            keep. Default: :attr:`max_held_size`.
+        """
+        if max_held_size is None:
+            max_held_size = self.max_held_size
+        released = []
+        with self._lock:
+            while self._held_size > max_held_size:
+                _id, (key, mem, size) = self._held_order.popitem(last=False)
+                self._held[key].remove(mem)
+                self._held_size -= size
+                released.append(mem)
+        for mem in released:
+            mem.release()
+
+
+_memory_pools = {}
+_memory_pools_lock = threading.Lock()
+
+
+def get_memory_pool(ctx):
+    """Returns the memory pool shared by all the users of a context.
+
+    :param pyopencl.Context ctx:
+    :rtype: MemoryPool
+    """
+    with _memory_pools_lock:
+        pool = _memory_pools.get(ctx.int_ptr)
+        if pool is None:
+            pool = MemoryPool(ctx)
+            _memory_pools[ctx.int_ptr] = pool
+        return pool
+
+
 class OpenclProcessing(object):
     """Abstract class for different types of OpenCL processing.
 
@@ -135,6 +431,8 @@ class OpenclProcessing(object):
         self.profile = None
         self.events = []  # List with of EventDescription, kept for profiling
         self.cl_mem = {}  # dict with all buffer allocated
+        self.memory_pool = None  # MemoryPool used to allocate buffers
+        self._textures = []  # Textures allocated from the memory pool
         self.cl_program = None  # The actual OpenCL program
         self.cl_kernel_args = {}  # dict with all kernel arguments
         self.queue = None
@@ -155,6 +453,10 @@ class OpenclProcessing(object):
         self.program = None
         self.kernels = None
 
+        from .. import config
+        if config.DEFAULT_OPENCL_MEMORY_POOL:
+            self.memory_pool = get_memory_pool(self.ctx)
+
     def check_textures_availability(self):
         return check_textures_availability(self.ctx)
 
@@ -211,15 +513,26 @@ class OpenclProcessing(object):
                                   % (ualloc, self.device.memory))
 
             # do the allocation
+            pool = self.memory_pool
             try:
                 if use_array:
                     for buf in buffers:
-                        mem[buf.name] = pyopencl.array.empty(self.queue, buf.size, buf.dtype)
+                        if pool is None:
+                            mem[buf.name] = pyopencl.array.empty(self.queue, buf.size, buf.dtype)
+                        else:
+                            mem[buf.name] = pool.allocate_array(self.queue, buf.size, buf.dtype)
                 else:
                     for buf in buffers:
                         size = numpy.dtype(buf.dtype).itemsize * numpy.prod(buf.size)
-                        mem[buf.name] = pyopencl.Buffer(self.ctx, buf.flags, int(size))
+                        if pool is None:
+                            mem[buf.name] = pyopencl.Buffer(self.ctx, buf.flags, int(size))
+                        else:
+                            mem[buf.name] = pool.allocate(int(size), buf.flags)
             except pyopencl.MemoryError as error:
+                if pool is not None:
+                    for key, buf in list(mem.items()):
+                        if pool.free(buf):
+                            del mem[key]
                 release_cl_buffers(mem)
                 raise MemoryError(error)
 
@@ -245,9 +558,20 @@ class OpenclProcessing(object):
         """free all device.memory allocated on the device
         """
         with self.sem:
+            pool = self.memory_pool
+            if pool is not None:
+                # Pending commands may still use the buffers given back to
+                # the pool, which can reuse them right away
+                if self.queue is not None:
+                    self.queue.finish()
+                for texture in self._textures:
+                    pool.free(texture)
+                self._textures = []
             for key, buf in list(self.cl_mem.items()):
                 if buf is not None:
-                    if isinstance(buf, pyopencl.array.Array):
+                    if pool is not None and pool.free(buf):
+                        pass
+                    elif isinstance(buf, pyopencl.array.Array):
                         try:
                             buf.data.release()
                         except pyopencl.LogicError:
@@ -262,6 +586,9 @@ class OpenclProcessing(object):
     def compile_kernels(self, kernel_files=None, compile_options=None):
         """Call the OpenCL compiler
 
+        Programs are shared between instances through :data:`program_cache`,
+        so the compiler is only called once per context, source and options.
+
         :param kernel_files: list of path to the kernel
             (by default use the one declared in the class)
         :param compile_options: string of compile options
@@ -273,7 +600,8 @@ class OpenclProcessing(object):
         compile_options = compile_options or self.get_compiler_options()
         logger.info("Compiling file %s with options %s", kernel_files, compile_options)
         try:
-            self.program = pyopencl.Program(self.ctx, kernel_src).build(options=compile_options)
+            self.program = program_cache.get_program(self.ctx, kernel_src,
+                                                     compile_options)
         except (pyopencl.MemoryError, pyopencl.LogicError) as error:
             raise MemoryError(error)
         else:
@@ -317,7 +645,31 @@ class OpenclProcessing(object):
             self.events.append(EventDescription(desc, event))
 
     def allocate_texture(self, shape, hostbuf=None, support_1D=False):
-        return allocate_texture(self.ctx, shape, hostbuf=hostbuf, support_1D=support_1D)
+        """Allocate a float32 OpenCL image initialized with zeros.
+
+        When a memory pool is used, the image is taken from the pool and
+        given back to it by :meth:`free_buffers`.
+
+        :param shape: Shape of the image
+        :param hostbuf: Not used
+        :param support_1D: force the image to be 1D if the shape has only one dim
+        """
+        if self.memory_pool is None:
+            return allocate_texture(self.ctx, shape, hostbuf=hostbuf, support_1D=support_1D)
+
+        if len(shape) == 1 and not(support_1D):
+            shape = (1,) + tuple(shape)
+        texture = self.memory_pool.allocate_image(
+            pyopencl.mem_flags.READ_ONLY,
+            pyopencl.ImageFormat(pyopencl.channel_order.INTENSITY,
+                                 pyopencl.channel_type.FLOAT),
+            shape[::-1])
+        # Clear the memory used previously
+        zeros = numpy.zeros(shape, dtype=numpy.float32)
+        pyopencl.enqueue_copy(self.queue, texture, zeros,
+                              origin=(0,) * len(shape), region=shape[::-1]).wait()
+        self._textures.append(texture)
+        return texture
 
     def transfer_to_texture(self, arr, tex_ref):
         """
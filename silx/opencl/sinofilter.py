@@ -39,7 +39,7 @@ import pyopencl.array as parray
 from .common import pyopencl as cl
 from .processing import OpenclProcessing
 from ..math.fft.clfft import CLFFT, __have_clfft__
-from ..math.fft.npfft import NPFFT
+from ..math.fft.fft import FFT, get_fastest_backend
 from ..image.tomography import generate_powers, get_next_power, compute_fourier_filter
 from ..utils.deprecation import deprecated
 
@@ -89,19 +89,19 @@ class SinoFilter(OpenclProcessing):
     def _calculate_shapes(self, sino_shape):
         """
 
-        :param sino_shape: shape of the sinogram.
+        :param sino_shape: shape of the sinogram, either (n_a, d_x) or
+            (n_z, n_a, d_x) for a stack of sinograms.
         """
         self.ndim = len(sino_shape)
-        if self.ndim == 2:
-            n_angles, dwidth = sino_shape
-        else:
+        if self.ndim not in (2, 3):
             raise ValueError("Invalid sinogram number of dimensions: "
-                             "expected 2 dimensions")
-        self.sino_shape = sino_shape
+                             "expected 2 or 3 dimensions")
+        n_angles, dwidth = sino_shape[-2:]
+        self.sino_shape = tuple(sino_shape)
         self.n_angles = n_angles
         self.dwidth = dwidth
         self.dwidth_padded = get_next_power(2 * self.dwidth, powers=self.powers)
-        self.sino_padded_shape = (n_angles, self.dwidth_padded)
+        self.sino_padded_shape = self.sino_shape[:-1] + (self.dwidth_padded,)
         sino_f_shape = list(self.sino_padded_shape)
         sino_f_shape[-1] = sino_f_shape[-1] // 2 + 1
         self.sino_f_shape = tuple(sino_f_shape)
@@ -133,10 +133,11 @@ class SinoFilter(OpenclProcessing):
             print("The gpyfft module was not found. The Fourier transforms "
                   "will be done on CPU. For more performances, it is advised "
                   "to install gpyfft.""")
-            self.fft = NPFFT(
-                template=np.zeros(self.sino_padded_shape, "f"),
-                axes=(-1,),
-            )
+            # Use the fastest of the FFT backends running on the host
+            template = np.zeros(self.sino_padded_shape, "f")
+            backend = get_fastest_backend(template=template, axes=(-1,),
+                                          backends=("numpy", "fftw"))
+            self.fft = FFT(template=template, axes=(-1,), backend=backend)
 
     def _allocate_memory(self):
         self.d_filter_f = parray.zeros(self.queue, (self.sino_f_shape[-1],), np.complex64)
@@ -194,7 +195,9 @@ class SinoFilter(OpenclProcessing):
 
     def _init_kernels(self):
         OpenclProcessing.compile_kernels(self, self.kernel_files)
-        h, w = self.d_sino_f.shape
+        # A stack of sinograms is filtered as one tall sinogram
+        w = self.d_sino_f.shape[-1]
+        h = self.d_sino_f.size // w
         self.mult_kern_args = (self.queue, (int(w), (int(h))), None,
                                self.d_sino_f.data,
                                self.d_filter_f.data,
@@ -221,12 +224,16 @@ class SinoFilter(OpenclProcessing):
         :param dst_offset:
         :param src_offset:
         """
+        if len(transfer_shape) == 3:
+            # Stack of sinograms: copy all the rows at once
+            transfer_shape = (transfer_shape[0] * transfer_shape[1],
+                              transfer_shape[2])
         shape = tuple(int(i) for i in transfer_shape[::-1])
         ev = self.kernels.cpy2d(self.queue, shape, None,
                                 dst.data,
                                 src.data,
-                                np.int32(dst.shape[1]),
-                                np.int32(src.shape[1]),
+                                np.int32(dst.shape[-1]),
+                                np.int32(src.shape[-1]),
                                 np.int32(dst_offset),
                                 np.int32(src_offset),
                                 np.int32(transfer_shape[::-1]))
@@ -242,10 +249,10 @@ class SinoFilter(OpenclProcessing):
         :param dst_offset:
         :param src_offset:
         """
-        s = transfer_shape
+        s = transfer_shape[-2:]
         do = dst_offset
         so = src_offset
-        dst[do[0]:do[0] + s[0], do[1]:do[1] + s[1]] = src[so[0]:so[0] + s[0], so[1]:so[1] + s[1]]
+        dst[..., do[0]:do[0] + s[0], do[1]:do[1] + s[1]] = src[..., so[0]:so[0] + s[0], so[1]:so[1] + s[1]]
 
     def _prepare_input_sino(self, sino):
         """
@@ -40,6 +40,8 @@ from . import test_kahan
 from . import test_stats
 from . import test_convolution
 from . import test_sparse
+from . import test_processing
+from . import test_volume
 
 
 def suite():
@@ -56,6 +58,8 @@ def suite():
     test_suite.addTests(test_stats.suite())
     test_suite.addTests(test_convolution.suite())
     test_suite.addTests(test_sparse.suite())
+    test_suite.addTests(test_processing.suite())
+    test_suite.addTests(test_volume.suite())
     # Allow to remove sift from the project
     test_base_dir = os.path.dirname(__file__)
     sift_dir = os.path.join(test_base_dir, "..", "sift")
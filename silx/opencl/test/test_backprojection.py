@@ -44,6 +44,7 @@ except ImportError:
     mako = None
 from ..common import ocl
 if ocl:
+    import pyopencl.array as parray
     from .. import backprojection
     from ...image.tomography import compute_fourier_filter
 from silx.test.utils import utilstest
@@ -216,7 +217,34 @@ class TestFBP(unittest.TestCase):
             "Something wrong with FBP on odd-sized sinogram"
         )
 
+    @unittest.skipUnless(ocl and mako, "pyopencl is missing")
+    def test_fbp_stack(self):
+        """
+        Test the FBP of a stack of sinograms
+        """
+        sinos = np.array([self.sino, 2 * self.sino, -self.sino])
+        B = backprojection.Backprojection(self.sino.shape,
+                                          slice_shape=(500, 480))
+        ref = np.array([B.filtered_backprojection(sino) for sino in sinos])
+        if B._use_textures:
+            # Stacks are processed without textures
+            tol = 5e-2 * np.abs(ref).max()
+        else:
+            tol = 1e-6 * np.abs(ref).max()
+
+        # Numpy input and output, with a partial last batch
+        res = B.filtered_backprojection_stack(sinos, batch_size=2)
+        self.assertEqual(res.shape, (3, 500, 480))
+        self.assertLess(np.max(np.abs(res - ref)), tol)
+
+        # pyopencl input and output
+        d_sinos = parray.to_device(B.queue, sinos)
+        d_res = parray.zeros(B.queue, ref.shape, np.float32)
+        B.filtered_backprojection_stack(d_sinos, output=d_res)
+        self.assertLess(np.max(np.abs(d_res.get() - ref)), tol)
 
+        with self.assertRaises(ValueError):
+            B.filtered_backprojection_stack(self.sino)
 
 
 def suite():
@@ -224,6 +252,7 @@ def suite():
     testSuite.addTest(TestFBP("test_fbp"))
     testSuite.addTest(TestFBP("test_fbp_filters"))
     testSuite.addTest(TestFBP("test_fbp_oddsize"))
+    testSuite.addTest(TestFBP("test_fbp_stack"))
     return testSuite
 
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ###########################################################################*/
+"""Test of the processing module"""
+
+__authors__ = ["T. Vincent"]
+__license__ = "MIT"
+__date__ = "16/10/2026"
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from silx import config
+from ..common import ocl
+if ocl:
+    import pyopencl.array
+    from .. import processing
+
+
+if ocl:
+    class Addition(processing.OpenclProcessing):
+        """Minimal processing adding two arrays"""
+
+        kernel_files = ["addition.cl"]
+
+        def __init__(self, ctx=None):
+            processing.OpenclProcessing.__init__(self, ctx=ctx)
+            self.compile_kernels()
+
+        def add(self, a, b):
+            d_a = pyopencl.array.to_device(self.queue, a)
+            d_b = pyopencl.array.to_device(self.queue, b)
+            d_result = pyopencl.array.empty_like(d_a)
+            self.kernels.addition(self.queue, a.shape, None,
+                                  d_a.data, d_b.data, d_result.data,
+                                  numpy.int32(a.size))
+            return d_result.get()
+
+
+@unittest.skipUnless(ocl, "PyOpenCl is missing")
+class TestProgramCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = ocl.create_context()
+
+    @classmethod
+    def tearDownClass(cls):
+        processing.program_cache.clear()
+        cls.ctx = None
+
+    def setUp(self):
+        processing.program_cache.clear()
+        self.a = numpy.arange(16, dtype=numpy.float32)
+        self.b = numpy.ones(16, dtype=numpy.float32)
+
+    def testSharedProgram(self):
+        first = Addition(ctx=self.ctx)
+        second = Addition(ctx=self.ctx)
+        self.assertIs(first.program, second.program)
+        self.assertIsNot(first.kernels.addition, second.kernels.addition)
+        self.assertEqual(len(processing.program_cache), 1)
+        numpy.testing.assert_array_equal(second.add(self.a, self.b),
+                                         self.a + self.b)
+
+    def testCompileOptions(self):
+        first = Addition(ctx=self.ctx)
+        second = Addition(ctx=self.ctx)
+        second.compile_kernels(compile_options="-DDUMMY=1")
+        self.assertIsNot(first.program, second.program)
+        self.assertEqual(len(processing.program_cache), 2)
+
+    def testBinaryCache(self):
+        tmpdir = tempfile.mkdtemp()
+        cache_dir = os.path.join(tmpdir, "programs")
+        previous = config.DEFAULT_OPENCL_PROGRAM_CACHE_DIR
+        config.DEFAULT_OPENCL_PROGRAM_CACHE_DIR = cache_dir
+        try:
+            Addition(ctx=self.ctx)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            processing.program_cache.clear()
+            # Built from the stored binary
+            processing_ = Addition(ctx=self.ctx)
+            numpy.testing.assert_array_equal(processing_.add(self.a, self.b),
+                                             self.a + self.b)
+        finally:
+            config.DEFAULT_OPENCL_PROGRAM_CACHE_DIR = previous
+            shutil.rmtree(tmpdir)
+
+
+@unittest.skipUnless(ocl, "PyOpenCl is missing")
+class TestMemoryPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ctx = ocl.create_context()
+        cls.queue = pyopencl.CommandQueue(cls.ctx)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.ctx = None
+        cls.queue = None
+
+    def testSizeClass(self):
+        size_class = processing.MemoryPool.size_class
+        self.assertEqual(size_class(1000), 1024)
+        self.assertEqual(size_class(1025), 1280)
+        self.assertEqual(size_class(1536), 1536)
+        for size in (1, 7, 100, 3000, 12345678):
+            self.assertGreaterEqual(size_class(size), size)
+            self.assertLessEqual(size_class(size), size * 1.25 + 1)
+
+    def testBufferReuse(self):
+        pool = processing.MemoryPool(self.ctx)
+        first = pool.allocate(1000)
+        self.assertEqual(pool.active_size, 1024)
+        self.assertTrue(pool.free(first))
+        self.assertEqual(pool.active_size, 0)
+        self.assertEqual(pool.held_size, 1024)
+        second = pool.allocate(1010)
+        self.assertIs(first, second)
+        self.assertEqual(pool.held_size, 0)
+        self.assertFalse(pool.free(pyopencl.Buffer(
+            self.ctx, pyopencl.mem_flags.READ_WRITE, 16)))
+
+    def testHighWaterMark(self):
+        pool = processing.MemoryPool(self.ctx)
+        arrays = [pool.allocate_array(self.queue, (16, 16), numpy.float32)
+                  for _ in range(3)]
+        for array in arrays:
+            pool.free(array)
+        self.assertEqual(pool.high_water_mark, 3 * 1024)
+        pool.reset_high_water_mark()
+        self.assertEqual(pool.high_water_mark, 0)
+
+    def testTrim(self):
+        pool = processing.MemoryPool(self.ctx, max_held_size=2048)
+        buffers = [pool.allocate(1024) for _ in range(4)]
+        for buffer_ in buffers:
+            pool.free(buffer_)
+        self.assertEqual(pool.held_size, 2048)
+        # The last released buffers are kept
+        self.assertIs(pool.allocate(1024), buffers[-1])
+        pool.trim(0)
+        self.assertEqual(pool.held_size, 0)
+
+    def testOpenclProcessing(self):
+        previous = config.DEFAULT_OPENCL_MEMORY_POOL
+        config.DEFAULT_OPENCL_MEMORY_POOL = True
+        try:
+            first = Addition(ctx=self.ctx)
+            pool = first.memory_pool
+            self.assertIs(pool, processing.get_memory_pool(self.ctx))
+            pool.trim(0)
+            first.allocate_buffers(use_array=True)
+            output = first.cl_mem["output"]
+            self.assertEqual(pool.active_size, 40)
+            first.free_buffers()
+            self.assertEqual(pool.active_size, 0)
+
+            second = Addition(ctx=self.ctx)
+            second.allocate_buffers(use_array=True)
+            self.assertIs(second.cl_mem["output"].base_data,
+                          output.base_data)
+            second.free_buffers()
+        finally:
+            config.DEFAULT_OPENCL_MEMORY_POOL = previous
+
+
+def suite():
+    test_suite = unittest.TestSuite()
+    loadTests = unittest.defaultTestLoader.loadTestsFromTestCase
+    test_suite.addTest(loadTests(TestProgramCache))
+    test_suite.addTest(loadTests(TestMemoryPool))
+    return test_suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest="suite")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ###########################################################################*/
+"""Test of the volume reconstruction module"""
+
+__authors__ = ["T. Vincent"]
+__license__ = "MIT"
+__date__ = "16/10/2026"
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import h5py
+import numpy
+
+try:
+    import mako
+except ImportError:
+    mako = None
+from ..common import ocl
+if ocl:
+    from .. import volume
+
+
+@unittest.skipUnless(ocl and mako, "PyOpenCl is missing")
+class TestVolumeReconstruction(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, "volume.h5")
+        # Projections of shape (n_angles, n_rows, n_bins)
+        self.projections = numpy.random.random((90, 7, 64)).astype(numpy.float32)
+        # Keep a small memory to have several chunks of rows
+        self.fbp = volume.VolumeReconstruction(
+            self.projections.shape, max_memory=3 * 4 * 2 * (90 * 64 + 64 * 64))
+        self.assertEqual(self.fbp.rows_per_chunk, 2)
+
+    def tearDown(self):
+        self.fbp = None
+        shutil.rmtree(self.tmpdir)
+
+    def reference(self, start=0, stop=None):
+        backprojector = self.fbp.backprojector
+        return numpy.array([
+            backprojector.filtered_backprojection_stack(
+                numpy.ascontiguousarray(self.projections[:, row:row + 1]
+                                        .transpose(1, 0, 2)))[0]
+            for row in range(self.projections.shape[1])[start:stop]])
+
+    def testHdf5(self):
+        with h5py.File(self.filename, "w") as h5file:
+            projections = h5file.create_dataset(
+                "projections", data=self.projections, chunks=(8, 7, 64))
+            output = h5file.create_dataset(
+                "volume", shape=self.fbp.get_volume_shape(), dtype="float32")
+            result = self.fbp.reconstruct(projections, output=output)
+            self.assertIs(result, output)
+            numpy.testing.assert_allclose(
+                output[()], self.reference(), rtol=1e-5, atol=1e-6)
+
+    def testRange(self):
+        self.assertEqual(self.fbp.get_volume_shape(1, 6), (5, 64, 64))
+        result = self.fbp(self.projections, start=1, stop=6)
+        numpy.testing.assert_allclose(
+            result, self.reference(1, 6), rtol=1e-5, atol=1e-6)
+
+    def testErrors(self):
+        with self.assertRaises(ValueError):
+            self.fbp.reconstruct(self.projections[:, :3])
+        with self.assertRaises(ValueError):
+            self.fbp.reconstruct(self.projections,
+                                 output=numpy.empty((7, 32, 32), numpy.float32))
+
+        # Error raised in the writer thread
+        with h5py.File(self.filename, "w") as h5file:
+            output = h5file.create_dataset(
+                "volume", shape=self.fbp.get_volume_shape(), dtype="float32")
+        with h5py.File(self.filename, "r") as h5file:
+            with self.assertRaises(Exception):
+                self.fbp.reconstruct(self.projections, output=h5file["volume"])
+
+
+def suite():
+    test_suite = unittest.TestSuite()
+    loadTests = unittest.defaultTestLoader.loadTestsFromTestCase
+    test_suite.addTest(loadTests(TestVolumeReconstruction))
+    return test_suite
+
+
+if __name__ == '__main__':
+    unittest.main(defaultTest="suite")
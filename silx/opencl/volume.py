@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# coding: utf-8
+# /*##########################################################################
+#
+# Copyright (c) 2026 European Synchrotron Radiation Facility
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+# ###########################################################################*/
+"""Module for the filtered backprojection of a volume stored in a file.
+
+Projections are read by chunks of detector rows, so that volumes larger
+than the memory can be reconstructed, for instance from HDF5 datasets:
+
+.. code-block:: python
+
+    import h5py
+    from silx.opencl.volume import VolumeReconstruction
+
+    with h5py.File("scan.h5", "r") as fin, h5py.File("rec.h5", "w") as fout:
+        projections = fin["entry/data/data"]
+        fbp = VolumeReconstruction(projections.shape)
+        volume = fout.create_dataset(
+            "volume", shape=fbp.get_volume_shape(), dtype="float32")
+        fbp.reconstruct(projections, output=volume)
+"""
+
+__authors__ = ["T. Vincent"]
+__license__ = "MIT"
+__date__ = "16/10/2026"
+
+import logging
+import queue
+import threading
+
+import numpy
+
+from .backprojection import Backprojection
+
+logger = logging.getLogger(__name__)
+
+
+class _Pipe(object):
+    """Bounded queue between two stages of a pipeline, which can be aborted.
+
+    :param threading.Event abort: Event set when the pipeline is aborted
+    :param int maxsize: Maximum number of items in the queue
+    """
+
+    def __init__(self, abort, maxsize=1):
+        self._abort = abort
+        self._queue = queue.Queue(maxsize=maxsize)
+
+    def put(self, item):
+        """Put an item in the queue, waiting for a free slot.
+
+        :return: False if the pipeline was aborted, True otherwise
+        :rtype: bool
+        """
+        while not self._abort.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def get(self):
+        """Returns the next item of the queue, waiting for it.
+
+        :return: The item or None if the pipeline was aborted
+        """
+        while not self._abort.is_set():
+            try:
+                return self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+
+class VolumeReconstruction(object):
+    """Filtered backprojection (FBP) of a volume from a stack of projections.
+
+    Reconstruction is done by chunks of detector rows with 3 concurrent
+    stages:
+
+    - A thread reads the projections of the chunk and builds its sinograms,
+    - The sinograms are filtered and backprojected with
+      :meth:`Backprojection.filtered_backprojection_stack`,
+    - A thread writes the reconstructed slices.
+
+    At most 3 chunks of sinograms and 3 chunks of slices are in memory at the
+    same time, which is bounded by `max_memory`.
+
+    :param projections_shape: Shape of the stack of projections in the
+        format (n_a, n_z, n_b) where n_a is the number of angles, n_z the
+        number of detector rows and n_b the number of detector bins.
+    :param slice_shape: Optional, shape of the reconstructed slices.
+        Default: (n_b, n_b).
+    :param axis_position: Optional, axis position. Default is `(n_b-1)/2.0`.
+    :param angles: Optional, a list of custom angles in radian.
+    :param filter_name: Optional, name of the filter for FBP.
+        Default is the Ram-Lak filter.
+    :param int max_memory: Maximum size in bytes of the host memory used
+        for sinograms and slices. Default: 1 GiB.
+    :param ctx: actual working context, left to None for automatic
+                initialization from device type or platformid/deviceid
+    :param devicetype: type of device, can be "CPU", "GPU", "ACC" or "ALL"
+    :param platformid: integer with the platform_identifier, as given by clinfo
+    :param deviceid: Integer with the device identifier, as given by clinfo
+    :param profile: switch on profiling to be able to profile at the kernel
+                    level, store profiling elements (makes code slightly
+                    slower)
+    :param extra_options: Advanced extra options of :class:`Backprojection`.
+    """
+
+    DEFAULT_MAX_MEMORY = 1024 ** 3
+    """Default maximum size in bytes of host memory used for the processing"""
+
+    _READ_BLOCK_SIZE = 64 * 1024 ** 2
+    """Size in bytes of the blocks of projections read at once"""
+
+    def __init__(self, projections_shape, slice_shape=None, axis_position=None,
+                 angles=None, filter_name=None, max_memory=None, ctx=None,
+                 devicetype="all", platformid=None, deviceid=None,
+                 profile=False, extra_options=None):
+        if len(projections_shape) != 3:
+            raise ValueError("Expected projections of shape (n_a, n_z, n_b)")
+        self.projections_shape = tuple(int(dim) for dim in projections_shape)
+        n_angles, n_rows, n_bins = self.projections_shape
+
+        self.backprojector = Backprojection(
+            (n_angles, n_bins),
+            slice_shape=slice_shape,
+            axis_position=axis_position,
+            angles=angles,
+            filter_name=filter_name,
+            ctx=ctx,
+            devicetype=devicetype,
+            platformid=platformid,
+            deviceid=deviceid,
+            profile=profile,
+            extra_options=extra_options,
+        )
+        self.slice_shape = tuple(int(dim) for dim in self.backprojector.slice_shape)
+
+        if max_memory is None:
+            max_memory = self.DEFAULT_MAX_MEMORY
+        row_size = numpy.dtype(numpy.float32).itemsize * (
+            n_angles * n_bins + self.slice_shape[0] * self.slice_shape[1])
+        self.rows_per_chunk = int(max(1, min(n_rows, max_memory // (3 * row_size))))
+        """Number of detector rows reconstructed at once"""
+
+    def get_volume_shape(self, start=0, stop=None):
+        """Returns the shape of the reconstructed volume.
+
+        :param int start: Index of the first detector row to reconstruct
+        :param int stop: Index after the last detector row to reconstruct.
+            Default: All rows.
+        :rtype: tuple
+        """
+        start, stop, _ = slice(start, stop).indices(self.projections_shape[1])
+        return (max(0, stop - start),) + self.slice_shape
+
+    def _read_sinograms(self, projections, start, stop):
+        """Read the sinograms of a range of detector rows.
+
+        :param projections: Stack of projections
+        :param int start: Index of the first detector row
+        :param int stop: Index after the last detector row
+        :return: Sinograms of shape (stop - start, n_a, n_b)
+        :rtype: numpy.ndarray
+        """
+        n_angles, _, n_bins = self.projections_shape
+        sinograms = numpy.empty((stop - start, n_angles, n_bins),
+                                dtype=numpy.float32)
+
+        # Read blocks of projections aligned on the dataset chunks
+        block_size = projections.dtype.itemsize * (stop - start) * n_bins
+        n_read = max(1, self._READ_BLOCK_SIZE // block_size)
+        chunks = getattr(projections, "chunks", None)
+        if chunks:
+            n_read = max(1, n_read // chunks[0]) * chunks[0]
+
+        for index in range(0, n_angles, n_read):
+            block = projections[index:index + n_read, start:stop, :]
+            sinograms[:, index:index + n_read, :] = numpy.transpose(block, (1, 0, 2))
+        return sinograms
+
+    def reconstruct(self, projections, output=None, start=0, stop=None):
+        """Reconstruct a range of slices of the volume.
+
+        :param projections: Stack of projections of shape (n_a, n_z, n_b),
+            e.g., a :class:`h5py.Dataset` or a :class:`numpy.ndarray`.
+        :param output: Array where to write the slices, e.g., a
+            :class:`h5py.Dataset`, with the shape given by
+            :meth:`get_volume_shape`.
+            If nothing is provided, a new numpy array is returned.
+        :param int start: Index of the first detector row to reconstruct
+        :param int stop: Index after the last detector row to reconstruct.
+            Default: All rows.
+        :return: The reconstructed volume
+        :raises ValueError: If projections or output have a wrong shape
+        """
+        if tuple(projections.shape) != self.projections_shape:
+            raise ValueError("Expected projections of shape %s, got %s" %
+                             (self.projections_shape, projections.shape))
+        volume_shape = self.get_volume_shape(start, stop)
+        if output is None:
+            output = numpy.empty(volume_shape, dtype=numpy.float32)
+        elif tuple(output.shape) != volume_shape:
+            raise ValueError("Expected output of shape %s, got %s" %
+                             (volume_shape, output.shape))
+        start = slice(start, stop).indices(self.projections_shape[1])[0]
+        stop = start + volume_shape[0]
+        chunks = [(index, min(index + self.rows_per_chunk, stop))
+                  for index in range(start, stop, self.rows_per_chunk)]
+
+        abort = threading.Event()
+        sinograms_pipe = _Pipe(abort)
+        slices_pipe = _Pipe(abort)
+        errors = []
+
+        def read():
+            try:
+                for chunk_start, chunk_stop in chunks:
+                    sinograms = self._read_sinograms(
+                        projections, chunk_start, chunk_stop)
+                    if not sinograms_pipe.put((chunk_start, sinograms)):
+                        return
+                sinograms_pipe.put(None)
+            except BaseException as e:
+                errors.append(e)
+                abort.set()
+
+        def write():
+            try:
+                while True:
+                    item = slices_pipe.get()
+                    if item is None:
+                        return
+                    chunk_start, slices = item
+                    index = chunk_start - start
+                    output[index:index + len(slices)] = slices
+            except BaseException as e:
+                errors.append(e)
+                abort.set()
+
+        reader = threading.Thread(target=read, name="VolumeReconstruction reader")
+        writer = threading.Thread(target=write, name="VolumeReconstruction writer")
+        reader.daemon = True
+        writer.daemon = True
+        reader.start()
+        writer.start()
+        try:
+            while True:
+                item = sinograms_pipe.get()
+                if item is None:
+                    break
+                chunk_start, sinograms = item
+                logger.debug("Reconstruct rows %d to %d",
+                             chunk_start, chunk_start + len(sinograms))
+                slices = self.backprojector.filtered_backprojection_stack(
+                    sinograms)
+                if not slices_pipe.put((chunk_start, slices)):
+                    break
+            slices_pipe.put(None)
+            writer.join()
+        except BaseException:
+            abort.set()
+            raise
+        finally:
+            reader.join()
+            writer.join()
+
+        if errors:
+            raise errors[0]
+        return output
+
+    __call__ = reconstruct
@@ -137,6 +137,9 @@ static float linear_interpolation(float2 vals,
  *
  *  Same kernel as backproj_kernel, but targets the CPU (no texture)
  *
+ *  When launched with a 3D ndrange, the third dimension indexes a stack of
+ *  sinograms (n_z, num_proj, num_bins) backprojected into a stack of slices.
+ *
 **/
 kernel void backproj_cpu_kernel(
     int num_proj,
@@ -155,6 +158,7 @@ kernel void backproj_cpu_kernel(
     const int bidx = get_group_id(0); //blockIdx.x;
     const int tidy = get_local_id(1); //threadIdx.y;
     const int bidy = get_group_id(1); //blockIdx.y;
+    const size_t bidz = get_group_id(2); // slice index (0 for a 2D ndrange)
 
     local float sh_cos[256];
     local float sh_sin[256];
@@ -170,6 +174,9 @@ kernel void backproj_cpu_kernel(
     const float bx00 = (32 * bidx + 2 * tidx + 0 + apos_off_x  ) ;
     const float by00 = (32 * bidy + 2 * tidy + 0 + apos_off_y  ) ;
 
+    d_sino += bidz * num_proj * num_bins;
+    d_SLICE += bidz * 32 * get_num_groups(0) * 32 * get_num_groups(1);
+
     int read=0;
     for(int proj=0; proj<num_proj; proj++) {
         if(proj>=read) {
@@ -49,6 +49,8 @@ Functions:
 
 from __future__ import absolute_import, print_function, division
 
+import collections
+import itertools
 import sys
 
 import numpy
@@ -60,6 +62,11 @@ __license__ = "MIT"
 __date__ = "26/04/2017"
 
 
+CHUNK_CACHE_SIZE = 64 * 1024 ** 2
+"""Maximum size in bytes of the chunks cached by a :class:`DatasetView`
+and its transposed views"""
+
+
 def is_array(obj):
     """Return True if object implements necessary attributes to be
     considered similar to a numpy array.
@@ -387,12 +394,19 @@ class ListOfImages(object):
                                    axes=output_dimensions)
         # muliple list elements selected
         else:
-            # apply selection first
-            output_stack = []
-            for img in images_selection:
-                output_stack.append(img[array_idx])
-            # then cast into a numpy array, and transpose
-            return numpy.transpose(numpy.array(output_stack),
+            # apply selection first, directly into the output array
+            output_stack = None
+            for index, img in enumerate(images_selection):
+                selection = img[array_idx]
+                if output_stack is None:
+                    output_stack = numpy.empty(
+                        (len(images_selection), ) + numpy.shape(selection),
+                        dtype=self.dtype)
+                output_stack[index] = selection
+            if output_stack is None:
+                output_stack = numpy.array([], dtype=self.dtype)
+            # then transpose
+            return numpy.transpose(output_stack,
                                    axes=output_dimensions)
 
     def min(self):
@@ -416,6 +430,40 @@ class ListOfImages(object):
         return max_value
 
 
+class _ChunkCache(object):
+    """Least recently used chunks of a dataset, up to a size in bytes.
+
+    :param int max_size: Maximum size of the cached chunks in bytes
+    """
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.__chunks = collections.OrderedDict()
+        self.__size = 0
+
+    def get(self, dataset, origin):
+        """Returns a chunk of the dataset, read only once while it is cached.
+
+        :param dataset: h5py dataset
+        :param tuple origin: Index of the first element of the chunk
+        :rtype: numpy.ndarray
+        """
+        chunk = self.__chunks.pop(origin, None)
+        if chunk is None:
+            selection = tuple(
+                slice(start, min(start + chunk_size, dim_size))
+                for start, chunk_size, dim_size
+                in zip(origin, dataset.chunks, dataset.shape))
+            chunk = dataset[selection]
+            self.__size += chunk.nbytes
+        # The most recently used chunk is the last one
+        self.__chunks[origin] = chunk
+
+        while self.__size > self.max_size and len(self.__chunks) > 1:
+            _, old_chunk = self.__chunks.popitem(last=False)
+            self.__size -= old_chunk.nbytes
+        return chunk
+
+
 class DatasetView(object):
     """This class provides a way to transpose a dataset without
     casting it into a numpy array. This way, the dataset in a file need not
@@ -428,6 +476,10 @@ class DatasetView(object):
         in an unfavorable direction may still require the entire dataset to
         be read from disk.
 
+        For chunked datasets, transposed slices are read chunk by chunk and
+        the last read chunks (up to :data:`CHUNK_CACHE_SIZE` bytes) are kept
+        for the next requests, e.g. to display successive frames.
+
     :param dataset: h5py dataset
     :param transposition: List of dimensions sorted in the order of
         transposition (relative to the original h5py dataset)
@@ -472,6 +524,10 @@ class DatasetView(object):
             self.transposition = transposition
             self.__sort_shape()
 
+        self.__chunk_cache = None
+        if getattr(dataset, "chunks", None) is not None:
+            self.__chunk_cache = _ChunkCache(CHUNK_CACHE_SIZE)
+
     def __sort_shape(self):
         """Sort shape in the order defined in :attr:`transposition`
         """
@@ -526,14 +582,18 @@ class DatasetView(object):
         # get list of indices sorted in the original dataset order
         sorted_indices = self.__sort_indices(item)
 
-        output_data_not_transposed = self.dataset[sorted_indices]
+        output_data_not_transposed = None
+        if self.__chunk_cache is not None:
+            output_data_not_transposed = self.__read_by_chunks(sorted_indices)
+        if output_data_not_transposed is None:
+            output_data_not_transposed = self.dataset[sorted_indices]
 
         # now we must transpose the output data
         output_dimensions = []
         frozen_dimensions = []
         for i, idx in enumerate(item):
             # slices and sequences
-            if not isinstance(idx, int):
+            if not isinstance(idx, numbers.Integral):
                 output_dimensions.append(self.transposition[i])
             # regular integer index
             else:
@@ -553,6 +613,79 @@ class DatasetView(object):
         return numpy.transpose(output_data_not_transposed,
                                axes=output_dimensions)
 
+    def __read_by_chunks(self, indices):
+        """Read a selection of the dataset, reading each chunk only once.
+
+        :param tuple indices: Integers and slices, in the order of
+            the original dataset
+        :return: The selected data, or None if the selection is not supported
+        :rtype: Union[numpy.ndarray,None]
+        """
+        # Selection as (start, step, count) in each dimension
+        ranges = []
+        # Dimensions selected with a negative step are read in reverse order
+        flips = []
+        for idx, dim_size in zip(indices, self.dataset.shape):
+            if isinstance(idx, numbers.Integral):
+                idx = int(idx)
+                if idx < 0:
+                    idx += dim_size
+                if not 0 <= idx < dim_size:
+                    raise IndexError("Index (%d) out of range (0-%d)" %
+                                     (idx, dim_size - 1))
+                ranges.append((idx, 1, 1))
+                flips.append(slice(None))
+            elif isinstance(idx, slice):
+                start, stop, step = idx.indices(dim_size)
+                count = len(range(start, stop, step))
+                if step < 0:
+                    start, step = start + (count - 1) * step, -step
+                    flips.append(slice(None, None, -1))
+                else:
+                    flips.append(slice(None))
+                ranges.append((start, step, count))
+            else:
+                return None
+
+        output = numpy.empty([count for _, _, count in ranges],
+                             dtype=self.dtype)
+        # Remove the dimensions indexed by an integer
+        squeeze = tuple(0 if isinstance(idx, numbers.Integral) else flip
+                        for idx, flip in zip(indices, flips))
+        if output.size == 0:
+            return output[squeeze]
+
+        # Chunks containing the first and the last selected elements
+        chunk_ranges = []
+        for (start, step, count), chunk_size in zip(ranges, self.dataset.chunks):
+            last = start + (count - 1) * step
+            chunk_ranges.append(range(start // chunk_size,
+                                      last // chunk_size + 1))
+
+        for chunk_index in itertools.product(*chunk_ranges):
+            output_selection = []
+            chunk_selection = []
+            origin = []
+            for index, (start, step, count), chunk_size, dim_size in zip(
+                    chunk_index, ranges, self.dataset.chunks, self.dataset.shape):
+                chunk_start = index * chunk_size
+                chunk_stop = min(chunk_start + chunk_size, dim_size)
+                # Selected elements within this chunk
+                first = max(0, -(-(chunk_start - start) // step))
+                stop = min(count, -(-(chunk_stop - start) // step))
+                if first >= stop:
+                    break
+                output_selection.append(slice(first, stop))
+                chunk_selection.append(
+                    slice(start + first * step - chunk_start,
+                          start + (stop - 1) * step - chunk_start + 1,
+                          step))
+                origin.append(chunk_start)
+            else:
+                chunk = self.__chunk_cache.get(self.dataset, tuple(origin))
+                output[tuple(output_selection)] = chunk[tuple(chunk_selection)]
+        return output[squeeze]
+
     def __array__(self, dtype=None):
         """Cast the dataset into a numpy array, and return it.
 
@@ -584,8 +717,10 @@ class DatasetView(object):
         elif list(self.transposition) != list(range(self.ndim)):
             transposition = [self.transposition[i] for i in transposition]
 
-        return DatasetView(self.dataset,
-                           transposition)
+        view = DatasetView(self.dataset, transposition)
+        # Share the chunks already read
+        view.__chunk_cache = self.__chunk_cache
+        return view
 
     @property
     def T(self):
@@ -203,6 +203,32 @@ class TestTransposedDatasetView(unittest.TestCase):
                                           b[1]))
 
 
+class TestTransposedChunkedDatasetView(TestTransposedDatasetView):
+    """Same tests with a chunked dataset, read chunk by chunk"""
+
+    def setUp(self):
+        TestTransposedDatasetView.setUp(self)
+        self.h5f.close()
+        with h5py.File(self.h5_fname, "w") as f:
+            f.create_dataset("volume", data=self.volume, chunks=(2, 3, 7))
+        self.h5f = h5py.File(self.h5_fname, "r")
+
+    def testSteps(self):
+        a = DatasetView(self.h5f["volume"], transposition=(2, 0, 1))
+        b = self.volume.transpose(2, 0, 1)
+        for selection in [(slice(None, None, 8), slice(1, 5, 3), -1),
+                          (slice(3, 3), 1, slice(None)),
+                          (slice(None, None, -1), 1, 2)]:
+            self.assertTrue(numpy.array_equal(a[selection], b[selection]))
+
+    def testSharedChunkCache(self):
+        a = DatasetView(self.h5f["volume"])
+        b = a.transpose((2, 1, 0))
+        self.assertTrue(numpy.array_equal(b[3], self.volume[:, :, 3].T))
+        self.assertTrue(numpy.array_equal(b.transpose((1, 0, 2))[4, 6, :],
+                                          self.volume[:, 4, 6]))
+
+
 class TestTransposedListOfImages(unittest.TestCase):
     def setUp(self):
         # images attributes
@@ -434,6 +460,8 @@ def suite():
     test_suite = unittest.TestSuite()
     test_suite.addTest(
         unittest.defaultTestLoader.loadTestsFromTestCase(TestTransposedDatasetView))
+    test_suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(TestTransposedChunkedDatasetView))
     test_suite.addTest(
         unittest.defaultTestLoader.loadTestsFromTestCase(TestTransposedListOfImages))
     test_suite.addTest(